@@ -0,0 +1,122 @@
+from Proyecto_Final_SO.Comunicacion_Sincronizacion.metricas import ContentionStats, current_time
+from collections import deque
+
+
+class Condition:
+
+    def __init__(self, name, mutex):
+
+        self.name = name
+        self.mutex = mutex  # Mutex asociado (semántica Mesa)
+        self.waiting_queue = deque()
+        self.waiting_pids = set()  # Fuente de verdad; la deque guarda el orden
+        self.scheduler = None  # Planificador cuyos procesos terminados se olvidan
+
+        # Estadísticas
+        self.total_waits = 0
+        self.total_notifies = 0
+        self.metrics = ContentionStats()
+
+    def wait(self, process, scheduler):
+
+        # Solo el dueño del mutex puede esperar en la condición
+        if self.mutex.owner != process:
+            return False
+
+        if process.pid in self.waiting_pids:
+            return False
+
+        # Liberar el mutex (puede despertar a otro) y bloquear
+        self.mutex.release(process, scheduler)
+        scheduler.block_process(
+            process.pid,
+            f"Esperando condición '{self.name}'"
+        )
+        self.waiting_queue.append(process)
+        self.waiting_pids.add(process.pid)
+        self.metrics.start_wait(process.pid, current_time(scheduler))
+        self.total_waits += 1
+        self._watch(scheduler)
+
+        # Al despertar, el proceso tendrá el mutex y debe revisar de nuevo su predicado
+        return True
+
+    def notify(self, scheduler, n=1):
+
+        woken = []
+        while len(woken) < n:
+            process = self._pop_waiter()
+            if process is None:
+                break
+            self.metrics.end_wait(process.pid, current_time(scheduler))
+            self.total_notifies += 1
+
+            # Readquirir el mutex: si está libre se otorga y se desbloquea;
+            # si no, pasa a la cola del mutex sin volver a la cola de listos
+            if self.mutex.acquire(process, scheduler):
+                scheduler.unblock_process(process.pid)
+            woken.append(process)
+
+        return woken
+
+    def notify_all(self, scheduler):
+
+        return self.notify(scheduler, n=len(self.waiting_pids))
+
+    def _pop_waiter(self):
+
+        # Las entradas retiradas con remove_waiter se descartan al salir
+        while self.waiting_queue:
+            process = self.waiting_queue.popleft()
+            if process.pid in self.waiting_pids:
+                self.waiting_pids.discard(process.pid)
+                return process
+        return None
+
+    def remove_waiter(self, process, scheduler=None):
+
+        if process.pid in self.waiting_pids:
+            self.waiting_pids.discard(process.pid)
+            self.metrics.forget(process.pid)
+            return True
+        return False
+
+    def _watch(self, scheduler):
+
+        # Un proceso terminado mientras espera sale de la cola (un hook por
+        # planificador): notify no le entrega el mutex a un proceso terminado
+        self.scheduler = scheduler
+        if self.forget not in scheduler.termination_hooks:
+            scheduler.add_termination_hook(self.forget)
+
+    def forget(self, process):
+
+        self.remove_waiter(process, self.scheduler)
+
+    def get_waiting_count(self):
+
+        return len(self.waiting_pids)
+
+    def get_waiting_processes(self):
+
+        return [p for p in self.waiting_queue if p.pid in self.waiting_pids]
+
+    def get_statistics(self):
+
+        stats = {
+            'Nombre': self.name,
+            'Mutex': self.mutex.name,
+            'En Espera': len(self.waiting_pids),
+            'Total Esperas': self.total_waits,
+            'Total Notificaciones': self.total_notifies
+        }
+        stats.update(self.metrics.get_statistics())
+
+        # La retención corresponde al mutex asociado
+        mutex_stats = self.mutex.metrics.get_statistics()
+        for key in ('Retención Total', 'Retención Promedio', 'Retención Máxima'):
+            stats[key] = mutex_stats[key]
+        return stats
+
+    def __str__(self):
+        return f"Condition('{self.name}', {len(self.waiting_pids)} esperando)"
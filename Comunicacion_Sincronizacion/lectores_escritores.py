@@ -0,0 +1,227 @@
+from Proyecto_Final_SO.Comunicacion_Sincronizacion.metricas import ContentionStats, current_time
+from collections import deque
+
+
+class RWLock:
+
+    def __init__(self, name, writer_preference=False):
+
+        self.name = name
+        self.writer_preference = writer_preference
+
+        self.readers = {}  # {pid: proceso} lectores activos
+        self.writer = None  # Escritor activo
+
+        # Colas de espera separadas por tipo de acceso; los conjuntos de pids
+        # son la fuente de verdad y las deques guardan el orden
+        self.read_queue = deque()
+        self.write_queue = deque()
+        self.read_waiting_pids = set()
+        self.write_waiting_pids = set()
+        self.scheduler = None  # Planificador cuyos procesos terminados se olvidan
+
+        # Estadísticas
+        self.total_read_acquires = 0
+        self.total_write_acquires = 0
+        self.total_blocks = 0
+        self.read_metrics = ContentionStats()
+        self.write_metrics = ContentionStats()
+
+    def acquire_read(self, process, scheduler):
+
+        if self._can_read():
+            self._grant_read(process, scheduler)
+            return True
+
+        if process.pid not in self.read_waiting_pids:
+            scheduler.block_process(
+                process.pid,
+                f"Esperando lectura '{self.name}'"
+            )
+            self.read_queue.append(process)
+            self.read_waiting_pids.add(process.pid)
+            self.read_metrics.start_wait(process.pid, current_time(scheduler))
+            self.total_blocks += 1
+            self._watch(scheduler)
+        return False
+
+    def acquire_write(self, process, scheduler):
+
+        if self.writer is None and not self.readers:
+            self._grant_write(process, scheduler)
+            return True
+
+        if process.pid not in self.write_waiting_pids:
+            scheduler.block_process(
+                process.pid,
+                f"Esperando escritura '{self.name}'"
+            )
+            self.write_queue.append(process)
+            self.write_waiting_pids.add(process.pid)
+            self.write_metrics.start_wait(process.pid, current_time(scheduler))
+            self.total_blocks += 1
+            self._watch(scheduler)
+        return False
+
+    def release_read(self, process, scheduler):
+
+        if process.pid not in self.readers:
+            return False
+
+        del self.readers[process.pid]
+        self.read_metrics.end_hold(process.pid, current_time(scheduler))
+
+        if not self.readers:
+            self._wake_next(scheduler)
+        return True
+
+    def release_write(self, process, scheduler):
+
+        if self.writer != process:
+            return False
+
+        self.writer = None
+        self.write_metrics.end_hold(process.pid, current_time(scheduler))
+        self._wake_next(scheduler)
+        return True
+
+    def _can_read(self):
+
+        if self.writer is not None:
+            return False
+        # Con preferencia de escritores, un escritor en espera frena nuevas lecturas
+        if self.writer_preference and self.write_waiting_pids:
+            return False
+        return True
+
+    def _wake_next(self, scheduler):
+
+        if self.writer is not None or self.readers:
+            return
+
+        # Preferencia de escritores: primero un escritor, si lo hay
+        if self.writer_preference and self.write_waiting_pids:
+            self._wake_writer(scheduler)
+            return
+
+        # Preferencia de lectores: despertar a todos los lectores en lote
+        if self.read_waiting_pids:
+            self._wake_readers(scheduler)
+            return
+
+        if self.write_waiting_pids:
+            self._wake_writer(scheduler)
+
+    def _wake_readers(self, scheduler):
+
+        while True:
+            process = self._pop_waiter(self.read_queue, self.read_waiting_pids)
+            if process is None:
+                break
+            self.read_metrics.end_wait(process.pid, current_time(scheduler))
+            scheduler.unblock_process(process.pid)
+            self._grant_read(process, scheduler)
+
+    def _wake_writer(self, scheduler):
+
+        process = self._pop_waiter(self.write_queue, self.write_waiting_pids)
+        self.write_metrics.end_wait(process.pid, current_time(scheduler))
+        scheduler.unblock_process(process.pid)
+        self._grant_write(process, scheduler)
+
+    def _pop_waiter(self, queue, pids):
+
+        # Las entradas retiradas con remove_waiter se descartan al salir
+        while queue:
+            process = queue.popleft()
+            if process.pid in pids:
+                pids.discard(process.pid)
+                return process
+        return None
+
+    def remove_waiter(self, process, scheduler=None):
+
+        if process.pid in self.read_waiting_pids:
+            self.read_waiting_pids.discard(process.pid)
+            self.read_metrics.forget(process.pid)
+        elif process.pid in self.write_waiting_pids:
+            self.write_waiting_pids.discard(process.pid)
+            self.write_metrics.forget(process.pid)
+        else:
+            return False
+
+        # Con preferencia de escritores, el escritor retirado pudo ser lo único
+        # que frenaba a los lectores en espera
+        if scheduler is not None and self.read_waiting_pids and self._can_read():
+            self._wake_readers(scheduler)
+        return True
+
+    def _watch(self, scheduler):
+
+        # Un proceso terminado mientras espera sale de la cola (un hook por planificador)
+        self.scheduler = scheduler
+        if self.forget not in scheduler.termination_hooks:
+            scheduler.add_termination_hook(self.forget)
+
+    def forget(self, process):
+
+        self.remove_waiter(process, self.scheduler)
+
+    def _grant_read(self, process, scheduler):
+
+        self.readers[process.pid] = process
+        self.total_read_acquires += 1
+        self.read_metrics.start_hold(process.pid, current_time(scheduler))
+
+    def _grant_write(self, process, scheduler):
+
+        self.writer = process
+        self.total_write_acquires += 1
+        self.write_metrics.start_hold(process.pid, current_time(scheduler))
+
+    def get_reader_count(self):
+
+        return len(self.readers)
+
+    def get_waiting_count(self):
+
+        return len(self.read_waiting_pids) + len(self.write_waiting_pids)
+
+    def get_statistics(self):
+
+        read_stats = self.read_metrics.get_statistics()
+        write_stats = self.write_metrics.get_statistics()
+
+        if self.writer:
+            state = 'ESCRITURA'
+        elif self.readers:
+            state = 'LECTURA'
+        else:
+            state = 'LIBRE'
+
+        stats = {
+            'Nombre': self.name,
+            'Estado': state,
+            'Preferencia': 'Escritores' if self.writer_preference else 'Lectores',
+            'Lectores Activos': len(self.readers),
+            'Escritor': f"P{self.writer.pid} ({self.writer.name})" if self.writer else "Ninguno",
+            'Lectores en Espera': len(self.read_waiting_pids),
+            'Escritores en Espera': len(self.write_waiting_pids),
+            'Total Lecturas': self.total_read_acquires,
+            'Total Escrituras': self.total_write_acquires,
+            'Total Bloqueos': self.total_blocks
+        }
+        for key, value in read_stats.items():
+            stats[f"{key} (Lectura)"] = value
+        for key, value in write_stats.items():
+            stats[f"{key} (Escritura)"] = value
+        return stats
+
+    def __str__(self):
+        if self.writer:
+            status = f"WRITE by P{self.writer.pid}"
+        elif self.readers:
+            status = f"READ x{len(self.readers)}"
+        else:
+            status = "FREE"
+        return f"RWLock('{self.name}', {status})"
@@ -1,4 +1,33 @@
 import time
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class SharedMemoryStats:
+    name: str
+    size: int
+    items: int
+    total_writes: int
+    total_reads: int
+
+    @property
+    def is_full(self):
+        return self.items >= self.size
+
+    @property
+    def is_empty(self):
+        return self.items == 0
+
+    def display(self):
+        return {
+            'Nombre': self.name,
+            'Tamaño Total': self.size,
+            'Items Actuales': self.items,
+            'Total Escrituras': self.total_writes,
+            'Total Lecturas': self.total_reads,
+            'Estado': 'LLENO' if self.is_full else ('VACÍO' if self.is_empty else 'PARCIAL')
+        }
+
 
 class SharedMemory:
 
@@ -71,16 +100,15 @@ class SharedMemory:
 
         return self.access_log[-n:] if n > 0 else self.access_log
 
+    def get_stats(self):
+
+        return SharedMemoryStats(self.name, self.size, len(self.buffer),
+                                 self.total_writes, self.total_reads)
+
     def get_statistics(self):
 
-        return {
-            'Nombre': self.name,
-            'Tamaño Total': self.size,
-            'Items Actuales': len(self.buffer),
-            'Total Escrituras': self.total_writes,
-            'Total Lecturas': self.total_reads,
-            'Estado': 'LLENO' if self.is_full() else ('VACÍO' if self.is_empty() else 'PARCIAL')
-        }
+        # Compatibilidad: versión formateada de get_stats()
+        return self.get_stats().display()
 
     def clear(self):
 
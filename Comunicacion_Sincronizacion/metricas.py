@@ -0,0 +1,74 @@
+def current_time(scheduler):
+
+    # Tiempo simulado del scheduler (0 si la operación no recibe scheduler)
+    return scheduler.current_time if scheduler is not None else 0
+
+
+class ContentionStats:
+
+    def __init__(self):
+
+        # Instantes de inicio pendientes {pid: tiempo}
+        self.wait_started = {}
+        self.hold_started = {}
+
+        # Acumulados
+        self.total_wait_time = 0
+        self.max_wait_time = 0
+        self.wait_count = 0
+
+        self.total_hold_time = 0
+        self.max_hold_time = 0
+        self.hold_count = 0
+
+    def start_wait(self, pid, now):
+        self.wait_started[pid] = now
+
+    def end_wait(self, pid, now):
+
+        since = self.wait_started.pop(pid, None)
+        if since is None:
+            return 0
+
+        waited = now - since
+        self.total_wait_time += waited
+        self.max_wait_time = max(self.max_wait_time, waited)
+        self.wait_count += 1
+        return waited
+
+    def start_hold(self, pid, now):
+        self.hold_started[pid] = now
+
+    def end_hold(self, pid, now):
+
+        since = self.hold_started.pop(pid, None)
+        if since is None:
+            return 0
+
+        held = now - since
+        self.total_hold_time += held
+        self.max_hold_time = max(self.max_hold_time, held)
+        self.hold_count += 1
+        return held
+
+    def forget(self, pid):
+
+        self.wait_started.pop(pid, None)
+        self.hold_started.pop(pid, None)
+
+    def average_wait(self):
+        return self.total_wait_time / self.wait_count if self.wait_count else 0
+
+    def average_hold(self):
+        return self.total_hold_time / self.hold_count if self.hold_count else 0
+
+    def get_statistics(self):
+
+        return {
+            'Espera Total': f"{self.total_wait_time} ms",
+            'Espera Promedio': f"{self.average_wait():.2f} ms",
+            'Espera Máxima': f"{self.max_wait_time} ms",
+            'Retención Total': f"{self.total_hold_time} ms",
+            'Retención Promedio': f"{self.average_hold():.2f} ms",
+            'Retención Máxima': f"{self.max_hold_time} ms"
+        }
@@ -1,35 +1,68 @@
+from Proyecto_Final_SO.Comunicacion_Sincronizacion.metricas import ContentionStats, current_time
+from collections import deque
+
+
 class Mutex:
+    NONE = "Ninguno"
+    INHERIT = "Herencia"
+    CEILING = "Techo"
 
-    def __init__(self, name):
+    def __init__(self, name, protocol=NONE, ceiling=None):
         # Inicializa el mutex
         self.name = name
         self.locked = False
         self.owner = None  # Proceso que actualmente tiene el lock
-        self.waiting_queue = []  # Procesos esperando adquirir el mutex
+        self.waiting_queue = deque()  # Procesos esperando adquirir el mutex
+        self.waiting_pids = set()  # Pertenencia a la cola en O(1)
+        self.scheduler = None  # Planificador cuyos procesos terminados se olvidan
+
+        # Protocolo contra inversión de prioridad
+        if protocol == Mutex.CEILING and ceiling is None:
+            raise ValueError("El protocolo de techo requiere una prioridad techo")
+        self.protocol = protocol
+        self.ceiling = ceiling
 
         # Estadísticas
         self.total_acquires = 0
         self.total_releases = 0
         self.total_blocks = 0
+        self.metrics = ContentionStats()
+
+        # Inversión: tiempo que un proceso espera a un dueño de menor prioridad base
+        self.inversion = ContentionStats()
+        self.total_boosts = 0
 
     def acquire(self, process, scheduler):
 
         if not self.locked:
             # Mutex disponible, adquirir
-            self.locked = True
-            self.owner = process
-            self.total_acquires += 1
+            self._grant(process, scheduler)
             return True
         else:
             # Mutex ocupado por otro proceso
-            if process not in self.waiting_queue:
+            if process.pid not in self.waiting_pids:
                 # Bloquear proceso
                 scheduler.block_process(
                     process.pid,
                     f"Esperando mutex '{self.name}'"
                 )
                 self.waiting_queue.append(process)
+                self.waiting_pids.add(process.pid)
+                process.blocked_on = self
+                now = current_time(scheduler)
+                self.metrics.start_wait(process.pid, now)
                 self.total_blocks += 1
+                self._watch(scheduler)
+
+                if self.owner and process.priority < self.owner.base_priority:
+                    self.inversion.start_wait(process.pid, now)
+
+                if self.protocol == Mutex.INHERIT:
+                    self._propagate_priority(process.priority, scheduler)
+
+                detector = getattr(scheduler, 'deadlock_detector', None)
+                if detector:
+                    detector.add_request(process, self)
             return False
 
     def release(self, process, scheduler):
@@ -38,31 +71,134 @@ class Mutex:
         if self.owner != process:
             return False
 
+        self.metrics.end_hold(process.pid, current_time(scheduler))
         self.locked = False
         self.owner = None
         self.total_releases += 1
 
+        process.held_mutexes.discard(self)
+        if self.protocol != Mutex.NONE:
+            self._restore_priority(process, scheduler)
+
+        detector = getattr(scheduler, 'deadlock_detector', None)
+        if detector:
+            detector.on_release(process, self)
+
         # Despertar siguiente proceso en cola
-        if self.waiting_queue:
-            next_process = self.waiting_queue.pop(0)
+        next_process = self._pop_waiter()
+        if next_process:
+            now = current_time(scheduler)
+            self.metrics.end_wait(next_process.pid, now)
+            self.inversion.end_wait(next_process.pid, now)
+            next_process.blocked_on = None
             scheduler.unblock_process(next_process.pid)
 
             # El proceso despertado adquiere automáticamente
-            self.locked = True
-            self.owner = next_process
-            self.total_acquires += 1
+            self._grant(next_process, scheduler)
 
         return True
 
-    def try_acquire(self, process):
+    def try_acquire(self, process, scheduler=None):
 
         if not self.locked:
-            self.locked = True
-            self.owner = process
-            self.total_acquires += 1
+            self._grant(process, scheduler)
+            return True
+        return False
+
+    def _grant(self, process, scheduler):
+
+        self.locked = True
+        self.owner = process
+        self.total_acquires += 1
+        self.metrics.start_hold(process.pid, current_time(scheduler))
+        process.held_mutexes.add(self)
+
+        if self.protocol == Mutex.CEILING and process.priority > self.ceiling:
+            self._boost(process, self.ceiling, scheduler)
+        elif self.protocol == Mutex.INHERIT and self.waiting_pids:
+            top = self.top_waiter_priority()
+            if top is not None and process.priority > top:
+                self._boost(process, top, scheduler)
+
+        detector = getattr(scheduler, 'deadlock_detector', None)
+        if detector:
+            detector.on_acquire(process, self)
+
+    def _pop_waiter(self):
+
+        # Las entradas retiradas con remove_waiter se descartan al salir
+        while self.waiting_queue:
+            process = self.waiting_queue.popleft()
+            if process.pid in self.waiting_pids:
+                self.waiting_pids.discard(process.pid)
+                return process
+        return None
+
+    def remove_waiter(self, process, scheduler=None):
+
+        if process.pid in self.waiting_pids:
+            self.waiting_pids.discard(process.pid)
+            self.metrics.forget(process.pid)
+            self.inversion.forget(process.pid)
+            process.blocked_on = None
+
+            # El dueño pudo haber heredado la prioridad de este proceso
+            if self.protocol == Mutex.INHERIT and self.owner and scheduler is not None:
+                self._restore_priority(self.owner, scheduler)
             return True
         return False
 
+    def _watch(self, scheduler):
+
+        # Un proceso terminado mientras espera sale de la cola (un hook por planificador)
+        self.scheduler = scheduler
+        if self.forget not in scheduler.termination_hooks:
+            scheduler.add_termination_hook(self.forget)
+
+    def forget(self, process):
+
+        self.remove_waiter(process, self.scheduler)
+
+    def top_waiter_priority(self):
+
+        priorities = [p.priority for p in self.waiting_queue if p.pid in self.waiting_pids]
+        return min(priorities) if priorities else None
+
+    def _propagate_priority(self, priority, scheduler):
+        # Herencia transitiva: el dueño hereda y, si a su vez espera otro
+        # mutex con herencia, también lo hereda el dueño de ese mutex
+        mutex = self
+        while mutex is not None and mutex.protocol == Mutex.INHERIT:
+            owner = mutex.owner
+            if owner is None or owner.priority <= priority:
+                return
+            mutex._boost(owner, priority, scheduler)
+            mutex = owner.blocked_on
+
+    def _restore_priority(self, process, scheduler):
+
+        # Prioridad efectiva = la mejor entre la base y lo que imponen los mutex retenidos
+        priority = process.base_priority
+        for mutex in process.held_mutexes:
+            if mutex.protocol == Mutex.CEILING:
+                priority = min(priority, mutex.ceiling)
+            elif mutex.protocol == Mutex.INHERIT:
+                top = mutex.top_waiter_priority()
+                if top is not None:
+                    priority = min(priority, top)
+
+        if priority != process.priority:
+            scheduler.set_priority(process, priority)
+
+    def _boost(self, process, priority, scheduler):
+
+        self.total_boosts += 1
+        scheduler.set_priority(process, priority)
+
+    def get_holder_pids(self):
+
+        return [self.owner.pid] if self.owner else []
+
     def is_locked(self):
 
         return self.locked
@@ -73,23 +209,31 @@ class Mutex:
 
     def get_waiting_count(self):
 
-        return len(self.waiting_queue)
+        return len(self.waiting_pids)
 
     def get_waiting_processes(self):
 
-        return list(self.waiting_queue)
+        return [p for p in self.waiting_queue if p.pid in self.waiting_pids]
 
     def get_statistics(self):
 
-        return {
+        stats = {
             'Nombre': self.name,
             'Estado': 'BLOQUEADO' if self.locked else 'LIBRE',
             'Owner': f"P{self.owner.pid} ({self.owner.name})" if self.owner else "Ninguno",
-            'En Espera': len(self.waiting_queue),
+            'En Espera': len(self.waiting_pids),
             'Total Adquisiciones': self.total_acquires,
             'Total Liberaciones': self.total_releases,
-            'Total Bloqueos': self.total_blocks
+            'Total Bloqueos': self.total_blocks,
+            'Protocolo': self.protocol if self.protocol != Mutex.CEILING else f"{self.protocol} ({self.ceiling})",
+            'Elevaciones de Prioridad': self.total_boosts,
+            'Inversiones': self.inversion.wait_count,
+            'Inversión Total': f"{self.inversion.total_wait_time} ms",
+            'Inversión Promedio': f"{self.inversion.average_wait():.2f} ms",
+            'Inversión Máxima': f"{self.inversion.max_wait_time} ms"
         }
+        stats.update(self.metrics.get_statistics())
+        return stats
 
     def __str__(self):
         status = "LOCKED" if self.locked else "FREE"
@@ -1,22 +1,195 @@
 from Proyecto_Final_SO.nucleo_procesos import Process
 from Proyecto_Final_SO.Comunicacion_Sincronizacion.memoria_compartida import SharedMemory
 from Proyecto_Final_SO.Comunicacion_Sincronizacion.mutex import Mutex
-import random
+from collections import deque
+
+
+class BufferChannel:
+
+    def __init__(self, name, size=5, mutex_name=None):
+
+        # Memoria compartida y su mutex
+        self.shared_memory = SharedMemory(name, size)
+        self.mutex = Mutex(mutex_name or f"{name}Mutex")
+
+        # Colas de espera (FIFO) y pertenencia en O(1)
+        self.not_full = deque()
+        self.not_empty = deque()
+        self.not_full_pids = set()
+        self.not_empty_pids = set()
+
+        # Instante en que cada proceso se bloqueó {pid: tiempo}
+        self.blocked_since = {}
+
+        # Estadísticas
+        self.items_produced = 0
+        self.items_consumed = 0
+        self.producer_blocks = 0
+        self.consumer_blocks = 0
+        self.producer_wait_time = 0
+        self.consumer_wait_time = 0
+        self.producer_wakeups = 0
+        self.consumer_wakeups = 0
+        self.start_time = None
+
+    @property
+    def name(self):
+        return self.shared_memory.name
+
+    def wait_not_full(self, process, scheduler):
+
+        if process.pid in self.not_full_pids:
+            return
+        scheduler.block_process(process.pid, f"Buffer '{self.name}' lleno")
+        self.not_full.append(process)
+        self.not_full_pids.add(process.pid)
+        self.blocked_since[process.pid] = scheduler.current_time
+        self.producer_blocks += 1
+
+    def wait_not_empty(self, process, scheduler):
+
+        if process.pid in self.not_empty_pids:
+            return
+        scheduler.block_process(process.pid, f"Buffer '{self.name}' vacío")
+        self.not_empty.append(process)
+        self.not_empty_pids.add(process.pid)
+        self.blocked_since[process.pid] = scheduler.current_time
+        self.consumer_blocks += 1
+
+    def signal_not_full(self, scheduler):
+
+        process = self._pop_waiter(self.not_full, self.not_full_pids, scheduler)
+        if process is None:
+            return None
+        self.producer_wait_time += self._wake(process, scheduler)
+        self.producer_wakeups += 1
+        return process
+
+    def signal_not_empty(self, scheduler):
+
+        process = self._pop_waiter(self.not_empty, self.not_empty_pids, scheduler)
+        if process is None:
+            return None
+        self.consumer_wait_time += self._wake(process, scheduler)
+        self.consumer_wakeups += 1
+        return process
+
+    def discard_waiter(self, process, scheduler=None):
+
+        # Un proceso que ya no espera (desbloqueado o terminado desde fuera)
+        # deja su entrada en la deque; se descarta al sacarla
+        if process.pid in self.not_full_pids:
+            self.not_full_pids.discard(process.pid)
+            self.producer_wait_time += self._elapsed(process, scheduler)
+            self.producer_wakeups += 1
+        if process.pid in self.not_empty_pids:
+            self.not_empty_pids.discard(process.pid)
+            self.consumer_wait_time += self._elapsed(process, scheduler)
+            self.consumer_wakeups += 1
+
+    def _pop_waiter(self, queue, pids, scheduler):
+
+        # Solo se despierta a un proceso que sigue bloqueado: los que ya
+        # fueron desbloqueados o terminados desde fuera se descartan
+        while queue:
+            process = queue.popleft()
+            if process.pid not in pids:
+                continue
+            if process.state != Process.WAITING:
+                self.discard_waiter(process, scheduler)
+                continue
+            pids.discard(process.pid)
+            return process
+        return None
+
+    def _wake(self, process, scheduler):
+
+        waited = self._elapsed(process, scheduler)
+        if process.state == Process.WAITING:
+            scheduler.unblock_process(process.pid)
+        return waited
+
+    def _elapsed(self, process, scheduler):
+
+        since = self.blocked_since.pop(process.pid, None)
+        if since is None or scheduler is None:
+            return 0
+        return scheduler.current_time - since
+
+    def get_throughput(self, current_time):
+
+        if self.start_time is None or current_time <= self.start_time:
+            return 0.0
+        return self.items_consumed / (current_time - self.start_time)
+
+    def get_statistics(self, current_time=0):
+
+        avg_producer_wait = self.producer_wait_time / self.producer_wakeups if self.producer_wakeups else 0
+        avg_consumer_wait = self.consumer_wait_time / self.consumer_wakeups if self.consumer_wakeups else 0
+
+        return {
+            'Nombre': self.name,
+            'Tamaño': self.shared_memory.size,
+            'En Buffer': self.shared_memory.get_items_count(),
+            'Items Producidos': self.items_produced,
+            'Items Consumidos': self.items_consumed,
+            'Throughput': f"{self.get_throughput(current_time) * 1000:.2f} items/s",
+            'Productores Esperando': len(self.not_full_pids),
+            'Consumidores Esperando': len(self.not_empty_pids),
+            'Bloqueos Productor': self.producer_blocks,
+            'Bloqueos Consumidor': self.consumer_blocks,
+            'Espera Promedio Productor': f"{avg_producer_wait:.2f} ms",
+            'Espera Promedio Consumidor': f"{avg_consumer_wait:.2f} ms"
+        }
+
+    def clear(self):
+
+        self.shared_memory.clear()
+        self.clear_waiters()
+
+    def clear_waiters(self):
+
+        self.not_full.clear()
+        self.not_empty.clear()
+        self.not_full_pids.clear()
+        self.not_empty_pids.clear()
+        self.blocked_since.clear()
 
 
 class ProducerConsumer:
 
-    def __init__(self, buffer_size=5):
+    def __init__(self, buffer_size=5, num_producers=1, num_consumers=1,
+                 num_buffers=1, buffer_names=None):
 
-        # Memoria compartida (buffer)
-        self.shared_memory = SharedMemory("ProducerConsumerBuffer", buffer_size)
+        if num_producers <= 0 or num_consumers <= 0:
+            raise ValueError("Debe haber al menos un productor y un consumidor")
+
+        if buffer_names is None:
+            if num_buffers <= 0:
+                raise ValueError("Debe haber al menos un buffer")
+            if num_buffers == 1:
+                buffer_names = ["ProducerConsumerBuffer"]
+            else:
+                buffer_names = [f"Buffer{i + 1}" for i in range(num_buffers)]
 
-        # Mutex para exclusión mutua
-        self.mutex = Mutex("BufferMutex")
+        # Buffers con nombre (memoria compartida + mutex + colas de espera)
+        self.buffers = {}
+        for name in buffer_names:
+            mutex_name = "BufferMutex" if len(buffer_names) == 1 else None
+            self.buffers[name] = BufferChannel(name, buffer_size, mutex_name)
+
+        # Compatibilidad: primer buffer y su mutex
+        first = next(iter(self.buffers.values()))
+        self.shared_memory = first.shared_memory
+        self.mutex = first.mutex
+
+        self.num_producers = num_producers
+        self.num_consumers = num_consumers
 
         # Procesos
-        self.producer = None
-        self.consumer = None
+        self.producers = []
+        self.consumers = []
+        self.roles = {}  # {pid: (rol, proceso, buffer)}
 
         # Estadísticas
         self.items_produced = 0
@@ -25,164 +198,191 @@ class ProducerConsumer:
 
         # Control
         self.running = False
-        self.producer_blocked_by_full = False
-        self.consumer_blocked_by_empty = False
+        self.scheduler = None
+
+    @property
+    def producer(self):
+        return self.producers[0] if self.producers else None
+
+    @property
+    def consumer(self):
+        return self.consumers[0] if self.consumers else None
 
     def create_processes(self, scheduler, resource_manager):
 
-        # Crear Productor
-        self.producer = Process(
-            "Productor",
-            burst_time=999999,  # Proceso de larga duración
-            priority=5,
-            memory_required=50
-        )
+        buffers = list(self.buffers.values())
 
-        # Asignar recursos y agregar al scheduler
-        resource_manager.request_resources(self.producer)
-        scheduler.add_process(self.producer)
+        # Productores y consumidores se reparten entre los buffers (round-robin)
+        for i in range(self.num_producers):
+            buffer = buffers[i % len(buffers)]
+            name = "Productor" if self.num_producers == 1 else f"Productor{i + 1}"
+            process = self._spawn(name, scheduler, resource_manager)
+            self.producers.append(process)
+            self.roles[process.pid] = ('P', process, buffer)
+
+        for i in range(self.num_consumers):
+            buffer = buffers[i % len(buffers)]
+            name = "Consumidor" if self.num_consumers == 1 else f"Consumidor{i + 1}"
+            process = self._spawn(name, scheduler, resource_manager)
+            self.consumers.append(process)
+            self.roles[process.pid] = ('C', process, buffer)
 
-        # Crear Consumidor
-        self.consumer = Process(
-            "Consumidor",
+        for buffer in buffers:
+            buffer.start_time = scheduler.current_time
+
+        # Un proceso terminado mientras esperaba sale de las colas de espera
+        self.scheduler = scheduler
+        scheduler.add_termination_hook(self.forget)
+
+        self.running = True
+
+    def _spawn(self, name, scheduler, resource_manager):
+
+        process = Process(
+            name,
             burst_time=999999,  # Proceso de larga duración
             priority=5,
             memory_required=50
         )
 
         # Asignar recursos y agregar al scheduler
-        resource_manager.request_resources(self.consumer)
-        scheduler.add_process(self.consumer)
+        resource_manager.request_resources(process)
+        scheduler.add_process(process)
+        return process
 
-        self.running = True
+    def _resolve(self, process, role):
 
-    def produce_step(self, scheduler):
+        if process is None:
+            process = self.producer if role == 'P' else self.consumer
+        if process is None:
+            return None, None
+        entry = self.roles.get(process.pid)
+        if entry is None or entry[0] != role:
+            return None, None
+        return process, entry[2]
 
-        if not self.producer or self.producer.state == Process.TERMINATED:
-            return None
+    def produce_step(self, scheduler, producer=None):
 
-        # Si el productor está esperando por buffer lleno, intentar despertar
-        if self.producer_blocked_by_full:
-            if not self.shared_memory.is_full():
-                # Hay espacio, despertar
-                if self.producer.state == Process.WAITING:
-                    scheduler.unblock_process(self.producer.pid)
-                self.producer_blocked_by_full = False
-            else:
-                return "Productor: esperando espacio en buffer"
+        producer, buffer = self._resolve(producer, 'P')
+        if not producer or producer.state == Process.TERMINATED:
+            return None
 
         # Solo producir si el proceso está en ejecución
-        if self.producer.state != Process.RUNNING:
+        if producer.state != Process.RUNNING:
             return None
 
+        # Si fue despertado desde fuera, ya no está en la cola de espera
+        buffer.discard_waiter(producer, scheduler)
+
         # Paso 1: Intentar adquirir mutex
-        if not self.mutex.acquire(self.producer, scheduler):
-            return f"Productor: esperando mutex (owner: P{self.mutex.owner.pid})"
+        if not buffer.mutex.acquire(producer, scheduler):
+            return f"{producer.name}: esperando mutex (owner: P{buffer.mutex.owner.pid})"
 
         # Paso 2: Verificar si hay espacio en buffer
-        if self.shared_memory.is_full():
-            # Buffer lleno, liberar mutex y bloquear
-            self.mutex.release(self.producer, scheduler)
-            scheduler.block_process(self.producer.pid, "Buffer lleno")
-            self.producer_blocked_by_full = True
-            return "Productor: buffer lleno, bloqueado"
+        if buffer.shared_memory.is_full():
+            # Buffer lleno, liberar mutex y esperar en not_full
+            buffer.mutex.release(producer, scheduler)
+            buffer.wait_not_full(producer, scheduler)
+            return f"{producer.name}: buffer '{buffer.name}' lleno, bloqueado"
 
         # Paso 3: Producir item
         self.item_counter += 1
         item = f"Item #{self.item_counter}"
-        self.shared_memory.write(self.producer, item)
+        buffer.shared_memory.write(producer, item)
+        buffer.items_produced += 1
         self.items_produced += 1
 
         # Paso 4: Liberar mutex
-        self.mutex.release(self.producer, scheduler)
+        buffer.mutex.release(producer, scheduler)
 
-        # Paso 5: Si consumidor está esperando buffer vacío, despertarlo
-        if self.consumer_blocked_by_empty and not self.shared_memory.is_empty():
-            if self.consumer.state == Process.WAITING:
-                scheduler.unblock_process(self.consumer.pid)
-            self.consumer_blocked_by_empty = False
+        # Paso 5: Despertar a un consumidor que espera items (O(1))
+        buffer.signal_not_empty(scheduler)
 
-        return f"Productor: producido {item}"
+        return f"{producer.name}: producido {item}"
 
-    def consume_step(self, scheduler):
+    def consume_step(self, scheduler, consumer=None):
 
-        if not self.consumer or self.consumer.state == Process.TERMINATED:
+        consumer, buffer = self._resolve(consumer, 'C')
+        if not consumer or consumer.state == Process.TERMINATED:
             return None
 
-        # Si el consumidor está esperando por buffer vacío, intentar despertar
-        if self.consumer_blocked_by_empty:
-            if not self.shared_memory.is_empty():
-                # Hay items, despertar
-                if self.consumer.state == Process.WAITING:
-                    scheduler.unblock_process(self.consumer.pid)
-                self.consumer_blocked_by_empty = False
-            else:
-                return "Consumidor: esperando items en buffer"
-
         # Solo consumir si el proceso está en ejecución
-        if self.consumer.state != Process.RUNNING:
+        if consumer.state != Process.RUNNING:
             return None
 
+        # Si fue despertado desde fuera, ya no está en la cola de espera
+        buffer.discard_waiter(consumer, scheduler)
+
         # Paso 1: Intentar adquirir mutex
-        if not self.mutex.acquire(self.consumer, scheduler):
-            return f"Consumidor: esperando mutex (owner: P{self.mutex.owner.pid})"
+        if not buffer.mutex.acquire(consumer, scheduler):
+            return f"{consumer.name}: esperando mutex (owner: P{buffer.mutex.owner.pid})"
 
         # Paso 2: Verificar si hay items en buffer
-        if self.shared_memory.is_empty():
-            # Buffer vacío, liberar mutex y bloquear
-            self.mutex.release(self.consumer, scheduler)
-            scheduler.block_process(self.consumer.pid, "Buffer vacío")
-            self.consumer_blocked_by_empty = True
-            return "Consumidor: buffer vacío, bloqueado"
+        if buffer.shared_memory.is_empty():
+            # Buffer vacío, liberar mutex y esperar en not_empty
+            buffer.mutex.release(consumer, scheduler)
+            buffer.wait_not_empty(consumer, scheduler)
+            return f"{consumer.name}: buffer '{buffer.name}' vacío, bloqueado"
 
         # Paso 3: Consumir item
-        item = self.shared_memory.read(self.consumer)
+        item = buffer.shared_memory.read(consumer)
+        buffer.items_consumed += 1
         self.items_consumed += 1
 
         # Paso 4: Liberar mutex
-        self.mutex.release(self.consumer, scheduler)
+        buffer.mutex.release(consumer, scheduler)
 
-        # Paso 5: Si productor está esperando buffer lleno, despertarlo
-        if self.producer_blocked_by_full and not self.shared_memory.is_full():
-            if self.producer.state == Process.WAITING:
-                scheduler.unblock_process(self.producer.pid)
-            self.producer_blocked_by_full = False
+        # Paso 5: Despertar a un productor que espera espacio (O(1))
+        buffer.signal_not_full(scheduler)
 
-        return f"Consumidor: consumido {item}"
+        return f"{consumer.name}: consumido {item}"
 
     def step(self, scheduler):
 
-        # Decidir aleatoriamente quién va primero (simula concurrencia)
-        if random.random() < 0.5:
-            msg_p = self.produce_step(scheduler)
-            msg_c = self.consume_step(scheduler)
-        else:
-            msg_c = self.consume_step(scheduler)
-            msg_p = self.produce_step(scheduler)
+        # Solo los procesos en ejecución pueden actuar: O(núcleos) por paso
+        msg_p, msg_c = None, None
+        for running in scheduler.get_running_processes():
+            entry = self.roles.get(running.pid)
+            if entry is None:
+                continue
+
+            role, process, _ = entry
+            if role == 'P':
+                msg_p = self.produce_step(scheduler, process)
+            else:
+                msg_c = self.consume_step(scheduler, process)
 
         return (msg_p, msg_c)
 
     def stop(self, scheduler, resource_manager):
 
         # Terminar procesos
-        if self.producer:
-            resource_manager.release_resources(self.producer)
-            scheduler.terminate_process(self.producer.pid)
+        for process in self.producers + self.consumers:
+            resource_manager.release_resources(process)
+            scheduler.terminate_process(process.pid)
+
+        for buffer in self.buffers.values():
+            buffer.clear_waiters()
 
-        if self.consumer:
-            resource_manager.release_resources(self.consumer)
-            scheduler.terminate_process(self.consumer.pid)
+        if self.forget in scheduler.termination_hooks:
+            scheduler.termination_hooks.remove(self.forget)
 
         self.running = False
 
+    def forget(self, process):
+
+        if process.pid not in self.roles:
+            return
+        for buffer in self.buffers.values():
+            buffer.discard_waiter(process, self.scheduler)
+
     def reset(self):
 
-        self.shared_memory.clear()
+        for buffer in self.buffers.values():
+            buffer.clear()
         self.items_produced = 0
         self.items_consumed = 0
         self.item_counter = 0
-        self.producer_blocked_by_full = False
-        self.consumer_blocked_by_empty = False
 
     def get_statistics(self):
 
@@ -194,13 +394,23 @@ class ProducerConsumer:
             'Mutex Estado': 'BLOQUEADO' if self.mutex.is_locked() else 'LIBRE',
             'Mutex Owner': f"P{self.mutex.owner.pid} ({self.mutex.owner.name})" if self.mutex.owner else "Ninguno",
             'Productor Estado': self.producer.state if self.producer else "N/A",
-            'Consumidor Estado': self.consumer.state if self.consumer else "N/A"
+            'Consumidor Estado': self.consumer.state if self.consumer else "N/A",
+            'Productores': len(self.producers),
+            'Consumidores': len(self.consumers),
+            'Buffers': len(self.buffers)
         }
         return stats
 
-    def get_buffer_items(self):
+    def get_buffer_statistics(self, current_time=0):
+
+        return {name: buffer.get_statistics(current_time)
+                for name, buffer in self.buffers.items()}
+
+    def get_buffer_items(self, buffer_name=None):
 
-        return self.shared_memory.get_buffer_items()
+        if buffer_name is None:
+            return self.shared_memory.get_buffer_items()
+        return self.buffers[buffer_name].shared_memory.get_buffer_items()
 
     def get_recent_accesses(self, n=10):
 
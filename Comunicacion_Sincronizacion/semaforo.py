@@ -0,0 +1,143 @@
+from Proyecto_Final_SO.Comunicacion_Sincronizacion.metricas import ContentionStats, current_time
+from collections import deque
+
+
+class Semaphore:
+
+    def __init__(self, name, value=1):
+
+        if value < 0:
+            raise ValueError("El valor inicial del semáforo no puede ser negativo")
+
+        self.name = name
+        self.initial_value = value
+        self.value = value  # Permisos disponibles
+        self.holders = {}  # {pid: permisos retenidos}
+        self.waiting_queue = deque()
+        self.waiting_pids = set()  # Fuente de verdad; la deque guarda el orden
+        self.scheduler = None  # Planificador cuyos procesos terminados se olvidan
+
+        # Estadísticas
+        self.total_acquires = 0
+        self.total_releases = 0
+        self.total_blocks = 0
+        self.metrics = ContentionStats()
+
+    def acquire(self, process, scheduler):
+
+        if self.value > 0:
+            self.value -= 1
+            self._grant(process, scheduler)
+            return True
+
+        # Sin permisos: bloquear proceso
+        if process.pid not in self.waiting_pids:
+            scheduler.block_process(
+                process.pid,
+                f"Esperando semáforo '{self.name}'"
+            )
+            self.waiting_queue.append(process)
+            self.waiting_pids.add(process.pid)
+            self.metrics.start_wait(process.pid, current_time(scheduler))
+            self.total_blocks += 1
+            self._watch(scheduler)
+        return False
+
+    def release(self, process, scheduler):
+
+        # Un semáforo no tiene dueño: cualquier proceso puede liberar,
+        # pero solo se mide retención de quien adquirió
+        now = current_time(scheduler)
+        held = self.holders.get(process.pid, 0)
+        if held == 1:
+            del self.holders[process.pid]
+            self.metrics.end_hold(process.pid, now)
+        elif held > 1:
+            self.holders[process.pid] = held - 1
+
+        self.total_releases += 1
+
+        # Ceder el permiso directamente al siguiente en cola
+        next_process = self._pop_waiter()
+        if next_process:
+            self.metrics.end_wait(next_process.pid, now)
+            scheduler.unblock_process(next_process.pid)
+            self._grant(next_process, scheduler)
+        else:
+            self.value += 1
+
+        return True
+
+    def try_acquire(self, process, scheduler=None):
+
+        if self.value > 0:
+            self.value -= 1
+            self._grant(process, scheduler)
+            return True
+        return False
+
+    def _pop_waiter(self):
+
+        # Las entradas retiradas con remove_waiter se descartan al salir
+        while self.waiting_queue:
+            process = self.waiting_queue.popleft()
+            if process.pid in self.waiting_pids:
+                self.waiting_pids.discard(process.pid)
+                return process
+        return None
+
+    def remove_waiter(self, process, scheduler=None):
+
+        if process.pid in self.waiting_pids:
+            self.waiting_pids.discard(process.pid)
+            self.metrics.forget(process.pid)
+            return True
+        return False
+
+    def _watch(self, scheduler):
+
+        # Un proceso terminado mientras espera sale de la cola (un hook por planificador)
+        self.scheduler = scheduler
+        if self.forget not in scheduler.termination_hooks:
+            scheduler.add_termination_hook(self.forget)
+
+    def forget(self, process):
+
+        self.remove_waiter(process, self.scheduler)
+
+    def _grant(self, process, scheduler):
+
+        held = self.holders.get(process.pid, 0)
+        if held == 0:
+            self.metrics.start_hold(process.pid, current_time(scheduler))
+        self.holders[process.pid] = held + 1
+        self.total_acquires += 1
+
+    def get_value(self):
+
+        return self.value
+
+    def get_waiting_count(self):
+
+        return len(self.waiting_pids)
+
+    def get_waiting_processes(self):
+
+        return [p for p in self.waiting_queue if p.pid in self.waiting_pids]
+
+    def get_statistics(self):
+
+        stats = {
+            'Nombre': self.name,
+            'Valor': f"{self.value}/{self.initial_value}",
+            'Retenedores': len(self.holders),
+            'En Espera': len(self.waiting_pids),
+            'Total Adquisiciones': self.total_acquires,
+            'Total Liberaciones': self.total_releases,
+            'Total Bloqueos': self.total_blocks
+        }
+        stats.update(self.metrics.get_statistics())
+        return stats
+
+    def __str__(self):
+        return f"Semaphore('{self.name}', {self.value})"
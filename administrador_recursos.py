@@ -1,7 +1,165 @@
 
+from collections import deque
+from dataclasses import dataclass
+
+from Proyecto_Final_SO import constantes
+
+
+@dataclass(frozen=True)
+class MemoryUsage:
+    total: int
+    used: int
+    available: int
+    usage_percent: float
+
+    def display(self):
+        return {
+            'Total': f"{self.total} MB",
+            'Usada': f"{self.used} MB",
+            'Disponible': f"{self.available} MB",
+            'Uso': f"{self.usage_percent:.1f}%"
+        }
+
+
+@dataclass(frozen=True)
+class CpuUsage:
+    total: int
+    in_use: int
+    available: int
+    usage_percent: float
+
+    def display(self):
+        return {
+            'Total': self.total,
+            'En Uso': self.in_use,
+            'Disponible': self.available,
+            'Uso': f"{self.usage_percent:.1f}%"
+        }
+
+
+@dataclass(frozen=True)
+class ResourceStats:
+    cpu: CpuUsage
+    memory: MemoryUsage
+    processes_with_memory: int
+    waiting_for_memory: int
+    avoidance: str
+    unsafe_denials: int
+
+    def display(self):
+        return {
+            'CPU Total': self.cpu.total,
+            'CPU en Uso': self.cpu.in_use,
+            'Memoria Total': f"{self.memory.total} MB",
+            'Memoria Usada': f"{self.memory.used} MB",
+            'Memoria Disponible': f"{self.memory.available} MB",
+            'Uso Memoria': f"{self.memory.usage_percent:.1f}%",
+            'Procesos con Memoria': self.processes_with_memory,
+            'Esperando Memoria': self.waiting_for_memory,
+            'Evasión': self.avoidance or "Ninguna",
+            'Rechazos Inseguros': self.unsafe_denials
+        }
+
+
+@dataclass(frozen=True)
+class EnergyStats:
+    governor: str
+    elapsed_time: int
+    total_energy: float
+    average_power: float
+    completed_jobs: int
+    energy_per_job: float
+    throughput_per_watt: float
+    frequencies: tuple
+
+    def display(self):
+        return {
+            'Gobernador': self.governor,
+            'Frecuencias': ", ".join(f"{f} MHz" for f in self.frequencies),
+            'Energía Total': f"{self.total_energy:.2f} J",
+            'Potencia Promedio': f"{self.average_power:.2f} W",
+            'Energía por Trabajo': f"{self.energy_per_job:.3f} J",
+            'Throughput por Watt': f"{self.throughput_per_watt:.4f} trabajos/s/W"
+        }
+
+
+# Estados P por defecto: (frecuencia en MHz, potencia activa en W)
+DEFAULT_P_STATES = ((800, 1.5), (1400, 3.5), (2000, 6.5), (2600, 11.0))
+
+
+class CpuCore:
+
+    def __init__(self, index, p_states=DEFAULT_P_STATES, idle_power=1.0,
+                 deep_idle_power=0.1, deep_idle_after=50, speed_factor=1.0):
+        self.index = index
+        self.p_states = tuple(sorted(p_states))
+        self.state = len(self.p_states) - 1
+
+        # Núcleo heterogéneo (big.LITTLE): velocidad relativa a un núcleo big.
+        # La potencia activa escala con el cuadrado (menor voltaje y frecuencia)
+        self.speed_factor = speed_factor
+        self.power_scale = speed_factor ** 2
+
+        # Modelo de reposo: C1 al quedar ocioso, C6 tras deep_idle_after ms
+        self.idle_power = idle_power
+        self.deep_idle_power = deep_idle_power
+        self.deep_idle_after = deep_idle_after
+        self.idle_streak = 0
+
+        self.energy = 0.0  # Joules
+        self.busy_time = 0
+        self.idle_time = 0
+        self.state_time = [0] * len(self.p_states)
+
+        # Ventana de muestreo del gobernador ondemand
+        self.window_busy = 0
+        self.window_elapsed = 0
+
+    @property
+    def frequency(self):
+        return self.p_states[self.state][0]
+
+    @property
+    def speed(self):
+        # Tasa de ejecución relativa a un núcleo big a frecuencia máxima
+        return self.speed_factor * self.frequency / self.p_states[-1][0]
+
+    @property
+    def min_speed(self):
+        # Velocidad a la frecuencia más baja
+        return self.speed_factor * self.p_states[0][0] / self.p_states[-1][0]
+
+    @property
+    def core_type(self):
+        return "big" if self.speed_factor >= 1.0 else "LITTLE"
+
+    def advance(self, elapsed, busy):
+        if busy:
+            power = self.p_states[self.state][1] * self.power_scale
+            self.busy_time += elapsed
+            self.window_busy += elapsed
+            self.idle_streak = 0
+        else:
+            power = self.deep_idle_power if self.idle_streak >= self.deep_idle_after else self.idle_power
+            self.idle_time += elapsed
+            self.idle_streak += elapsed
+
+        self.energy += power * elapsed / 1000
+        self.state_time[self.state] += elapsed
+        self.window_elapsed += elapsed
+
+
 class ResourceManager:
+    BANKER = "Banquero"
 
-    def __init__(self, num_cpus=1, total_memory=4096):
+    # Gobernadores de frecuencia (DVFS)
+    PERFORMANCE = constantes.PERFORMANCE
+    POWERSAVE = constantes.POWERSAVE
+    ONDEMAND = constantes.ONDEMAND
+    GOVERNORS = constantes.GOVERNORS
+
+    def __init__(self, num_cpus=1, total_memory=4096, avoidance=None, governor=PERFORMANCE,
+                 p_states=DEFAULT_P_STATES, core_speeds=None):
 
         self.num_cpus = num_cpus
         self.total_memory = total_memory
@@ -9,54 +167,365 @@ class ResourceManager:
 
         # Recursos asignados
         self.cpu_in_use = 0
+
+        # Modelo de energía por CPU y gobernador de frecuencia
+        core_speeds = list(core_speeds or [])
+        core_speeds += [1.0] * (num_cpus - len(core_speeds))
+        self.cores = [CpuCore(i, p_states, speed_factor=core_speeds[i]) for i in range(num_cpus)]
+        if governor not in self.GOVERNORS:
+            raise ValueError(f"Gobernador desconocido: {governor}")
+        self.governor = governor
+        self.sampling_period = 100   # ms, gobernador ondemand
+        self.up_threshold = 0.8
+        self.down_threshold = 0.3
+        self.elapsed_time = 0
+        self._reset_frequencies()
         self.memory_allocations = {}  # {pid: memory_allocated}
 
+        # Evasión de interbloqueo (algoritmo del banquero)
+        self.avoidance = avoidance
+        self.max_claims = {}  # {pid: memoria máxima declarada}
+        self.unsafe_denials = 0
+
+        # Procesos bloqueados esperando memoria: (proceso, cantidad, scheduler)
+        self.memory_waiting = deque()
+        self.memory_waiting_pids = set()
+
+        # Detector de interbloqueo (opcional)
+        self.deadlock_detector = None
+
+        # Grupos de recursos estilo cgroup {nombre: ProcessGroup}; el planificador
+        # comparte este mismo diccionario para shares y cuotas de CPU
+        self.groups = {}
+
         # Log de eventos
         self.event_log = []
 
     def request_cpu(self, process):
 
-        if self.cpu_in_use >= self.num_cpus:
-            msg = f"CPU no disponible para {process}"
+        # Un trabajo paralelo recibe todas sus CPUs a la vez o ninguna
+        width = getattr(process, 'width', 1)
+        if self.cpu_in_use + width > self.num_cpus:
+            msg = f"CPU no disponible para {process} (requiere {width})"
             self._log_event(msg, "WARNING")
             return (False, msg)
 
         # Asignar CPU
-        self.cpu_in_use += 1
-        msg = f"CPU asignada a {process}"
+        self.cpu_in_use += width
+        msg = f"CPU asignada a {process}" if width == 1 else f"{width} CPUs asignadas a {process}"
         self._log_event(msg, "INFO")
 
         return (True, msg)
 
     def release_cpu(self, process):
 
-        if self.cpu_in_use > 0:
-            self.cpu_in_use -= 1
+        width = getattr(process, 'width', 1)
+        if self.cpu_in_use >= width:
+            self.cpu_in_use -= width
             msg = f"CPU liberada por {process}"
             self._log_event(msg, "INFO")
             return (True, msg)
 
         return (False, "No hay CPU en uso")
 
+    def set_governor(self, governor):
+
+        if governor not in self.GOVERNORS:
+            return (False, f"Gobernador desconocido: {governor}")
+
+        self.governor = governor
+        self._reset_frequencies()
+
+        msg = f"Gobernador de CPU: {governor}"
+        self._log_event(msg, "INFO")
+        return (True, msg)
+
+    def _reset_frequencies(self):
+
+        for core in self.cores:
+            if self.governor == self.POWERSAVE:
+                core.state = 0
+            else:
+                # ondemand arranca a frecuencia máxima y baja según la carga
+                core.state = len(core.p_states) - 1
+
+    def get_cpu_speed(self, index=0):
+
+        return self.cores[index].speed
+
+    def get_cpu_speeds(self):
+
+        return [core.speed for core in self.cores]
+
+    def get_guaranteed_cpu_speeds(self):
+
+        # Velocidad mínima que el gobernador asegura por núcleo: performance fija
+        # la frecuencia máxima; powersave la mínima y ondemand puede bajar a ella
+        if self.governor == self.PERFORMANCE:
+            return [core.speed_factor for core in self.cores]
+        return [core.min_speed for core in self.cores]
+
+    def account_cpu_time(self, elapsed, busy_cores=()):
+
+        # Llamado por el ciclo de simulación por cada avance del reloj
+        self.elapsed_time += elapsed
+        self.cpu_in_use = len(busy_cores)
+        for core in self.cores:
+            core.advance(elapsed, core.index in busy_cores)
+            if self.governor == self.ONDEMAND and core.window_elapsed >= self.sampling_period:
+                self._ondemand(core)
+
+    def _ondemand(self, core):
+
+        load = core.window_busy / core.window_elapsed
+        if load >= self.up_threshold:
+            core.state = len(core.p_states) - 1
+        elif load < self.down_threshold and core.state > 0:
+            core.state -= 1
+        core.window_busy = 0
+        core.window_elapsed = 0
+
+    def get_energy_stats(self, completed_jobs=0):
+
+        energy = sum(core.energy for core in self.cores)
+        seconds = self.elapsed_time / 1000
+        power = energy / seconds if seconds else 0.0
+        throughput = completed_jobs / seconds if seconds else 0.0
+
+        return EnergyStats(
+            governor=self.governor,
+            elapsed_time=self.elapsed_time,
+            total_energy=energy,
+            average_power=power,
+            completed_jobs=completed_jobs,
+            energy_per_job=energy / completed_jobs if completed_jobs else 0.0,
+            throughput_per_watt=throughput / power if power else 0.0,
+            frequencies=tuple(core.frequency for core in self.cores)
+        )
+
+    def create_group(self, name, shares=1024, cpu_quota=None, cpu_period=100,
+                     memory_limit=None, prefix=None):
+
+        if name in self.groups:
+            return (False, f"El grupo {name} ya existe")
+
+        from Proyecto_Final_SO.grupos_procesos import ProcessGroup
+        try:
+            group = ProcessGroup(name, shares, cpu_quota, cpu_period, memory_limit, prefix)
+        except ValueError as e:
+            return (False, str(e))
+
+        self.groups[name] = group
+        msg = f"Grupo {name} creado (shares={shares}"
+        if cpu_quota:
+            msg += f", cuota={cpu_quota}/{cpu_period}ms"
+        if memory_limit is not None:
+            msg += f", memoria máx={memory_limit}MB"
+        msg += ")"
+        self._log_event(msg, "INFO")
+        return (True, msg)
+
+    def _group_of(self, process):
+
+        if not self.groups:
+            return None
+        if process.group not in self.groups:
+            from Proyecto_Final_SO.grupos_procesos import resolve_group
+            process.group = resolve_group(self.groups, process)
+        return self.groups[process.group]
+
+    def get_group_stats(self):
+
+        return tuple(group.get_stats(self.elapsed_time) for group in self.groups.values())
+
+    def get_fairness_index(self):
+
+        # Índice de Jain sobre el tiempo de CPU normalizado por shares de los
+        # grupos que tuvieron procesos
+        from Proyecto_Final_SO.grupos_procesos import jain_index
+        return jain_index(group.cpu_time / group.shares
+                          for group in self.groups.values() if group.admitted)
+
+    def get_group_statistics(self):
+
+        return {stats.name: stats.display() for stats in self.get_group_stats()}
+
     def request_memory(self, process):
 
         required = process.memory_required
 
+        group = self._group_of(process)
+        if group is not None and not group.fits_memory(required):
+            msg = f"Límite de memoria del grupo {group.name} excedido por {process} ({group.memory_used}+{required}MB > {group.memory_limit}MB)"
+            self._log_event(msg, "WARNING")
+            return (False, msg)
+
         if required > self.available_memory:
             msg = f"Memoria insuficiente para {process} (requiere {required}MB, disponible {self.available_memory}MB)"
             self._log_event(msg, "ERROR")
             return (False, msg)
 
+        if self.avoidance == ResourceManager.BANKER and not self.is_safe_state(process.pid, required):
+            self.unsafe_denials += 1
+            msg = f"Solicitud de {process} rechazada: estado inseguro (banquero)"
+            self._log_event(msg, "WARNING")
+            return (False, msg)
+
         # Asignar memoria
         self.available_memory -= required
         self.memory_allocations[process.pid] = required
         process.assign_memory(required)
+        if group is not None:
+            group.memory_used += required
 
         msg = f"Memoria asignada a {process}: {required}MB"
         self._log_event(msg, "INFO")
 
         return (True, msg)
 
+    def request_additional_memory(self, process, amount, scheduler=None):
+
+        current = self.memory_allocations.get(process.pid, 0)
+
+        if self.avoidance == ResourceManager.BANKER:
+            claim = self.max_claims.get(process.pid, process.memory_required)
+            if current + amount > claim:
+                msg = f"{process} excede su máximo declarado ({claim}MB)"
+                self._log_event(msg, "ERROR")
+                return (False, msg)
+
+        group = self._group_of(process)
+        if group is not None and group.memory_limit is not None and current + amount > group.memory_limit:
+            # Nunca cabría en el grupo: esperar no sirve
+            msg = f"{process} excede el límite de memoria del grupo {group.name} ({group.memory_limit}MB)"
+            self._log_event(msg, "ERROR")
+            return (False, msg)
+
+        if (amount <= self.available_memory and self._fits_group(process, amount)
+                and self._can_grant(process.pid, amount)):
+            self._allocate(process, amount)
+            msg = f"Memoria adicional asignada a {process}: {amount}MB"
+            self._log_event(msg, "INFO")
+            return (True, msg)
+
+        if scheduler is None:
+            msg = f"Memoria insuficiente para {process} (requiere {amount}MB, disponible {self.available_memory}MB)"
+            self._log_event(msg, "ERROR")
+            return (False, msg)
+
+        # Bloquear al proceso hasta que haya memoria suficiente
+        if process.pid not in self.memory_waiting_pids:
+            scheduler.block_process(process.pid, f"Esperando {amount}MB de memoria")
+            self.memory_waiting.append((process, amount, scheduler))
+            self.memory_waiting_pids.add(process.pid)
+
+            # Un proceso terminado mientras espera sale de la cola (un hook por planificador)
+            if self.forget not in scheduler.termination_hooks:
+                scheduler.add_termination_hook(self.forget)
+
+            if self.deadlock_detector:
+                self.deadlock_detector.add_request(process, self, amount)
+
+        msg = f"{process} bloqueado esperando {amount}MB de memoria"
+        self._log_event(msg, "WARNING")
+        return (False, msg)
+
+    def _fits_group(self, process, amount):
+
+        group = self.groups.get(process.group)
+        return group is None or group.fits_memory(amount)
+
+    def _allocate(self, process, amount):
+
+        group = self.groups.get(process.group)
+        if group is not None:
+            group.memory_used += amount
+        self.available_memory -= amount
+        self.memory_allocations[process.pid] = self.memory_allocations.get(process.pid, 0) + amount
+        process.assign_memory(self.memory_allocations[process.pid])
+
+    def _can_grant(self, pid, amount):
+
+        if self.avoidance != ResourceManager.BANKER:
+            return True
+        if self.is_safe_state(pid, amount):
+            return True
+        self.unsafe_denials += 1
+        return False
+
+    def _wake_memory_waiters(self):
+
+        # FIFO estricto: el primero en cola bloquea a los demás (evita inanición)
+        while self.memory_waiting:
+            process, amount, scheduler = self.memory_waiting[0]
+            if process.pid not in self.memory_waiting_pids:
+                self.memory_waiting.popleft()
+                continue
+            if (amount > self.available_memory or not self._fits_group(process, amount)
+                    or not self._can_grant(process.pid, amount)):
+                return
+
+            self.memory_waiting.popleft()
+            self.memory_waiting_pids.discard(process.pid)
+            self._allocate(process, amount)
+
+            if self.deadlock_detector:
+                self.deadlock_detector.on_acquire(process, self)
+
+            scheduler.unblock_process(process.pid)
+            self._log_event(f"Memoria adicional asignada a {process}: {amount}MB", "INFO")
+
+    def remove_waiter(self, process, scheduler=None):
+
+        if process.pid in self.memory_waiting_pids:
+            self.memory_waiting_pids.discard(process.pid)
+            return True
+        return False
+
+    def forget(self, process):
+
+        # Si era el primero de la cola (FIFO estricto), los siguientes pueden
+        # caber ahora
+        if self.remove_waiter(process):
+            self._wake_memory_waiters()
+
+    def get_holder_pids(self):
+
+        return self.memory_allocations.keys()
+
+    def declare_max_claim(self, process, max_memory):
+
+        if max_memory > self.total_memory:
+            return (False, f"El máximo de {process} excede la memoria total")
+
+        self.max_claims[process.pid] = max_memory
+        return (True, f"Máximo declarado para {process}: {max_memory}MB")
+
+    def is_safe_state(self, pid=None, amount=0):
+        # Banquero con un solo tipo de recurso: atender primero a quien menos
+        # necesita es óptimo, así que basta ordenar por necesidad restante
+        work = self.available_memory - amount
+        if work < 0:
+            return False
+
+        needs = []
+        for p, allocated in self.memory_allocations.items():
+            if p == pid:
+                allocated += amount
+            claim = self.max_claims.get(p, allocated)
+            needs.append((max(0, claim - allocated), allocated))
+
+        if pid is not None and pid not in self.memory_allocations:
+            claim = self.max_claims.get(pid, amount)
+            needs.append((max(0, claim - amount), amount))
+
+        for need, allocated in sorted(needs):
+            if need > work:
+                return False
+            work += allocated
+
+        return True
+
     def release_memory(self, process):
 
         if process.pid not in self.memory_allocations:
@@ -65,12 +534,19 @@ class ResourceManager:
         # Liberar memoria
         freed_memory = self.memory_allocations[process.pid]
         self.available_memory += freed_memory
+        group = self.groups.get(process.group)
+        if group is not None:
+            group.memory_used -= freed_memory
         del self.memory_allocations[process.pid]
+        self.max_claims.pop(process.pid, None)
         process.release_memory()
 
         msg = f"Memoria liberada por {process}: {freed_memory}MB"
         self._log_event(msg, "INFO")
 
+        if self.memory_waiting:
+            self._wake_memory_waiters()
+
         return (True, msg)
 
     def request_resources(self, process):
@@ -91,45 +567,48 @@ class ResourceManager:
 
     def has_available_resources(self, process):
 
-        return process.memory_required <= self.available_memory
+        if process.memory_required > self.available_memory:
+            return False
+        group = self._group_of(process)
+        return group is None or group.fits_memory(process.memory_required)
 
-    def get_memory_usage(self):
+    def get_memory_stats(self):
 
         used_memory = self.total_memory - self.available_memory
-        usage_percentage = (used_memory / self.total_memory * 100) if self.total_memory > 0 else 0
+        usage_percentage = (used_memory / self.total_memory * 100) if self.total_memory > 0 else 0.0
 
-        return {
-            'Total': f"{self.total_memory} MB",
-            'Usada': f"{used_memory} MB",
-            'Disponible': f"{self.available_memory} MB",
-            'Uso': f"{usage_percentage:.1f}%"
-        }
+        return MemoryUsage(self.total_memory, used_memory, self.available_memory, usage_percentage)
 
-    def get_cpu_usage(self):
+    def get_cpu_stats(self):
 
-        usage_percentage = (self.cpu_in_use / self.num_cpus * 100) if self.num_cpus > 0 else 0
+        usage_percentage = (self.cpu_in_use / self.num_cpus * 100) if self.num_cpus > 0 else 0.0
 
-        return {
-            'Total': self.num_cpus,
-            'En Uso': self.cpu_in_use,
-            'Disponible': self.num_cpus - self.cpu_in_use,
-            'Uso': f"{usage_percentage:.1f}%"
-        }
+        return CpuUsage(self.num_cpus, self.cpu_in_use, self.num_cpus - self.cpu_in_use, usage_percentage)
 
-    def get_statistics(self):
+    def get_stats(self):
 
-        mem_usage = self.get_memory_usage()
-        cpu_usage = self.get_cpu_usage()
+        return ResourceStats(
+            cpu=self.get_cpu_stats(),
+            memory=self.get_memory_stats(),
+            processes_with_memory=len(self.memory_allocations),
+            waiting_for_memory=len(self.memory_waiting_pids),
+            avoidance=self.avoidance,
+            unsafe_denials=self.unsafe_denials
+        )
 
-        return {
-            'CPU Total': cpu_usage['Total'],
-            'CPU en Uso': cpu_usage['En Uso'],
-            'Memoria Total': mem_usage['Total'],
-            'Memoria Usada': mem_usage['Usada'],
-            'Memoria Disponible': mem_usage['Disponible'],
-            'Uso Memoria': mem_usage['Uso'],
-            'Procesos con Memoria': len(self.memory_allocations)
-        }
+    # Compatibilidad: versiones formateadas de los métodos numéricos
+
+    def get_memory_usage(self):
+
+        return self.get_memory_stats().display()
+
+    def get_cpu_usage(self):
+
+        return self.get_cpu_stats().display()
+
+    def get_statistics(self):
+
+        return self.get_stats().display()
 
     def _log_event(self, message, event_type="INFO"):
 
@@ -0,0 +1,105 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+# Lo que importa un worker de barridos: debe cargar rápido y sin efectos
+CORE_MODULES = (
+    'Proyecto_Final_SO.nucleo_procesos',
+    'Proyecto_Final_SO.administrador_recursos',
+    'Proyecto_Final_SO.config'
+)
+
+# Subsistemas opcionales que solo deben cargarse al usarse
+LAZY_MODULES = (
+    'tkinter',
+    'pyarrow',
+    'pickle',
+    'http.server',
+    'Proyecto_Final_SO.main',
+    'Proyecto_Final_SO.Comunicacion_Sincronizacion.productor_consumidor',
+    'Proyecto_Final_SO.exportador_metricas',
+    'Proyecto_Final_SO.exportador_resultados',
+    'Proyecto_Final_SO.puntos_control',
+    'Proyecto_Final_SO.perfilado'
+)
+
+DEFAULT_BUDGET_MS = 100.0
+
+_PROBE = """
+import sys, time
+start = time.perf_counter()
+for name in sys.argv[1:]:
+    __import__(name)
+elapsed = time.perf_counter() - start
+import json
+print(json.dumps({'ms': elapsed * 1000, 'modules': sorted(sys.modules)}))
+"""
+
+
+def _package_root():
+    # Directorio que contiene al paquete Proyecto_Final_SO
+    return os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def measure_import(modules=CORE_MODULES, runs=5):
+    # Cada corrida es un intérprete nuevo (sin módulos en caché), en un
+    # directorio vacío para detectar archivos creados al importar
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [_package_root(), env.get('PYTHONPATH')]))
+
+    import_ms = []
+    spawn_ms = []
+    loaded = set()
+    created = set()
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as cwd:
+            start = time.perf_counter()
+            output = subprocess.run([sys.executable, '-c', _PROBE, *modules], cwd=cwd, env=env,
+                                    capture_output=True, text=True, check=True).stdout
+            spawn_ms.append((time.perf_counter() - start) * 1000)
+            created.update(os.listdir(cwd))
+
+        result = json.loads(output)
+        import_ms.append(result['ms'])
+        loaded.update(result['modules'])
+
+    return {
+        'import_ms': statistics.median(import_ms),
+        'spawn_ms': statistics.median(spawn_ms),
+        'lazy_loaded': sorted(name for name in LAZY_MODULES if name in loaded),
+        'files_created': sorted(created)
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tiempo de importación del núcleo del simulador")
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET_MS,
+                        help="Máximo de milisegundos para importar el núcleo (mediana)")
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    result = measure_import(runs=args.runs)
+    print(f"Importación del núcleo: {result['import_ms']:.1f} ms (presupuesto {args.budget:.0f} ms)")
+    print(f"Proceso completo (intérprete + importación): {result['spawn_ms']:.1f} ms")
+
+    failures = []
+    if result['import_ms'] > args.budget:
+        failures.append(f"la importación excede el presupuesto por {result['import_ms'] - args.budget:.1f} ms")
+    if result['lazy_loaded']:
+        failures.append(f"módulos opcionales cargados al importar: {', '.join(result['lazy_loaded'])}")
+    if result['files_created']:
+        failures.append(f"la importación creó archivos: {', '.join(result['files_created'])}")
+
+    for failure in failures:
+        print(f"FALLA: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
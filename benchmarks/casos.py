@@ -0,0 +1,187 @@
+import random
+
+from Proyecto_Final_SO.nucleo_procesos import Process, Scheduler
+from Proyecto_Final_SO.administrador_recursos import ResourceManager
+from Proyecto_Final_SO.Comunicacion_Sincronizacion.productor_consumidor import ProducerConsumer
+
+
+# Cada caso recibe n (tamaño del estado) y devuelve (función medida, operaciones).
+# La preparación no se mide; las operaciones se limitan a MAX_OPS para que
+# un estado de 10^6 procesos mida el costo por operación a ese tamaño.
+MAX_OPS = 1000
+
+
+def _make_processes(n, seed=42):
+    rng = random.Random(seed)
+    return [Process(f"B{i}", rng.randint(50, 500), rng.randint(1, 10), rng.randint(50, 300))
+            for i in range(n)]
+
+
+def _filled_scheduler(n, algorithm=Scheduler.SJF):
+    scheduler = Scheduler(algorithm)
+    # En el orden de la cola de listos cada inserción cae al final: preparar
+    # 10^6 procesos no cuesta O(n^2) desplazamientos de la lista. El log se
+    # vacía por lotes para no retener millones de eventos
+    for i, process in enumerate(sorted(_make_processes(n), key=scheduler._queue_key)):
+        scheduler.add_process(process)
+        if i % MAX_OPS == 0:
+            scheduler.clear_log()
+    scheduler.clear_log()
+    return scheduler
+
+
+def bench_add_process(n):
+    scheduler = _filled_scheduler(n)
+    extra = _make_processes(min(n, MAX_OPS), seed=7)
+
+    def run():
+        for process in extra:
+            scheduler.add_process(process)
+
+    return run, len(extra)
+
+
+def bench_schedule(n):
+    scheduler = _filled_scheduler(n)
+    ops = min(n, MAX_OPS)
+
+    def run():
+        for _ in range(ops):
+            process = scheduler.schedule()
+            # Terminar de inmediato para que el siguiente schedule despache otro
+            scheduler.execute_current_process(process.remaining_time)
+
+    return run, ops
+
+
+def bench_schedule_fair(n):
+    # CFS con grupos: elegir el siguiente es O(log n) sobre los heaps de vruntime
+    scheduler = Scheduler(Scheduler.FAIR)
+    manager = ResourceManager(num_cpus=1, total_memory=10 ** 9)
+    scheduler.groups = manager.groups
+    for i in range(8):
+        manager.create_group(f"g{i}", shares=512 * (i + 1))
+    for i, process in enumerate(_make_processes(n)):
+        process.group = f"g{i % 8}"
+        scheduler.add_process(process)
+    scheduler.clear_log()
+    ops = min(n, MAX_OPS)
+
+    def run():
+        for _ in range(ops):
+            process = scheduler.schedule()
+            scheduler.execute_current_process(process.remaining_time)
+
+    return run, ops
+
+
+def bench_block_unblock(n):
+    scheduler = _filled_scheduler(n)
+    rng = random.Random(1)
+    pids = [p.pid for p in rng.sample(scheduler.ready_queue, min(n, MAX_OPS))]
+
+    def run():
+        for pid in pids:
+            scheduler.block_process(pid, "benchmark")
+        for pid in pids:
+            scheduler.unblock_process(pid)
+
+    return run, 2 * len(pids)
+
+
+def bench_terminate_process(n):
+    scheduler = _filled_scheduler(n)
+    rng = random.Random(2)
+    pids = [p.pid for p in rng.sample(scheduler.ready_queue, min(n, MAX_OPS))]
+
+    def run():
+        for pid in pids:
+            scheduler.terminate_process(pid)
+
+    return run, len(pids)
+
+
+def _drained_scheduler(n):
+    # n procesos terminados, llegando por lotes para que la cola de listos
+    # sea corta y vaciarla no sea cuadrático
+    scheduler = Scheduler()
+    processes = _make_processes(n)
+    for start in range(0, n, MAX_OPS):
+        for process in processes[start:start + MAX_OPS]:
+            scheduler.add_process(process)
+        while scheduler.ready_queue:
+            process = scheduler.schedule()
+            scheduler.execute_current_process(process.remaining_time)
+        scheduler.clear_log()
+    return scheduler
+
+
+def bench_get_statistics(n):
+    scheduler = _drained_scheduler(n)
+    ops = 100
+
+    def run():
+        for _ in range(ops):
+            scheduler.get_statistics()
+
+    return run, ops
+
+
+def bench_get_stats(n):
+    scheduler = _drained_scheduler(n)
+    ops = 100
+
+    def run():
+        for _ in range(ops):
+            scheduler.get_stats()
+
+    return run, ops
+
+
+def bench_memory_request_release(n):
+    processes = _make_processes(n)
+    manager = ResourceManager(num_cpus=1, total_memory=sum(p.memory_required for p in processes) + 1)
+    for process in processes:
+        manager.request_memory(process)
+    manager.clear_log()
+
+    rng = random.Random(3)
+    sample = rng.sample(processes, min(n, MAX_OPS))
+
+    def run():
+        for process in sample:
+            manager.release_memory(process)
+        for process in sample:
+            manager.request_memory(process)
+
+    return run, 2 * len(sample)
+
+
+def bench_producer_consumer_step(n):
+    # n = procesos en el sistema además de productores y consumidores
+    scheduler = _filled_scheduler(n, Scheduler.PRIORITY)
+    manager = ResourceManager(num_cpus=1, total_memory=10 ** 9)
+    pc = ProducerConsumer(buffer_size=5, num_producers=4, num_consumers=4, num_buffers=2)
+    pc.create_processes(scheduler, manager)
+    ops = min(n, MAX_OPS)
+
+    def run():
+        for _ in range(ops):
+            scheduler.schedule()
+            pc.step(scheduler)
+            scheduler.execute_current_process(10)
+
+    return run, ops
+
+
+CASES = {
+    'Scheduler.add_process': bench_add_process,
+    'Scheduler.schedule': bench_schedule,
+    'Scheduler.schedule (CFS)': bench_schedule_fair,
+    'Scheduler.block_unblock': bench_block_unblock,
+    'Scheduler.terminate_process': bench_terminate_process,
+    'Scheduler.get_statistics': bench_get_statistics,
+    'Scheduler.get_stats': bench_get_stats,
+    'ResourceManager.request_release_memory': bench_memory_request_release,
+    'ProducerConsumer.step': bench_producer_consumer_step
+}
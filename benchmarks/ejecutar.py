@@ -0,0 +1,147 @@
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+
+from Proyecto_Final_SO.benchmarks.casos import CASES
+
+
+DEFAULT_SIZES = [100, 1000, 10000, 100000, 1000000]
+
+# Iteraciones del bucle de calibración: código Python genérico (llamadas,
+# listas, diccionarios) que mide la velocidad del intérprete en esta máquina
+CALIBRATION_ITERATIONS = 200000
+
+
+def _calibration_step(values, index, i):
+    values.append(i)
+    index[i & 1023] = len(values)
+    if len(values) > 64:
+        values.pop(0)
+
+
+def _calibration_loop():
+    values, index = [], {}
+    for i in range(CALIBRATION_ITERATIONS):
+        _calibration_step(values, index, i)
+
+
+def _timed(function):
+    # ns de una llamada, sin recolección de basura durante la medición
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter_ns()
+        function()
+        return time.perf_counter_ns() - start
+    finally:
+        gc.enable()
+
+
+def run_case(case, n, repeat=3):
+    # Mejor de `repeat` corridas, cada una con estado recién preparado. Junto
+    # a cada corrida se mide el bucle de calibración: 'relative' es el costo
+    # por operación en iteraciones de calibración, comparable entre máquinas
+    # y mucho menos sensible a la carga del momento que los ns absolutos
+    best = None
+    calibration = None
+    ops = 0
+    for _ in range(repeat):
+        run, ops = CASES[case](n)
+        calibration_ns = _timed(_calibration_loop) / CALIBRATION_ITERATIONS
+        elapsed = _timed(run)
+        best = elapsed if best is None else min(best, elapsed)
+        calibration = calibration_ns if calibration is None else min(calibration, calibration_ns)
+        # Liberar el estado antes de preparar la siguiente corrida: a 10^6
+        # procesos dos copias vivas duplican la memoria
+        del run
+
+    per_op = best / ops if ops else 0.0
+    return {
+        'case': case,
+        'n': n,
+        'ops': ops,
+        'total_ns': best,
+        'per_op_ns': per_op,
+        'calibration_ns': calibration,
+        'relative': per_op / calibration
+    }
+
+
+def run_suite(sizes=None, cases=None, repeat=3, verbose=True):
+    sizes = sizes or DEFAULT_SIZES
+    cases = cases or list(CASES)
+    results = {}
+
+    for case in cases:
+        for n in sizes:
+            result = run_case(case, n, repeat)
+            results[f"{case}@{n}"] = result
+            if verbose:
+                print(f"{case:<42} n={n:<8} {result['per_op_ns'] / 1000:>12.2f} us/op"
+                      f" {result['relative']:>10.1f} x calibración")
+
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'repeat': repeat
+        },
+        'results': results
+    }
+
+
+def compare(current, baseline, threshold=1.25):
+    # Regresión: costo por operación normalizado por la calibración ('relative')
+    # mayor a threshold veces el de la línea base. Una línea base sin
+    # calibración se compara en tiempos absolutos
+    regressions = []
+    for key, result in current['results'].items():
+        reference = baseline.get('results', {}).get(key)
+        if not reference:
+            continue
+        metric = 'relative' if 'relative' in reference else 'per_op_ns'
+        if not reference[metric]:
+            continue
+        ratio = result[metric] / reference[metric]
+        if ratio > threshold:
+            regressions.append((key, ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks del simulador")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help="Tamaños de estado (p. ej. 100 1000 1000000)")
+    parser.add_argument('--cases', nargs='+', choices=list(CASES), help="Casos a ejecutar")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help="Archivo JSON de resultados")
+    parser.add_argument('--baseline', help="JSON de línea base para detectar regresiones")
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help="Razón máxima permitida contra la línea base")
+    args = parser.parse_args(argv)
+
+    current = run_suite(args.sizes, args.cases, args.repeat)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.threshold)
+        for key, ratio in regressions:
+            print(f"REGRESIÓN {key}: {ratio:.2f}x más lento que la línea base")
+        if regressions:
+            return 1
+        print("Sin regresiones contra la línea base")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
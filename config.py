@@ -1,79 +1,232 @@
 import configparser
 import os
 
-class Config:
-
-    def __init__(self, config_file='config.ini'):
-
-        self.config = configparser.ConfigParser()
-
-        # Si no existe el archivo, crear uno por defecto
-        if not os.path.exists(config_file):
-            self._create_default_config(config_file)
+from Proyecto_Final_SO import constantes
+
+
+# Archivo distribuido con el paquete; se usa si no se indica otro
+DEFAULT_CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.ini')
+
+# Variables de entorno: SIMULADOR_NUM_CPUS, SIMULADOR_ALGORITHM, ... y
+# SIMULADOR_CONFIG para elegir el archivo
+ENV_PREFIX = "SIMULADOR_"
+
+# Capas de menor a mayor precedencia
+SCHEMA_LAYER = "esquema"
+FILE_LAYER = "archivo"
+ENV_LAYER = "entorno"
+OVERRIDE_LAYER = "overrides"
+_LAYERS = (SCHEMA_LAYER, FILE_LAYER, ENV_LAYER, OVERRIDE_LAYER)
+
+
+def _parse_speeds(value):
+    # "1.0, 1.0, 0.5" (archivo, entorno, CLI) o una lista de números (dict)
+    if isinstance(value, str):
+        return [float(speed) for speed in value.split(',') if speed.strip()]
+    return [float(speed) for speed in value]
+
+
+class Option:
+    # Entrada del esquema: ubicación en el .ini, conversión y valores admitidos
+
+    def __init__(self, attribute, section, name, parse, default, minimum=None, choices=None,
+                 error=None):
+        self.attribute = attribute
+        self.section = section
+        self.name = name
+        self.parse = parse
+        self.default = default
+        self.minimum = minimum
+        self.choices = choices
+        self.error = error
+
+    def convert(self, value):
+        try:
+            return self.parse(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"Valor inválido para {self.name}: {value!r}")
+
+    def check(self, value):
+        if self.minimum is not None and value < self.minimum:
+            raise ValueError(self.error or f"{self.name} debe ser al menos {self.minimum}")
+        if self.choices is not None and value not in self.choices:
+            raise ValueError(f"{self.error or self.name} debe ser uno de: {list(self.choices)}")
+
+
+SCHEMA = (
+    Option('num_cpus', 'Resources', 'num_cpus', int, 1, minimum=1,
+           error="El número de CPUs debe ser positivo"),
+    Option('total_memory', 'Resources', 'total_memory', int, 4096, minimum=1,
+           error="La memoria total debe ser positiva"),
+    # None = todos los núcleos a velocidad 1.0
+    Option('core_speeds', 'Resources', 'core_speeds', _parse_speeds, None),
+    Option('governor', 'Resources', 'governor', str, constantes.PERFORMANCE,
+           choices=constantes.GOVERNORS, error="Gobernador"),
+    Option('scheduling_algorithm', 'Scheduling', 'algorithm', str, constantes.SJF,
+           choices=constantes.ALGORITHMS, error="Algoritmo"),
+    Option('time_quantum', 'Scheduling', 'time_quantum', int, 100, minimum=1,
+           error="El quantum debe ser positivo"),
+    Option('min_burst_time', 'Processes', 'min_burst_time', int, 50, minimum=1),
+    Option('max_burst_time', 'Processes', 'max_burst_time', int, 500, minimum=1),
+    Option('min_memory', 'Processes', 'min_memory', int, 50, minimum=1),
+    Option('max_memory', 'Processes', 'max_memory', int, 300, minimum=1)
+)
+
+# Se aceptan el nombre del atributo y el de la opción del .ini ('algorithm')
+_OPTIONS = {option.name: option for option in SCHEMA}
+_OPTIONS.update({option.attribute: option for option in SCHEMA})
 
-        # Leer el archivo con codificación UTF-8
-        self.config.read(config_file, encoding='utf-8')
 
-        # Leer parámetros de recursos
-        self.num_cpus = int(self.config.get('Resources', 'num_cpus', fallback=1))
-        self.total_memory = int(self.config.get('Resources', 'total_memory', fallback=4096))
+class Config:
+    # Capas: valores por defecto del esquema < archivo .ini < variables de
+    # entorno < overrides (dict o argumentos de línea de comandos). Se valida
+    # una sola vez al construir y nunca se escribe a disco salvo con save()
+
+    def __init__(self, config_file=None, overrides=None, env=None):
+
+        env = os.environ if env is None else env
+
+        if config_file is None:
+            config_file = env.get(ENV_PREFIX + 'CONFIG')
+            if config_file is None and os.path.exists(DEFAULT_CONFIG_FILE):
+                config_file = DEFAULT_CONFIG_FILE
+        # Un archivo pedido explícitamente (argumento o SIMULADOR_CONFIG) debe existir
+        if config_file and not os.path.exists(config_file):
+            raise FileNotFoundError(f"No existe el archivo de configuración: {config_file}")
+
+        layers = []
+        if config_file:
+            layers.append((FILE_LAYER, self._read_file(config_file)))
+        layers.append((ENV_LAYER, {name[len(ENV_PREFIX):].lower(): value
+                                   for name, value in env.items()
+                                   if name.startswith(ENV_PREFIX)
+                                   and name[len(ENV_PREFIX):].lower() in _OPTIONS}))
+        if overrides:
+            layers.append((OVERRIDE_LAYER, overrides))
+
+        self.config_file = config_file
+        self._load(layers)
+
+    @classmethod
+    def from_dict(cls, values):
+        # Solo esquema + valores: sin archivo ni entorno (workers de barridos)
+        config = cls.__new__(cls)
+        config.config_file = None
+        config._load([(OVERRIDE_LAYER, values)])
+        return config
+
+    @classmethod
+    def from_args(cls, args=None, env=None):
+        # args: Namespace de un parser con add_arguments(), o lista de argumentos
+        if args is None or isinstance(args, (list, tuple)):
+            import argparse
+            parser = argparse.ArgumentParser()
+            cls.add_arguments(parser)
+            args = parser.parse_args(args)
+
+        overrides = {option.attribute: getattr(args, 'config_' + option.attribute)
+                     for option in SCHEMA
+                     if getattr(args, 'config_' + option.attribute, None) is not None}
+        return cls(getattr(args, 'config', None), overrides, env)
+
+    @staticmethod
+    def add_arguments(parser):
+
+        group = parser.add_argument_group("configuración")
+        group.add_argument('--config', help="Archivo .ini (por defecto el del paquete)")
+        for option in SCHEMA:
+            group.add_argument('--' + option.name.replace('_', '-'), dest='config_' + option.attribute,
+                               metavar=option.name.upper(), help=f"[{option.section}] {option.name}")
+
+    def _read_file(self, config_file):
+
+        parser = configparser.ConfigParser()
+        parser.read(config_file, encoding='utf-8')
+        return {option.attribute: parser.get(option.section, option.name)
+                for option in SCHEMA if parser.has_option(option.section, option.name)}
+
+    def _load(self, layers):
+
+        values = {option.attribute: option.default for option in SCHEMA}
+        self.sources = dict.fromkeys(values, SCHEMA_LAYER)
+
+        for layer, raw_values in layers:
+            for key, value in raw_values.items():
+                option = _OPTIONS.get(key)
+                if option is None:
+                    raise ValueError(f"Opción de configuración desconocida: {key}")
+                values[option.attribute] = option.convert(value)
+                self.sources[option.attribute] = layer
+
+        # num_cpus cambiado en una capa superior invalida las velocidades de
+        # una capa inferior (p. ej. el .ini trae 4 y el override pide 2 CPUs)
+        speeds = values['core_speeds']
+        if speeds is None or (len(speeds) != values['num_cpus'] and
+                              _LAYERS.index(self.sources['num_cpus']) > _LAYERS.index(self.sources['core_speeds'])):
+            values['core_speeds'] = [1.0] * values['num_cpus']
+            self.sources['core_speeds'] = self.sources['num_cpus']
+
+        for attribute, value in values.items():
+            setattr(self, attribute, value)
 
-        # Leer parámetros de planificación
-        self.scheduling_algorithm = self.config.get('Scheduling', 'algorithm', fallback='SJF')
-        self.time_quantum = int(self.config.get('Scheduling', 'time_quantum', fallback=100))
+        self._validate_config()
 
-        # Leer parámetros de procesos
-        self.min_burst_time = int(self.config.get('Processes', 'min_burst_time', fallback=50))
-        self.max_burst_time = int(self.config.get('Processes', 'max_burst_time', fallback=500))
-        self.min_memory = int(self.config.get('Processes', 'min_memory', fallback=50))
-        self.max_memory = int(self.config.get('Processes', 'max_memory', fallback=300))
+    def _validate_config(self):
 
-        # Validar configuración
-        self._validate_config()
+        for option in SCHEMA:
+            if option.attribute != 'core_speeds':
+                option.check(getattr(self, option.attribute))
 
-    def _create_default_config(self, config_file):
+        if len(self.core_speeds) != self.num_cpus:
+            raise ValueError("core_speeds debe tener una velocidad por CPU")
 
-        default_config = configparser.ConfigParser()
+        if any(speed <= 0 for speed in self.core_speeds):
+            raise ValueError("Las velocidades de los núcleos deben ser positivas")
 
-        default_config['Resources'] = {
-            'num_cpus': '1',
-            'total_memory': '4096'
-        }
+        if self.max_burst_time < self.min_burst_time:
+            raise ValueError("max_burst_time no puede ser menor que min_burst_time")
 
-        default_config['Scheduling'] = {
-            'algorithm': 'SJF',
-        }
+        if self.max_memory < self.min_memory:
+            raise ValueError("max_memory no puede ser menor que min_memory")
 
-        default_config['Processes'] = {
-            'min_burst_time': '50',
-            'max_burst_time': '500',
-            'min_memory': '50',
-            'max_memory': '300'
-        }
+    def to_dict(self):
 
-        with open(config_file, 'w', encoding='utf-8') as f:
-            default_config.write(f)
+        return {option.attribute: list(getattr(self, option.attribute))
+                if option.attribute == 'core_speeds' else getattr(self, option.attribute)
+                for option in SCHEMA}
 
-    def _validate_config(self):
+    def copy(self, **overrides):
 
-        if self.num_cpus <= 0:
-            raise ValueError("El número de CPUs debe ser positivo")
+        # Copia validada con cambios puntuales (una por corrida de un barrido).
+        # Los valores actuales son una capa inferior a los cambios, así que
+        # copy(num_cpus=2) reajusta core_speeds igual que un override
+        config = Config.__new__(Config)
+        config.config_file = self.config_file
+        config._load([(FILE_LAYER, self.to_dict()), (OVERRIDE_LAYER, overrides)])
+        return config
 
-        if self.total_memory <= 0:
-            raise ValueError("La memoria total debe ser positiva")
+    def save(self, config_file):
 
-        if self.time_quantum <= 0:
-            raise ValueError("El quantum debe ser positivo")
+        # Única escritura a disco: explícita
+        parser = configparser.ConfigParser()
+        for option in SCHEMA:
+            value = getattr(self, option.attribute)
+            if option.attribute == 'core_speeds':
+                value = ", ".join(f"{speed:g}" for speed in value)
+            if not parser.has_section(option.section):
+                parser.add_section(option.section)
+            parser.set(option.section, option.name, str(value))
 
-        valid_algorithms = ['SJF', 'Prioridad']
-        if self.scheduling_algorithm not in valid_algorithms:
-            raise ValueError(f"Algoritmo debe ser uno de: {valid_algorithms}")
+        with open(config_file, 'w', encoding='utf-8') as f:
+            parser.write(f)
 
     def get_summary(self):
 
         return {
             'CPUs': self.num_cpus,
+            'Velocidad de Núcleos': ", ".join(f"{speed:g}x" for speed in self.core_speeds),
             'Memoria Total': f"{self.total_memory} MB",
+            'Gobernador': self.governor,
             'Algoritmo de Planificación': self.scheduling_algorithm,
             'Quantum': f"{self.time_quantum} ms",
             'Burst Time': f"{self.min_burst_time}-{self.max_burst_time} ms",
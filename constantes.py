@@ -0,0 +1,16 @@
+# Nombres compartidos por el planificador, el administrador de recursos y la
+# configuración: config.py valida contra ellos sin importar el núcleo
+
+# Algoritmos de planificación (Scheduler)
+SJF = "SJF"
+PRIORITY = "Prioridad"
+FAIR = "CFS"
+EDF = "EDF"
+RM = "RM"
+ALGORITHMS = (SJF, PRIORITY, FAIR, EDF, RM)
+
+# Gobernadores de frecuencia (ResourceManager)
+PERFORMANCE = "performance"
+POWERSAVE = "powersave"
+ONDEMAND = "ondemand"
+GOVERNORS = (PERFORMANCE, POWERSAVE, ONDEMAND)
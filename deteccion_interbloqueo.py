@@ -0,0 +1,202 @@
+class DeadlockDetector:
+    REPORT = "Reportar"
+    RECOVER = "Recuperar"
+
+    def __init__(self, scheduler, resource_manager=None, mode=REPORT):
+        self.scheduler = scheduler
+        self.resource_manager = resource_manager
+        self.mode = mode
+
+        # Aristas de solicitud del grafo espera-por {pid: (recurso, cantidad, proceso)}
+        # Las aristas de asignación se leen de cada recurso (get_holder_pids)
+        self.requests = {}
+
+        # Mutex retenidos por proceso, necesarios para recuperar {pid: {mutex}}
+        self.held = {}
+
+        # Resultados
+        self.deadlocks = []
+        self.victims = []
+        self.cycle_checks = 0
+        self.nodes_visited = 0
+
+        self.event_log = []
+
+
+    def add_request(self, process, resource, amount=None):
+        # amount None = recurso de instancia única (mutex)
+        self.requests[process.pid] = (resource, amount, process)
+
+        cycle = self._find_cycle(process, resource)
+        if cycle is None:
+            return None
+
+        # Un ciclo con recursos de varias instancias (memoria) no basta:
+        # se confirma con el algoritmo de detección por reducción
+        if any(self.requests[p.pid][1] is not None for p in cycle):
+            deadlocked = self._reduce()
+            if not deadlocked:
+                return None
+            cycle = [p for p in cycle if p.pid in deadlocked] or cycle
+
+        self._on_deadlock(cycle)
+        return cycle
+
+    def on_acquire(self, process, resource):
+
+        entry = self.requests.get(process.pid)
+        if entry is not None and entry[0] is resource:
+            del self.requests[process.pid]
+
+        if resource is not self.resource_manager:
+            self.held.setdefault(process.pid, set()).add(resource)
+
+    def on_release(self, process, resource):
+
+        held = self.held.get(process.pid)
+        if held is not None:
+            held.discard(resource)
+            if not held:
+                del self.held[process.pid]
+
+    def forget(self, process):
+
+        self.requests.pop(process.pid, None)
+        self.held.pop(process.pid, None)
+
+
+    def _find_cycle(self, process, resource):
+        # El grafo era acíclico antes de la nueva arista, así que cualquier ciclo
+        # nuevo pasa por ella: basta un DFS desde los dueños del recurso
+        self.cycle_checks += 1
+        target = process.pid
+        parent = {}
+        stack = []
+
+        for holder in resource.get_holder_pids():
+            if holder not in parent:
+                parent[holder] = target
+                stack.append(holder)
+
+        while stack:
+            pid = stack.pop()
+            self.nodes_visited += 1
+
+            if pid == target:
+                return self._build_cycle(parent, target)
+
+            entry = self.requests.get(pid)
+            if entry is None or entry[2].state != entry[2].WAITING:
+                continue
+
+            for holder in entry[0].get_holder_pids():
+                if holder not in parent:
+                    parent[holder] = pid
+                    stack.append(holder)
+
+        return None
+
+    def _build_cycle(self, parent, target):
+
+        cycle = []
+        pid = parent[target]
+        while pid != target:
+            cycle.append(self.requests[pid][2])
+            pid = parent[pid]
+        cycle.append(self.requests[target][2])
+        cycle.reverse()
+        return cycle
+
+    def _reduce(self):
+        # Algoritmo de detección: los procesos que no esperan terminan y liberan,
+        # los que quedan sin poder avanzar están en interbloqueo
+        waiting = {pid: entry for pid, entry in self.requests.items()
+                   if entry[2].state == entry[2].WAITING}
+        work = self.resource_manager.available_memory if self.resource_manager else 0
+
+        if self.resource_manager:
+            for pid, amount in self.resource_manager.memory_allocations.items():
+                if pid not in waiting:
+                    work += amount
+
+        progress = True
+        while progress:
+            progress = False
+            for pid, (resource, amount, _) in list(waiting.items()):
+                if amount is None:
+                    can_run = all(h not in waiting for h in resource.get_holder_pids())
+                else:
+                    can_run = amount <= work
+                if can_run:
+                    del waiting[pid]
+                    if self.resource_manager:
+                        work += self.resource_manager.memory_allocations.get(pid, 0)
+                    progress = True
+
+        return set(waiting)
+
+
+    def _on_deadlock(self, cycle):
+
+        self.deadlocks.append([p.pid for p in cycle])
+        chain = " -> ".join(str(p) for p in cycle + cycle[:1])
+        self._log_event(f"Interbloqueo detectado: {chain}", "ERROR")
+
+        if self.mode == DeadlockDetector.RECOVER:
+            self._recover(cycle)
+
+    def select_victim(self, cycle):
+        # Menor prioridad (número mayor) y, a igualdad, el más reciente
+        return max(cycle, key=lambda p: (p.priority, p.pid))
+
+    def _recover(self, cycle):
+
+        victim = self.select_victim(cycle)
+        self.victims.append(victim.pid)
+
+        entry = self.requests.pop(victim.pid, None)
+        if entry is not None:
+            entry[0].remove_waiter(victim, self.scheduler)
+
+        # Copiar lo retenido antes de terminar: el hook de terminación (forget)
+        # borra la entrada de held
+        held = list(self.held.pop(victim.pid, ()))
+
+        # Terminar primero, luego liberar lo retenido (los recursos despiertan a otros)
+        self.scheduler.terminate_process(victim.pid)
+
+        for resource in held:
+            resource.release(victim, self.scheduler)
+
+        if self.resource_manager:
+            self.resource_manager.release_resources(victim)
+
+        self._log_event(f"Proceso {victim} elegido como víctima y terminado", "FORCED")
+
+
+    def get_statistics(self):
+
+        return {
+            'Modo': self.mode,
+            'Procesos Esperando': len(self.requests),
+            'Interbloqueos Detectados': len(self.deadlocks),
+            'Víctimas': len(self.victims),
+            'Verificaciones': self.cycle_checks,
+            'Nodos Visitados': self.nodes_visited
+        }
+
+    def _log_event(self, message, event_type="INFO"):
+
+        self.event_log.append({
+            'type': event_type,
+            'message': message
+        })
+        self.scheduler._log_event(message, event_type)
+
+    def get_event_log(self, last_n=10):
+
+        return self.event_log[-last_n:] if last_n > 0 else self.event_log
+
+    def clear_log(self):
+
+        self.event_log = []
@@ -0,0 +1,311 @@
+import heapq
+import itertools
+import random
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+
+
+# Políticas de planificación del dispositivo
+FCFS = "FCFS"
+SSTF = "SSTF"
+SCAN = "SCAN"
+
+# Distribuciones del tiempo de servicio
+EXPONENTIAL = "Exponencial"
+UNIFORM = "Uniforme"
+CONSTANT = "Constante"
+
+
+class IORequest:
+    __slots__ = ('process', 'submitted', 'started', 'cylinder', 'cancelled')
+
+    def __init__(self, process, submitted, cylinder=None):
+        self.process = process
+        self.submitted = submitted
+        self.started = None
+        self.cylinder = cylinder
+        self.cancelled = False
+
+
+class IODevice:
+    # Dispositivo genérico (p. ej. red): cola FCFS y tiempo de servicio aleatorio
+
+    def __init__(self, name, mean_service_time=20, distribution=EXPONENTIAL, rng=None):
+        if mean_service_time <= 0:
+            raise ValueError("El tiempo de servicio medio debe ser positivo")
+        if distribution not in (EXPONENTIAL, UNIFORM, CONSTANT):
+            raise ValueError(f"Distribución no soportada: {distribution}")
+
+        self.name = name
+        self.policy = FCFS
+        self.mean_service_time = mean_service_time
+        self.distribution = distribution
+        self.rng = rng or random
+
+        self.queue = deque()
+        self.waiting = 0       # Solicitudes en cola sin contar las canceladas
+        self.current = None
+
+        # Estadísticas
+        self.created_at = None
+        self.busy_time = 0
+        self.completed = 0
+        self.total_queue_wait = 0
+        self.total_latency = 0
+        self.max_latency = 0
+
+    def submit(self, request):
+        if self.created_at is None:
+            self.created_at = request.submitted
+        self.waiting += 1
+        self._enqueue(request)
+
+    def _enqueue(self, request):
+        self.queue.append(request)
+
+    def _dequeue(self):
+        while self.queue:
+            request = self.queue.popleft()
+            if not request.cancelled:
+                return request
+        return None
+
+    def cancel(self, request):
+        request.cancelled = True
+        if request.started is None:
+            self.waiting -= 1
+
+    def is_busy(self):
+        return self.current is not None
+
+    def service_time(self, request):
+        mean = self.mean_service_time
+        if self.distribution == EXPONENTIAL:
+            return self.rng.expovariate(1.0 / mean)
+        if self.distribution == UNIFORM:
+            return self.rng.uniform(0, 2 * mean)
+        return mean
+
+    def start_next(self, now):
+        # Devuelve el instante de terminación, o None si la cola está vacía
+        request = self._dequeue()
+        if request is None:
+            return None
+
+        self.waiting -= 1
+        self.current = request
+        request.started = now
+        self.total_queue_wait += now - request.submitted
+        return now + self.service_time(request)
+
+    def complete(self, now):
+        request = self.current
+        self.current = None
+
+        self.busy_time += now - request.started
+        self.completed += 1
+        latency = now - request.submitted
+        self.total_latency += latency
+        if latency > self.max_latency:
+            self.max_latency = latency
+        return request
+
+    def get_utilization(self, now):
+        if self.created_at is None or now <= self.created_at:
+            return 0.0
+        busy = self.busy_time
+        if self.current:
+            busy += max(0, now - self.current.started)
+        return min(1.0, busy / (now - self.created_at))
+
+    def get_statistics(self, now):
+        completed = self.completed
+        return {
+            'Política': self.policy,
+            'En Cola': self.waiting,
+            'Ocupado': 'Sí' if self.current else 'No',
+            'Completadas': completed,
+            'Utilización': f"{self.get_utilization(now) * 100:.1f}%",
+            'Espera en Cola Promedio': f"{self.total_queue_wait / completed:.2f} ms" if completed else "0.00 ms",
+            'Latencia Promedio': f"{self.total_latency / completed:.2f} ms" if completed else "0.00 ms",
+            'Latencia Máxima': f"{self.max_latency:.2f} ms"
+        }
+
+
+class DiskDevice(IODevice):
+    # Disco con cabezal: búsqueda proporcional a la distancia entre cilindros
+
+    def __init__(self, name, cylinders=200, policy=FCFS, seek_time=0.1,
+                 rotational_latency=8, transfer_time=2, rng=None):
+        if policy not in (FCFS, SSTF, SCAN):
+            raise ValueError(f"Política de disco no soportada: {policy}")
+        super().__init__(name, mean_service_time=transfer_time + rotational_latency / 2,
+                         distribution=CONSTANT, rng=rng)
+        self.policy = policy
+        self.cylinders = cylinders
+        self.seek_time = seek_time
+        self.rotational_latency = rotational_latency
+        self.transfer_time = transfer_time
+
+        self.head = 0
+        self.direction = 1
+        self.head_movement = 0
+
+        # SSTF y SCAN: solicitudes ordenadas por cilindro, (cilindro, secuencia, solicitud)
+        self.pending = []
+        self._seq = itertools.count()
+
+    def _enqueue(self, request):
+        if request.cylinder is None:
+            request.cylinder = self.rng.randrange(self.cylinders)
+        if self.policy == FCFS:
+            self.queue.append(request)
+        else:
+            insort(self.pending, (request.cylinder, next(self._seq), request))
+
+    def _dequeue(self):
+        if self.policy == FCFS:
+            return super()._dequeue()
+
+        while self.pending:
+            index = self._next_index()
+            request = self.pending.pop(index)[2]
+            if not request.cancelled:
+                return request
+        return None
+
+    def _next_index(self):
+        pending = self.pending
+        if self.policy == SSTF:
+            i = bisect_left(pending, (self.head,))
+            if i == len(pending):
+                return i - 1
+            if i > 0 and self.head - pending[i - 1][0] <= pending[i][0] - self.head:
+                return i - 1
+            return i
+
+        # SCAN (elevador, variante LOOK): sigue en la dirección actual y se
+        # invierte al no quedar solicitudes por delante
+        if self.direction > 0:
+            i = bisect_left(pending, (self.head,))
+            if i < len(pending):
+                return i
+            self.direction = -1
+            return len(pending) - 1
+
+        i = bisect_right(pending, (self.head, float('inf'))) - 1
+        if i >= 0:
+            return i
+        self.direction = 1
+        return 0
+
+    def service_time(self, request):
+        distance = abs(request.cylinder - self.head)
+        self.head_movement += distance
+        self.head = request.cylinder
+        return (distance * self.seek_time
+                + self.rng.uniform(0, self.rotational_latency)
+                + self.transfer_time)
+
+    def get_statistics(self, now):
+        stats = super().get_statistics(now)
+        stats['Cabezal'] = self.head
+        stats['Movimiento del Cabezal'] = self.head_movement
+        return stats
+
+
+class IOSubsystem:
+    # Las terminaciones son eventos en un min-heap (tiempo, secuencia, dispositivo);
+    # al vencer despiertan al proceso con Scheduler.unblock_process
+
+    def __init__(self, scheduler, devices=None, rng=None):
+        self.scheduler = scheduler
+        self.rng = rng or random
+        self.devices = {}
+        for device in devices or default_devices():
+            self.add_device(device)
+
+        self.events = []
+        self._event_seq = itertools.count()
+        self.pending = {}  # pid -> (dispositivo, solicitud)
+
+        scheduler.add_termination_hook(self.forget)
+
+    def add_device(self, device):
+        self.devices[device.name] = device
+
+    def submit(self, process, device_name=None, cylinder=None):
+        if process.pid in self.pending or not self.devices:
+            return False
+
+        if device_name is None:
+            device = self.rng.choice(list(self.devices.values()))
+        else:
+            device = self.devices[device_name]
+
+        self.scheduler.block_process(process.pid, f"Esperando E/S ({device.name})")
+        if process.state != process.WAITING:
+            return False
+
+        now = self.scheduler.current_time
+        request = IORequest(process, now, cylinder)
+        self.pending[process.pid] = (device, request)
+        device.submit(request)
+        if not device.is_busy():
+            self._start(device, now)
+        return True
+
+    def _start(self, device, now):
+        finish = device.start_next(now)
+        if finish is not None:
+            heapq.heappush(self.events, (finish, next(self._event_seq), device))
+
+    def advance(self, now):
+        while self.events and self.events[0][0] <= now:
+            finish, _, device = heapq.heappop(self.events)
+            request = device.complete(finish)
+            if not request.cancelled:
+                del self.pending[request.process.pid]
+                self.scheduler.unblock_process(request.process.pid)
+            self._start(device, finish)
+
+    def next_completion(self):
+        return self.events[0][0] if self.events else None
+
+    def forget(self, process):
+        # Proceso terminado mientras esperaba E/S: su solicitud se descarta
+        entry = self.pending.pop(process.pid, None)
+        if entry:
+            device, request = entry
+            device.cancel(request)
+
+    def drain(self):
+        # Al desactivar: despierta a todos los procesos que esperaban E/S
+        for device, request in list(self.pending.values()):
+            device.cancel(request)
+            self.scheduler.unblock_process(request.process.pid)
+        self.pending.clear()
+        self.events.clear()
+        for device in self.devices.values():
+            device.current = None
+            device.queue.clear()
+            if isinstance(device, DiskDevice):
+                device.pending.clear()
+            device.waiting = 0
+
+        if self.forget in self.scheduler.termination_hooks:
+            self.scheduler.termination_hooks.remove(self.forget)
+
+    def get_waiting_count(self):
+        return len(self.pending)
+
+    def get_statistics(self):
+        now = self.scheduler.current_time
+        return {name: device.get_statistics(now) for name, device in self.devices.items()}
+
+
+def default_devices(rng=None):
+    return [
+        DiskDevice("Disco", cylinders=200, policy=SCAN, rng=rng),
+        IODevice("Red", mean_service_time=30, distribution=EXPONENTIAL, rng=rng)
+    ]
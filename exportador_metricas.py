@@ -0,0 +1,209 @@
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class _MetricWriter:
+
+    def __init__(self):
+        # Las muestras de una misma métrica deben salir juntas bajo su HELP/TYPE
+        self.families = {}
+
+    def add(self, name, kind, help_text, value, labels=None):
+        family = self.families.get(name)
+        if family is None:
+            family = self.families[name] = (kind, help_text, [])
+
+        if labels:
+            label_str = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+            family[2].append(f"{name}{{{label_str}}} {float(value)!r}")
+        else:
+            family[2].append(f"{name} {float(value)!r}")
+
+    def render(self):
+        lines = []
+        for name, (kind, help_text, samples) in self.families.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(samples)
+        return ("\n".join(lines) + "\n").encode('utf-8')
+
+
+class MetricsExporter:
+
+    def __init__(self, controller, port=None, host="127.0.0.1", textfile=None, interval=1.0):
+        self.controller = controller
+        self.port = port
+        self.host = host
+        self.textfile = textfile
+        self.interval = interval
+
+        self.mutexes = []  # Mutex adicionales a exportar
+
+        # Instantánea publicada por el hilo de simulación; los lectores solo
+        # leen la referencia (asignación atómica), nunca el estado vivo.
+        # Vacía hasta el primer tick
+        self.latest = b""
+        self._last_publish = float('-inf')
+
+        self.server = None
+        self.server_thread = None
+        self.writer_thread = None
+        self._stop = threading.Event()
+
+    def register_mutex(self, mutex):
+        self.mutexes.append(mutex)
+
+    def start(self):
+        # Sin publicar aquí: collect() leería el estado desde el hilo que
+        # llama, no desde el de simulación. El primer tick publica
+        self._last_publish = float('-inf')
+        self.controller.add_tick_hook(self.publish)
+
+        if self.port is not None:
+            exporter = self
+
+            class Handler(BaseHTTPRequestHandler):
+                def do_GET(self):
+                    if self.path not in ("/", "/metrics"):
+                        self.send_error(404)
+                        return
+                    body = exporter.latest
+                    self.send_response(200)
+                    self.send_header("Content-Type", CONTENT_TYPE)
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+
+                def log_message(self, format, *args):
+                    pass
+
+            self.server = ThreadingHTTPServer((self.host, self.port), Handler)
+            self.port = self.server.server_address[1]
+            self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+            self.server_thread.start()
+
+        if self.textfile:
+            self._stop.clear()
+            self.writer_thread = threading.Thread(target=self._textfile_loop, daemon=True)
+            self.writer_thread.start()
+
+    def stop(self):
+        self.controller.remove_tick_hook(self.publish)
+        self._stop.set()
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+        if self.writer_thread:
+            self.writer_thread.join(timeout=2.0)
+            self.writer_thread = None
+
+    def publish(self, force=False):
+        # Llamado desde el hilo de simulación al final de cada tick (con límite de frecuencia)
+        now = time.monotonic()
+        if not force and now - self._last_publish < self.interval:
+            return
+        self._last_publish = now
+        self.latest = self.collect()
+
+    def _textfile_loop(self):
+        while not self._stop.wait(self.interval):
+            self.write_textfile()
+        self.write_textfile()
+
+    def write_textfile(self):
+        # Escritura atómica para que node_exporter nunca lea un archivo a medias
+        tmp = f"{self.textfile}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(self.latest)
+        os.replace(tmp, self.textfile)
+
+    def collect(self):
+        out = _MetricWriter()
+        scheduler = self.controller.scheduler
+        manager = self.controller.resource_manager
+
+        stats = scheduler.get_stats()
+        resources = manager.get_stats()
+
+        out.add("sim_time_ms", "gauge", "Tiempo simulado actual", stats.current_time)
+        out.add("sim_processes_created_total", "counter", "Procesos admitidos", stats.total_processes)
+        out.add("sim_processes_terminated_total", "counter", "Procesos terminados", stats.terminated)
+        out.add("sim_context_switches_total", "counter", "Cambios de contexto", stats.context_switches)
+        out.add("sim_processes", "gauge", "Procesos por estado", stats.running, {'state': 'running'})
+        out.add("sim_processes", "gauge", "Procesos por estado", stats.ready, {'state': 'ready'})
+        out.add("sim_processes", "gauge", "Procesos por estado", stats.waiting, {'state': 'waiting'})
+        out.add("sim_avg_waiting_time_ms", "gauge", "Tiempo de espera promedio", stats.avg_waiting_time)
+        out.add("sim_avg_turnaround_time_ms", "gauge", "Turnaround promedio", stats.avg_turnaround_time)
+        out.add("sim_avg_response_time_ms", "gauge", "Tiempo de respuesta promedio", stats.avg_response_time)
+
+        out.add("sim_cpus", "gauge", "CPUs totales", resources.cpu.total)
+        out.add("sim_cpus_in_use", "gauge", "CPUs en uso", resources.cpu.in_use)
+        out.add("sim_memory_total_mb", "gauge", "Memoria total", resources.memory.total)
+        out.add("sim_memory_used_mb", "gauge", "Memoria usada", resources.memory.used)
+        out.add("sim_memory_available_mb", "gauge", "Memoria disponible", resources.memory.available)
+        out.add("sim_memory_allocations", "gauge", "Procesos con memoria asignada", resources.processes_with_memory)
+
+        energy = manager.get_energy_stats(stats.terminated)
+        out.add("sim_energy_joules_total", "counter", "Energía consumida por las CPUs", energy.total_energy)
+        out.add("sim_energy_per_job_joules", "gauge", "Energía por trabajo completado", energy.energy_per_job)
+        for core in manager.cores:
+            labels = {'cpu': str(core.index)}
+            out.add("sim_cpu_frequency_mhz", "gauge", "Frecuencia actual de la CPU", core.frequency, labels)
+            out.add("sim_cpu_energy_joules_total", "counter", "Energía consumida por CPU", core.energy, labels)
+
+        if manager.groups:
+            for group in manager.get_group_stats():
+                labels = {'group': group.name}
+                out.add("sim_group_cpu_ms_total", "counter", "Tiempo-núcleo consumido por el grupo", group.cpu_time, labels)
+                out.add("sim_group_completed_total", "counter", "Procesos terminados por grupo", group.completed, labels)
+                out.add("sim_group_throughput", "gauge", "Procesos terminados por segundo simulado", group.throughput, labels)
+                out.add("sim_group_memory_mb", "gauge", "Memoria asignada al grupo", group.memory_used, labels)
+                out.add("sim_group_throttled_total", "counter", "Veces que el grupo agotó su cuota de CPU", group.throttle_count, labels)
+            out.add("sim_group_fairness_jain", "gauge", "Índice de Jain del reparto de CPU por shares", manager.get_fairness_index())
+
+        mutexes = list(self.mutexes)
+        pc = self.controller.get_producer_consumer()
+        if pc:
+            out.add("pc_items_produced_total", "counter", "Items producidos", pc.items_produced)
+            out.add("pc_items_consumed_total", "counter", "Items consumidos", pc.items_consumed)
+            for name, buffer in pc.buffers.items():
+                labels = {'buffer': name}
+                out.add("pc_buffer_items", "gauge", "Items en el buffer", buffer.shared_memory.get_items_count(), labels)
+                out.add("pc_buffer_size", "gauge", "Capacidad del buffer", buffer.shared_memory.size, labels)
+                out.add("pc_buffer_produced_total", "counter", "Items producidos por buffer", buffer.items_produced, labels)
+                out.add("pc_buffer_consumed_total", "counter", "Items consumidos por buffer", buffer.items_consumed, labels)
+                out.add("pc_buffer_producer_wait_ms_total", "counter", "Espera acumulada de productores", buffer.producer_wait_time, labels)
+                out.add("pc_buffer_consumer_wait_ms_total", "counter", "Espera acumulada de consumidores", buffer.consumer_wait_time, labels)
+                mutexes.append(buffer.mutex)
+
+        for mutex in mutexes:
+            labels = {'mutex': mutex.name}
+            out.add("mutex_locked", "gauge", "1 si el mutex está tomado", 1 if mutex.locked else 0, labels)
+            out.add("mutex_waiting", "gauge", "Procesos esperando el mutex", mutex.get_waiting_count(), labels)
+            out.add("mutex_acquires_total", "counter", "Adquisiciones", mutex.total_acquires, labels)
+            out.add("mutex_releases_total", "counter", "Liberaciones", mutex.total_releases, labels)
+            out.add("mutex_blocks_total", "counter", "Bloqueos", mutex.total_blocks, labels)
+            out.add("mutex_wait_ms_total", "counter", "Espera acumulada", mutex.metrics.total_wait_time, labels)
+            out.add("mutex_hold_ms_total", "counter", "Retención acumulada", mutex.metrics.total_hold_time, labels)
+
+        io = self.controller.io
+        if io:
+            now = scheduler.current_time
+            for name, device in io.devices.items():
+                labels = {'device': name}
+                out.add("io_device_queue", "gauge", "Solicitudes en cola del dispositivo", device.waiting, labels)
+                out.add("io_device_utilization", "gauge", "Fracción de tiempo ocupado", device.get_utilization(now), labels)
+                out.add("io_device_completed_total", "counter", "Solicitudes de E/S completadas", device.completed, labels)
+                out.add("io_device_latency_ms_total", "counter", "Latencia acumulada de E/S", device.total_latency, labels)
+
+        return out.render()
@@ -0,0 +1,167 @@
+import csv
+import gzip
+
+
+# Una fila por proceso terminado
+RESULT_COLUMNS = (
+    'pid', 'name', 'burst', 'priority', 'memory',
+    'arrival', 'start', 'finish', 'waiting', 'turnaround', 'response'
+)
+
+CSV = "csv"
+PARQUET = "parquet"
+ARROW = "arrow"
+
+_EXTENSIONS = {
+    '.csv': CSV,
+    '.csv.gz': CSV,
+    '.parquet': PARQUET,
+    '.pq': PARQUET,
+    '.arrow': ARROW,
+    '.feather': ARROW,
+    '.ipc': ARROW
+}
+
+
+def detect_format(path):
+    name = str(path).lower()
+    for extension, format in _EXTENSIONS.items():
+        if name.endswith(extension):
+            return format
+    raise ValueError(f"No se reconoce el formato de {path} (use .csv, .parquet o .arrow)")
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("Se requiere pyarrow para exportar Parquet/Arrow (pip install pyarrow)")
+    return pyarrow
+
+
+def _schema(pa):
+    # Los tiempos pueden ser fraccionarios (modelos de llegada); inicio y
+    # respuesta quedan nulos si el proceso nunca obtuvo la CPU
+    return pa.schema([
+        ('pid', pa.int64()),
+        ('name', pa.string()),
+        ('burst', pa.int64()),
+        ('priority', pa.int64()),
+        ('memory', pa.int64()),
+        ('arrival', pa.float64()),
+        ('start', pa.float64()),
+        ('finish', pa.float64()),
+        ('waiting', pa.float64()),
+        ('turnaround', pa.float64()),
+        ('response', pa.float64())
+    ])
+
+
+class ResultsWriter:
+
+    def __init__(self, path, format=None, batch_size=10000):
+        self.path = path
+        self.format = format or detect_format(path)
+        if self.format not in (CSV, PARQUET, ARROW):
+            raise ValueError(f"Formato no soportado: {self.format}")
+        self.batch_size = max(1, batch_size)
+
+        # Columnas del lote en curso; se vacían en cada flush
+        self.columns = {name: [] for name in RESULT_COLUMNS}
+        self.pending = 0
+        self.rows_written = 0
+
+        self.file = None
+        self.csv_writer = None
+        self.pa = None
+        self.schema = None
+        self.writer = None
+        self._open()
+
+    def _open(self):
+        if self.format == CSV:
+            if str(self.path).endswith(".gz"):
+                self.file = gzip.open(self.path, "wt", newline='', encoding="utf-8")
+            else:
+                self.file = open(self.path, "w", newline='', encoding="utf-8")
+            self.csv_writer = csv.writer(self.file)
+            self.csv_writer.writerow(RESULT_COLUMNS)
+            return
+
+        self.pa = _import_pyarrow()
+        self.schema = _schema(self.pa)
+        if self.format == PARQUET:
+            import pyarrow.parquet as pq
+            self.writer = pq.ParquetWriter(self.path, self.schema)
+        else:
+            self.writer = self.pa.ipc.new_file(self.path, self.schema)
+
+    def write(self, process):
+        # Se puede usar directamente como termination hook del planificador
+        columns = self.columns
+        columns['pid'].append(process.pid)
+        columns['name'].append(process.name)
+        columns['burst'].append(process.burst_time)
+        columns['priority'].append(process.base_priority)
+        columns['memory'].append(process.memory_required)
+        columns['arrival'].append(process.arrival_time)
+        columns['start'].append(process.start_time)
+        columns['finish'].append(process.finish_time)
+        columns['waiting'].append(process.waiting_time)
+        columns['turnaround'].append(process.turnaround_time)
+        columns['response'].append(process.response_time)
+
+        self.pending += 1
+        if self.pending >= self.batch_size:
+            self.flush()
+
+    def write_many(self, processes):
+        for process in processes:
+            self.write(process)
+
+    def flush(self):
+        if not self.pending:
+            return
+
+        if self.format == CSV:
+            self.csv_writer.writerows(zip(*(self.columns[name] for name in RESULT_COLUMNS)))
+        else:
+            # Un record batch por lote: un row group en Parquet
+            batch = self.pa.record_batch(
+                [self.columns[name] for name in RESULT_COLUMNS], schema=self.schema)
+            if self.format == PARQUET:
+                self.writer.write_batch(batch)
+            else:
+                self.writer.write(batch)
+
+        self.rows_written += self.pending
+        self.pending = 0
+        for values in self.columns.values():
+            values.clear()
+
+    def attach(self, scheduler):
+        # Exportación en streaming: cada proceso se escribe al terminar
+        scheduler.add_termination_hook(self.write)
+
+    def detach(self, scheduler):
+        if self.write in scheduler.termination_hooks:
+            scheduler.termination_hooks.remove(self.write)
+
+    def close(self):
+        self.flush()
+        if self.file:
+            self.file.close()
+            self.file = None
+        if self.writer:
+            self.writer.close()
+            self.writer = None
+
+
+def export_results(processes, path, format=None, batch_size=10000):
+    # Exportación de una sola pasada (p. ej. scheduler.terminated_processes al final)
+    writer = ResultsWriter(path, format, batch_size)
+    try:
+        writer.write_many(processes)
+    finally:
+        writer.close()
+    return writer.rows_written
@@ -0,0 +1,248 @@
+import heapq
+from dataclasses import dataclass
+
+
+# Peso de un proceso de prioridad media (equivale a nice 0 en CFS)
+DEFAULT_SHARES = 1024
+DEFAULT_GROUP = "default"
+
+
+def priority_weight(priority):
+    # Prioridad 1 (alta) .. 10 (baja): cada nivel pesa ~25% más que el siguiente
+    return DEFAULT_SHARES * 1.25 ** (5 - priority)
+
+
+def jain_index(values):
+    # (Σx)² / (n·Σx²): 1 = reparto perfecto, 1/n = un solo grupo se lleva todo
+    values = list(values)
+    squares = sum(x * x for x in values)
+    if not values or not squares:
+        return 1.0
+    return sum(values) ** 2 / (len(values) * squares)
+
+
+@dataclass(frozen=True)
+class GroupStats:
+    name: str
+    shares: int
+    cpu_quota: int
+    cpu_period: int
+    memory_limit: int
+    memory_used: int
+    admitted: int
+    completed: int
+    cpu_time: int
+    throughput: float
+    avg_turnaround_time: float
+    throttle_count: int
+
+    def display(self):
+        return {
+            'Shares': self.shares,
+            'Cuota CPU': f"{self.cpu_quota}/{self.cpu_period} ms" if self.cpu_quota else "Sin límite",
+            'Memoria': (f"{self.memory_used}/{self.memory_limit} MB" if self.memory_limit is not None
+                        else f"{self.memory_used} MB"),
+            'Admitidos': self.admitted,
+            'Terminados': self.completed,
+            'Tiempo CPU': f"{self.cpu_time} ms",
+            'Throughput': f"{self.throughput:.2f} proc/s",
+            'Turnaround Promedio': f"{self.avg_turnaround_time:.2f} ms",
+            'Estrangulamientos': self.throttle_count
+        }
+
+
+class ProcessGroup:
+    # Grupo estilo cgroup: shares (peso relativo de CPU), cuota de CPU por
+    # periodo (cpu.max) y límite de memoria (memory.max)
+
+    def __init__(self, name, shares=DEFAULT_SHARES, cpu_quota=None, cpu_period=100,
+                 memory_limit=None, prefix=None):
+        if shares <= 0:
+            raise ValueError("Los shares del grupo deben ser positivos")
+        if cpu_period <= 0 or (cpu_quota is not None and cpu_quota <= 0):
+            raise ValueError("La cuota y el periodo de CPU deben ser positivos")
+        if memory_limit is not None and memory_limit < 0:
+            raise ValueError("El límite de memoria no puede ser negativo")
+
+        self.name = name
+        self.shares = shares
+        self.cpu_quota = cpu_quota
+        self.cpu_period = cpu_period
+        self.memory_limit = memory_limit
+        self.prefix = prefix
+
+        # Cuota: tiempo-núcleo consumido en el periodo en curso
+        self.period_start = 0
+        self.period_usage = 0
+        self.throttle_count = 0
+
+        self.memory_used = 0
+
+        # Estado de la planificación justa (entidad de grupo de CFS)
+        self.vruntime = 0.0
+        self.min_vruntime = 0.0
+        self.tasks = []        # min-heap (vruntime, secuencia, proceso)
+        self.queued = False    # Tiene una entrada válida en el heap de grupos
+        self.version = 0
+
+        # Estadísticas
+        self.admitted = 0
+        self.completed = 0
+        self.cpu_time = 0
+        self.total_turnaround_time = 0
+
+    def _roll_period(self, now):
+        start = now - now % self.cpu_period
+        if start != self.period_start:
+            self.period_start = start
+            self.period_usage = 0
+
+    def charge(self, elapsed, now):
+        self.cpu_time += elapsed
+        if self.cpu_quota is None:
+            return
+        self._roll_period(now)
+        was_throttled = self.period_usage >= self.cpu_quota
+        self.period_usage += elapsed
+        if not was_throttled and self.period_usage >= self.cpu_quota:
+            self.throttle_count += 1
+
+    def is_throttled(self, now):
+        if self.cpu_quota is None:
+            return False
+        self._roll_period(now)
+        return self.period_usage >= self.cpu_quota
+
+    def period_end(self):
+        return self.period_start + self.cpu_period
+
+    def fits_memory(self, amount):
+        return self.memory_limit is None or self.memory_used + amount <= self.memory_limit
+
+    def get_stats(self, elapsed_time):
+        seconds = elapsed_time / 1000
+        return GroupStats(
+            name=self.name,
+            shares=self.shares,
+            cpu_quota=self.cpu_quota,
+            cpu_period=self.cpu_period,
+            memory_limit=self.memory_limit,
+            memory_used=self.memory_used,
+            admitted=self.admitted,
+            completed=self.completed,
+            cpu_time=self.cpu_time,
+            throughput=self.completed / seconds if seconds else 0.0,
+            avg_turnaround_time=self.total_turnaround_time / self.completed if self.completed else 0.0,
+            throttle_count=self.throttle_count
+        )
+
+    def __str__(self):
+        return f"Grupo {self.name}"
+
+
+def resolve_group(groups, process):
+    # Id explícito (process.group) o, si no, el primer prefijo que coincida
+    # con el nombre; los demás procesos caen en el grupo por defecto
+    name = process.group
+    if name is None:
+        for group in groups.values():
+            if group.prefix and process.name.startswith(group.prefix):
+                return group.name
+        name = DEFAULT_GROUP
+    if name not in groups:
+        groups[name] = ProcessGroup(name)
+    return name
+
+
+class FairShareQueue:
+    # CFS de dos niveles: min-heap de grupos por vruntime de grupo y, dentro
+    # de cada grupo, min-heap de procesos por vruntime. Elegir el siguiente es
+    # O(log n); las entradas obsoletas (procesos que se bloquearon o
+    # terminaron, grupos reposicionados) se descartan al llegar a la cima
+
+    def __init__(self, groups):
+        self.groups = groups
+        self.root = ProcessGroup(DEFAULT_GROUP)  # Procesos sin grupo asignado
+        self.heap = []   # (vruntime, secuencia, grupo, versión)
+        self.min_vruntime = 0.0
+        self._seq = 0
+
+    def _group(self, process):
+        return self.groups.get(process.group) or self.root
+
+    def _push_group(self, group):
+        group.version += 1
+        group.queued = True
+        self._seq += 1
+        heapq.heappush(self.heap, (group.vruntime, self._seq, group, group.version))
+
+        # Compactación amortizada de las entradas reposicionadas
+        if len(self.heap) > 4 * len(self.groups) + 64:
+            self.heap = [entry for entry in self.heap if entry[3] == entry[2].version]
+            heapq.heapify(self.heap)
+
+    def push(self, process):
+        group = self._group(process)
+
+        # Un proceso que despierta no acumula crédito por el tiempo dormido
+        if process.vruntime < group.min_vruntime:
+            process.vruntime = group.min_vruntime
+        self._seq += 1
+        process.fair_seq = self._seq
+        heapq.heappush(group.tasks, (process.vruntime, self._seq, process))
+
+        if not group.queued:
+            if group.vruntime < self.min_vruntime:
+                group.vruntime = self.min_vruntime
+            self._push_group(group)
+
+    def _first_task(self, group):
+        tasks = group.tasks
+        while tasks:
+            _, seq, process = tasks[0]
+            if process.fair_seq == seq and process.state == process.READY:
+                return process
+            heapq.heappop(tasks)
+        return None
+
+    def pop(self, now):
+        # Los grupos sin cuota disponible se apartan y se reinsertan al final
+        throttled = []
+        chosen = None
+        while self.heap:
+            vruntime, _, group, version = self.heap[0]
+            if version != group.version:
+                heapq.heappop(self.heap)
+                continue
+
+            process = self._first_task(group)
+            if process is None:
+                heapq.heappop(self.heap)
+                group.queued = False
+                continue
+
+            if group.is_throttled(now):
+                throttled.append(heapq.heappop(self.heap))
+                continue
+
+            heapq.heappop(group.tasks)
+            self.min_vruntime = max(self.min_vruntime, vruntime)
+            group.min_vruntime = max(group.min_vruntime, process.vruntime)
+            if self._first_task(group) is None:
+                # Grupo sin más procesos listos: sale del heap hasta que vuelva a tenerlos
+                heapq.heappop(self.heap)
+                group.queued = False
+            chosen = process
+            break
+
+        for entry in throttled:
+            heapq.heappush(self.heap, entry)
+        return chosen
+
+    def charge(self, process, elapsed):
+        # vruntime avanza más lento cuanto mayor es el peso (prioridad / shares)
+        group = self._group(process)
+        process.vruntime += elapsed * DEFAULT_SHARES / priority_weight(process.priority)
+        group.vruntime += elapsed * DEFAULT_SHARES / group.shares
+        if group.queued:
+            self._push_group(group)
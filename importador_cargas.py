@@ -0,0 +1,134 @@
+import csv
+
+from Proyecto_Final_SO.trazas import ARRIVAL, TraceReplayer
+
+
+DEFAULT_COLUMNS = {
+    'pid': 'pid',
+    'arrival': 'arrival',
+    'burst': 'burst',
+    'priority': 'priority',
+    'memory': 'memory'
+}
+
+
+def iter_csv_chunks(path, chunk_size=10000, delimiter=','):
+    # Lee el CSV por bloques de filas; nunca carga el archivo completo
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f, delimiter=delimiter)
+        chunk = []
+        for row in reader:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def iter_parquet_chunks(path, chunk_size=10000, columns=None):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Se requiere pyarrow para leer archivos Parquet (pip install pyarrow)")
+
+    parquet_file = pq.ParquetFile(path)
+    for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=columns):
+        yield batch.to_pylist()
+
+
+class WorkloadImporter:
+
+    def __init__(self, scheduler, resource_manager, columns=None, time_scale=1.0,
+                 default_priority=5, default_memory=100, chunk_size=10000, time_slice=10):
+        self.scheduler = scheduler
+        self.resource_manager = resource_manager
+        self.columns = dict(DEFAULT_COLUMNS, **(columns or {}))
+        self.time_scale = time_scale  # p. ej. 1000 si la traza viene en segundos
+        self.default_priority = default_priority
+        self.default_memory = default_memory
+        self.chunk_size = chunk_size
+
+        self.replayer = TraceReplayer(scheduler, resource_manager, time_slice)
+
+        # Estadísticas
+        self.rows_read = 0
+        self.rows_invalid = 0
+        self.rows_out_of_order = 0
+        self._last_arrival = None
+
+    def run(self, path, drain=True):
+        return self.replayer.replay_events(self.iter_arrivals(path), drain)
+
+    def iter_arrivals(self, path):
+        for chunk in self._iter_chunks(path):
+            events = []
+            for row in chunk:
+                self.rows_read += 1
+                event = self._row_to_event(row)
+                if event is None:
+                    self.rows_invalid += 1
+                    continue
+                events.append(event)
+
+            # Cada bloque se ordena por llegada. Una fila anterior a la última
+            # llegada de un bloque previo se descarta: el reloj ya pasó ese
+            # instante y reproducirla adelantaría su llegada
+            events.sort(key=lambda e: e['t'])
+            for event in events:
+                if self._last_arrival is not None and event['t'] < self._last_arrival:
+                    self.rows_out_of_order += 1
+                    continue
+                self._last_arrival = event['t']
+                yield event
+
+    def _iter_chunks(self, path):
+        if str(path).endswith(('.parquet', '.pq')):
+            return iter_parquet_chunks(path, self.chunk_size)
+        return iter_csv_chunks(path, self.chunk_size)
+
+    def _row_to_event(self, row):
+        cols = self.columns
+        try:
+            arrival = float(row[cols['arrival']]) * self.time_scale
+            burst = int(float(row[cols['burst']]) * self.time_scale)
+        except (KeyError, TypeError, ValueError):
+            return None
+
+        if burst <= 0 or arrival < 0:
+            return None
+
+        priority = self._optional_int(row, 'priority', self.default_priority)
+        memory = self._optional_int(row, 'memory', self.default_memory)
+        # pid 0 es válido: solo falta si la columna no existe o está vacía
+        pid = row.get(cols['pid'])
+        if pid in (None, ''):
+            pid = self.rows_read
+
+        return {
+            't': int(arrival),
+            'e': ARRIVAL,
+            'pid': pid,
+            'n': f"Job{pid}",
+            'b': burst,
+            'p': max(1, min(10, priority)),
+            'm': memory
+        }
+
+    def _optional_int(self, row, key, default):
+        value = row.get(self.columns[key])
+        if value in (None, ''):
+            return default
+        try:
+            return int(float(value))
+        except (TypeError, ValueError):
+            return default
+
+    def get_statistics(self):
+        stats = {
+            'Filas Leídas': self.rows_read,
+            'Filas Inválidas': self.rows_invalid,
+            'Fuera de Orden (Descartadas)': self.rows_out_of_order
+        }
+        stats.update(self.replayer.get_statistics())
+        return stats
@@ -0,0 +1,77 @@
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+# Duración máxima de un intervalo fusionado: uno más largo (p. ej. un
+# productor de ráfaga 999999 ms) se parte, para que una ventana solo recorra
+# los intervalos que empiezan a menos de esta distancia de ella
+MAX_INTERVAL = 1000
+
+class TimelineRecorder:
+    # Intervalos de ejecución (cpu, pid, inicio, fin) en arreglos compactos:
+    # 28 bytes por intervalo en vez de una tupla de objetos por rebanada. Los
+    # tiempos son 'd': con núcleos escalados por velocidad no son enteros
+
+    def __init__(self):
+        self.cpus = array('i')
+        self.pids = array('q')
+        self.starts = array('d')
+        self.ends = array('d')
+
+        self.last_index = {}   # cpu -> índice de su último intervalo
+        self.max_length = 0    # Duración máxima, acota la búsqueda por ventana
+        self.busy_time = 0
+        self.slices_recorded = 0
+
+    def record(self, cpu, pid, start, end):
+        self.slices_recorded += 1
+        self.busy_time += end - start
+
+        # Rebanada contigua del mismo proceso en el mismo CPU: se extiende
+        # mientras no supere MAX_INTERVAL
+        index = self.last_index.get(cpu)
+        if (index is not None and self.pids[index] == pid and self.ends[index] == start
+                and end - self.starts[index] <= MAX_INTERVAL):
+            self.ends[index] = end
+            length = end - self.starts[index]
+        else:
+            self.last_index[cpu] = len(self.starts)
+            self.cpus.append(cpu)
+            self.pids.append(pid)
+            self.starts.append(start)
+            self.ends.append(end)
+            length = end - start
+
+        if length > self.max_length:
+            self.max_length = length
+
+    def __len__(self):
+        return len(self.starts)
+
+    def get_span(self):
+        if not self.starts:
+            return (0, 0)
+        return (self.starts[0], max(self.ends[index] for index in self.last_index.values()))
+
+    def query(self, t0, t1):
+        # Los inicios son crecientes: búsqueda binaria en vez de recorrer
+        # todo el historial; solo se devuelven intervalos que tocan [t0, t1).
+        # max_length queda acotado por MAX_INTERVAL (o por una rebanada sola)
+        lo = bisect_left(self.starts, t0 - self.max_length)
+        hi = bisect_right(self.starts, t1)
+        for i in range(lo, hi):
+            if self.ends[i] > t0 and self.starts[i] < t1:
+                yield self.cpus[i], self.pids[i], self.starts[i], self.ends[i]
+
+    def clear(self):
+        self.__init__()
+
+    def get_statistics(self):
+        start, end = self.get_span()
+        return {
+            'Intervalos': len(self),
+            'Rebanadas Registradas': self.slices_recorded,
+            'Tiempo Ocupado': f"{self.busy_time} ms",
+            'Rango': f"{start:.0f} - {end:.0f} ms",
+            'Memoria': f"{sum(a.itemsize * len(a) for a in (self.cpus, self.pids, self.starts, self.ends)) / 1024:.1f} KB"
+        }
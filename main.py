@@ -1,33 +1,46 @@
-try:
-    import tkinter as tk
-    from tkinter import ttk, scrolledtext, messagebox
-except ImportError:
-    print("Error: tkinter no está disponible")
-    exit(1)
+import argparse
+import sys
+
+from Proyecto_Final_SO.config import Config
+from Proyecto_Final_SO.nucleo_procesos import Process, Scheduler, SimulationController
+from Proyecto_Final_SO.administrador_recursos import ResourceManager
+
+# tkinter se carga al abrir la GUI: importar este módulo o correr sin interfaz
+# no lo requiere ni paga su costo de arranque
+tk = ttk = scrolledtext = messagebox = None
+
+
+def _load_tkinter():
+    global tk, ttk, scrolledtext, messagebox
+    if tk is None:
+        import tkinter
+        from tkinter import ttk as _ttk, scrolledtext as _scrolledtext, messagebox as _messagebox
+        tk, ttk, scrolledtext, messagebox = tkinter, _ttk, _scrolledtext, _messagebox
 
-from config import Config
-from nucleo_procesos import Process, Scheduler, SimulationController
-from administrador_recursos import ResourceManager
 
 class ProcessSchedulerGUI:
 
 
-    def __init__(self, root):
+    def __init__(self, root, config=None):
+        _load_tkinter()
         self.root = root
         self.root.title("Simulador de Planificación de Procesos")
         self.root.geometry("1400x850")
         self.root.configure(bg='#2C3E50')
 
-        # Cargar configuración
-        self.config = Config()
+        # Cargar configuración (archivo + entorno si no se pasa una)
+        self.config = config or Config()
 
         # Crear componentes
         self.scheduler = Scheduler(
-            algorithm=self.config.scheduling_algorithm
+            algorithm=self.config.scheduling_algorithm,
+            core_speeds=self.config.core_speeds
         )
         self.resource_manager = ResourceManager(
             num_cpus=self.config.num_cpus,
-            total_memory=self.config.total_memory
+            total_memory=self.config.total_memory,
+            governor=self.config.governor,
+            core_speeds=self.config.core_speeds
         )
         self.controller = SimulationController(
             self.scheduler,
@@ -194,6 +207,28 @@ class ProcessSchedulerGUI:
             cursor='hand2'
         ).pack(pady=5)
 
+        tk.Button(
+            frame,
+            text="Perfilado",
+            command=self.show_profiling_panel,
+            bg='#16A085',
+            fg='white',
+            font=('Arial', 9, 'bold'),
+            width=20,
+            cursor='hand2'
+        ).pack(pady=5)
+
+        tk.Button(
+            frame,
+            text="Línea de Tiempo",
+            command=self.show_timeline_panel,
+            bg='#8E44AD',
+            fg='white',
+            font=('Arial', 9, 'bold'),
+            width=20,
+            cursor='hand2'
+        ).pack(pady=5)
+
         # Velocidad
         speed_frame = tk.Frame(frame, bg='#ECF0F1')
         speed_frame.pack(pady=(10, 0))
@@ -360,9 +395,8 @@ class ProcessSchedulerGUI:
         # Recopilar todos los procesos
         all_processes = []
 
-        # Proceso en ejecución
-        if self.scheduler.running_process:
-            all_processes.append(self.scheduler.running_process)
+        # Procesos en ejecución (uno por núcleo)
+        all_processes.extend(self.scheduler.get_running_processes())
 
         # Cola de listos
         all_processes.extend(self.scheduler.ready_queue)
@@ -632,20 +666,21 @@ class ProcessSchedulerGUI:
         self.draw_producer_consumer()
 
         # Actualizar estadísticas
-        stats = self.scheduler.get_statistics()
-        self.stats_labels['Algoritmo'].config(text=stats['Algoritmo'])
-        self.stats_labels['Tiempo'].config(text=stats['Tiempo Actual'])
-        self.stats_labels['Procesos Totales'].config(text=stats['Procesos Totales'])
-        self.stats_labels['En Cola Listos'].config(text=stats['En Cola Listos'])
-        self.stats_labels['En Espera'].config(text=stats['Esperando'])
-        self.stats_labels['Terminados'].config(text=stats['Terminados'])
-        self.stats_labels['Tiempo Espera Prom.'].config(text=stats['Tiempo Espera Promedio'])
+        # El formato se aplica aquí; el planificador entrega números
+        stats = self.scheduler.get_stats()
+        self.stats_labels['Algoritmo'].config(text=stats.algorithm)
+        self.stats_labels['Tiempo'].config(text=f"{stats.current_time} ms")
+        self.stats_labels['Procesos Totales'].config(text=stats.total_processes)
+        self.stats_labels['En Cola Listos'].config(text=stats.ready)
+        self.stats_labels['En Espera'].config(text=stats.waiting)
+        self.stats_labels['Terminados'].config(text=stats.terminated)
+        self.stats_labels['Tiempo Espera Prom.'].config(text=f"{stats.avg_waiting_time:.2f} ms")
 
         # Recursos
-        cpu_usage = self.resource_manager.get_cpu_usage()
-        mem_usage = self.resource_manager.get_memory_usage()
-        self.stats_labels['CPU Uso'].config(text=cpu_usage['Uso'])
-        self.stats_labels['Memoria Uso'].config(text=mem_usage['Uso'])
+        cpu_usage = self.resource_manager.get_cpu_stats()
+        mem_usage = self.resource_manager.get_memory_stats()
+        self.stats_labels['CPU Uso'].config(text=f"{cpu_usage.usage_percent:.1f}%")
+        self.stats_labels['Memoria Uso'].config(text=f"{mem_usage.usage_percent:.1f}%")
 
         # Actualizar log
         self._update_log()
@@ -749,6 +784,186 @@ class ProcessSchedulerGUI:
         else:
             messagebox.showwarning("Productor-Consumidor", msg)
 
+    def show_profiling_panel(self):
+        self.controller.enable_profiling()
+
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Perfilado de la Simulación")
+        dialog.geometry("720x480")
+        dialog.configure(bg='#ECF0F1')
+
+        text = scrolledtext.ScrolledText(
+            dialog,
+            font=('Courier', 9),
+            bg='#1E1E1E',
+            fg='#AABBCC'
+        )
+        text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        btn_frame = tk.Frame(dialog, bg='#ECF0F1')
+        btn_frame.pack(pady=(0, 10))
+
+        def capture():
+            if self.controller.profiler:
+                self.controller.profiler.start_capture(ticks=100, cpu=True, memory=True)
+
+        def refresh():
+            if not dialog.winfo_exists():
+                return
+
+            report = self.controller.get_profiling_report()
+            text.delete('1.0', tk.END)
+            if report:
+                for key, value in report['Resumen'].items():
+                    text.insert(tk.END, f"{key}: {value}\n")
+                text.insert(tk.END, "\n")
+
+                text.insert(tk.END, f"{'Fase':<18}{'Llamadas':>10}{'Promedio':>12}{'p99':>12}{'Máximo':>12}{'% Tick':>9}\n")
+                for phase, stats in report['Fases'].items():
+                    text.insert(tk.END, f"{phase:<18}{stats['Llamadas']:>10}{stats['Promedio']:>12}"
+                                        f"{stats['p99']:>12}{stats['Máximo']:>12}{stats['% Tick']:>9}\n")
+
+                if report['Captura']:
+                    text.insert(tk.END, "\n" + report['Captura'].get('cpu', ''))
+                    text.insert(tk.END, "\n" + report['Captura'].get('memory', ''))
+
+            dialog.after(1000, refresh)
+
+        def close():
+            self.controller.disable_profiling()
+            dialog.destroy()
+
+        tk.Button(
+            btn_frame,
+            text="Capturar 100 ticks",
+            command=capture,
+            bg='#2980B9',
+            fg='white',
+            font=('Arial', 10, 'bold'),
+            width=20,
+            cursor='hand2'
+        ).pack(side=tk.LEFT, padx=5)
+
+        tk.Button(
+            btn_frame,
+            text="Cerrar",
+            command=close,
+            bg='#95A5A6',
+            fg='white',
+            font=('Arial', 10, 'bold'),
+            width=20,
+            cursor='hand2'
+        ).pack(side=tk.LEFT, padx=5)
+
+        dialog.protocol("WM_DELETE_WINDOW", close)
+        refresh()
+
+    def show_timeline_panel(self):
+        timeline = self.controller.enable_timeline()
+
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Línea de Tiempo (Gantt)")
+        dialog.geometry("1000x300")
+        dialog.configure(bg='#ECF0F1')
+
+        canvas = tk.Canvas(dialog, bg='white', height=200)
+        canvas.pack(fill=tk.BOTH, expand=True, padx=10, pady=(10, 0))
+
+        # La barra no desplaza el canvas: define la ventana de tiempo a dibujar
+        scrollbar = tk.Scrollbar(dialog, orient=tk.HORIZONTAL)
+        scrollbar.pack(fill=tk.X, padx=10)
+
+        info = tk.Label(dialog, bg='#ECF0F1', font=('Arial', 9))
+        info.pack()
+
+        palette = ['#3498DB', '#E74C3C', '#2ECC71', '#F39C12', '#9B59B6',
+                   '#1ABC9C', '#E67E22', '#34495E', '#D35400', '#27AE60']
+        view = {'start': 0, 'ms_per_px': 2.0, 'follow': True}
+        row_height = 40
+        top = 25
+
+        def window():
+            width = max(1, canvas.winfo_width())
+            return view['start'], view['start'] + width * view['ms_per_px']
+
+        def draw():
+            canvas.delete('all')
+            t0, t1 = window()
+            scale = view['ms_per_px']
+
+            # Marcas de tiempo
+            step = max(1, int(100 * scale))
+            mark = (int(t0) // step + 1) * step
+            while mark < t1:
+                x = (mark - t0) / scale
+                canvas.create_line(x, 15, x, canvas.winfo_height(), fill='#ECF0F1')
+                canvas.create_text(x, 8, text=f"{mark}", font=('Arial', 7), fill='#7F8C8D')
+                mark += step
+
+            # Solo los intervalos visibles; los menores a un píxel se agrupan
+            last_x = {}
+            for cpu, pid, start, end in timeline.query(t0, t1):
+                x0 = max(0, (start - t0) / scale)
+                x1 = (end - t0) / scale
+                if x1 - last_x.get(cpu, -1) < 1:
+                    continue
+                y0 = top + cpu * row_height
+                canvas.create_rectangle(x0, y0, x1, y0 + row_height - 8,
+                                        fill=palette[pid % len(palette)], outline='')
+                if x1 - x0 > 30:
+                    canvas.create_text((x0 + x1) / 2, y0 + (row_height - 8) / 2,
+                                       text=f"P{pid}", fill='white', font=('Arial', 8, 'bold'))
+                last_x[cpu] = x1
+
+            span_start, span_end = timeline.get_span()
+            total = max(1, span_end - span_start)
+            scrollbar.set((t0 - span_start) / total, (t1 - span_start) / total)
+            info.config(text=f"{int(t0)} - {int(t1)} ms  |  {len(timeline)} intervalos  |  "
+                             f"{view['ms_per_px']:g} ms/px")
+
+        def on_scroll(*args):
+            span_start, span_end = timeline.get_span()
+            t0, t1 = window()
+            if args[0] == 'moveto':
+                view['start'] = span_start + float(args[1]) * (span_end - span_start)
+            elif args[0] == 'scroll':
+                amount = int(args[1]) * (t1 - t0) * (0.9 if args[2] == 'pages' else 0.1)
+                view['start'] += amount
+            view['start'] = max(span_start, min(view['start'], span_end - (t1 - t0)))
+            view['follow'] = view['start'] + (t1 - t0) >= span_end
+            draw()
+
+        def zoom(factor):
+            t0, t1 = window()
+            center = (t0 + t1) / 2
+            view['ms_per_px'] = max(0.1, view['ms_per_px'] * factor)
+            t0, t1 = window()
+            view['start'] = max(0, center - (t1 - t0) / 2)
+            draw()
+
+        def refresh():
+            if not dialog.winfo_exists():
+                return
+            if view['follow']:
+                t0, t1 = window()
+                view['start'] = max(0, timeline.get_span()[1] - (t1 - t0))
+            draw()
+            dialog.after(500, refresh)
+
+        scrollbar.config(command=on_scroll)
+
+        btn_frame = tk.Frame(dialog, bg='#ECF0F1')
+        btn_frame.pack(pady=(0, 10))
+
+        tk.Button(btn_frame, text="Acercar", command=lambda: zoom(0.5),
+                  width=10, cursor='hand2').pack(side=tk.LEFT, padx=5)
+        tk.Button(btn_frame, text="Alejar", command=lambda: zoom(2.0),
+                  width=10, cursor='hand2').pack(side=tk.LEFT, padx=5)
+        tk.Button(btn_frame, text="Cerrar", command=dialog.destroy,
+                  width=10, cursor='hand2').pack(side=tk.LEFT, padx=5)
+
+        refresh()
+
     def on_right_click(self, event):
         # Obtener coordenadas del clic
         x, y = event.x, event.y
@@ -769,8 +984,7 @@ class ProcessSchedulerGUI:
 
         # Recopilar todos los procesos
         all_processes = []
-        if self.scheduler.running_process:
-            all_processes.append(self.scheduler.running_process)
+        all_processes.extend(self.scheduler.get_running_processes())
         all_processes.extend(self.scheduler.ready_queue)
         all_processes.extend(self.scheduler.waiting_queue)
         all_processes.extend(self.scheduler.terminated_processes[-5:])
@@ -844,8 +1058,7 @@ class ProcessSchedulerGUI:
         # Recopilar procesos activos (no terminados)
         active_processes = []
 
-        if self.scheduler.running_process:
-            active_processes.append(self.scheduler.running_process)
+        active_processes.extend(self.scheduler.get_running_processes())
         active_processes.extend(self.scheduler.ready_queue)
         active_processes.extend(self.scheduler.waiting_queue)
 
@@ -941,11 +1154,77 @@ class ProcessSchedulerGUI:
         ).pack(side=tk.LEFT, padx=5)
 
 
-def main():
+def run_headless(ticks=1000, config=None, seed=None, metrics_port=None, metrics_textfile=None):
+    # Simulación sin interfaz ni pausas entre ticks (barridos, workers, CI).
+    # Con metrics_port o metrics_textfile se exportan métricas Prometheus
+    import random
+    if seed is not None:
+        random.seed(seed)
+
+    config = config or Config()
+    scheduler = Scheduler(algorithm=config.scheduling_algorithm, core_speeds=config.core_speeds)
+    resource_manager = ResourceManager(
+        num_cpus=config.num_cpus,
+        total_memory=config.total_memory,
+        governor=config.governor,
+        core_speeds=config.core_speeds
+    )
+    controller = SimulationController(scheduler, resource_manager, config)
+
+    exporter = None
+    if metrics_port is not None or metrics_textfile:
+        exporter = controller.start_metrics_exporter(port=metrics_port, textfile=metrics_textfile)
+    try:
+        for _ in range(ticks):
+            controller._tick()
+    finally:
+        if exporter:
+            # Estado final, publicado desde este mismo hilo (el de simulación)
+            exporter.publish(force=True)
+            exporter.stop()
+    return controller
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulador de Planificación de Procesos")
+    parser.add_argument('--headless', action='store_true', help="Ejecutar sin interfaz gráfica")
+    parser.add_argument('--ticks', type=int, default=1000, help="Ticks a simular sin interfaz")
+    parser.add_argument('--seed', type=int, help="Semilla aleatoria (sin interfaz)")
+    parser.add_argument('--metrics-port', type=int,
+                        help="Servir métricas Prometheus en este puerto (sin interfaz)")
+    parser.add_argument('--metrics-textfile',
+                        help="Escribir métricas Prometheus en este archivo (sin interfaz)")
+    Config.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    try:
+        config = Config.from_args(args)
+    except (ValueError, FileNotFoundError) as e:
+        print(f"Error de configuración: {e}")
+        return 2
+
+    if args.headless:
+        controller = run_headless(args.ticks, config, seed=args.seed, metrics_port=args.metrics_port,
+                                  metrics_textfile=args.metrics_textfile)
+        for key, value in controller.scheduler.get_stats().display().items():
+            print(f"{key}: {value}")
+        return 0
+
+    try:
+        _load_tkinter()
+    except ImportError:
+        print("Error: tkinter no está disponible (use --headless para correr sin interfaz)")
+        return 1
+
     root = tk.Tk()
-    app = ProcessSchedulerGUI(root)
+    app = ProcessSchedulerGUI(root, config)
     root.mainloop()
+    return 0
+
+
+def headless_main(argv=None):
+    return main(['--headless'] + list(sys.argv[1:] if argv is None else argv))
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,103 @@
+import math
+import random
+
+
+class PoissonArrivals:
+    # Llegadas de Poisson: tiempos entre llegadas exponenciales
+
+    def __init__(self, mean_interval, rng=None):
+        if mean_interval <= 0:
+            raise ValueError("El intervalo medio debe ser positivo")
+        self.mean_interval = mean_interval
+        self.rng = rng or random
+
+    def next_arrival(self, current_time):
+        return current_time + self.rng.expovariate(1.0 / self.mean_interval)
+
+    def __str__(self):
+        return f"Poisson(media={self.mean_interval}ms)"
+
+
+class BurstyArrivals:
+    # Proceso de Poisson modulado por Markov (MMPP) de dos estados:
+    # ráfagas con llegadas frecuentes alternadas con periodos de calma
+
+    def __init__(self, burst_interval, calm_interval, mean_burst_duration,
+                 mean_calm_duration, rng=None):
+        if min(burst_interval, calm_interval, mean_burst_duration, mean_calm_duration) <= 0:
+            raise ValueError("Los parámetros del modelo en ráfagas deben ser positivos")
+        self.burst_interval = burst_interval
+        self.calm_interval = calm_interval
+        self.mean_burst_duration = mean_burst_duration
+        self.mean_calm_duration = mean_calm_duration
+        self.rng = rng or random
+
+        self.in_burst = False
+        self.state_ends = None
+
+    def next_arrival(self, current_time):
+        t = current_time
+        if self.state_ends is None:
+            self.state_ends = t + self._state_duration()
+
+        while True:
+            interval = self.burst_interval if self.in_burst else self.calm_interval
+            candidate = t + self.rng.expovariate(1.0 / interval)
+            if candidate <= self.state_ends:
+                return candidate
+
+            # Sin memoria: al cambiar de estado se vuelve a muestrear desde el borde
+            t = self.state_ends
+            self.in_burst = not self.in_burst
+            self.state_ends = t + self._state_duration()
+
+    def _state_duration(self):
+        mean = self.mean_burst_duration if self.in_burst else self.mean_calm_duration
+        return self.rng.expovariate(1.0 / mean)
+
+    def __str__(self):
+        return f"Ráfagas(ráfaga={self.burst_interval}ms, calma={self.calm_interval}ms)"
+
+
+class DiurnalArrivals:
+    # Poisson no homogéneo con tasa sinusoidal (ciclo día/noche), por adelgazamiento
+
+    def __init__(self, mean_interval, amplitude=0.5, period=86_400_000, phase=0.0, rng=None):
+        if mean_interval <= 0 or period <= 0:
+            raise ValueError("El intervalo medio y el periodo deben ser positivos")
+        if not 0 <= amplitude <= 1:
+            raise ValueError("La amplitud debe estar entre 0 y 1")
+        self.mean_interval = mean_interval
+        self.amplitude = amplitude
+        self.period = period
+        self.phase = phase
+        self.rng = rng or random
+
+    def rate(self, t):
+        base = 1.0 / self.mean_interval
+        return base * (1 + self.amplitude * math.sin(2 * math.pi * (t / self.period) + self.phase))
+
+    def next_arrival(self, current_time):
+        max_rate = (1.0 / self.mean_interval) * (1 + self.amplitude)
+        t = current_time
+        while True:
+            t += self.rng.expovariate(max_rate)
+            if self.rng.random() * max_rate <= self.rate(t):
+                return t
+
+    def __str__(self):
+        return f"Diurno(media={self.mean_interval}ms, amplitud={self.amplitude})"
+
+
+class GeneratorArrivals:
+    # Intervalos uniformes de ProcessGenerator.get_next_interval (en segundos)
+
+    def __init__(self, generator, scale=1000):
+        self.generator = generator
+        self.scale = scale
+
+    def next_arrival(self, current_time):
+        return current_time + self.generator.get_next_interval() * self.scale
+
+    def __str__(self):
+        return f"Uniforme({self.generator.min_interval}-{self.generator.max_interval}s)"
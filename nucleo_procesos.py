@@ -1,7 +1,13 @@
 from __future__ import annotations
-import threading
+import heapq
+import itertools
+import math
 import time
 import random
+from array import array
+from dataclasses import dataclass
+
+from Proyecto_Final_SO import constantes
 
 
 class Process:
@@ -12,17 +18,40 @@ class Process:
     WAITING = "Esperando"
     TERMINATED = "Terminado"
 
-    def __init__(self, name, burst_time, priority=None, memory_required=100):
+    def __init__(self, name, burst_time, priority=None, memory_required=100, bursts=None, width=1,
+                 group=None, deadline=None, period=None):
         Process._id_counter += 1
         self.pid = Process._id_counter
         self.name = name
+
+        # Perfil de ráfagas alternadas CPU, E/S, CPU, ..., CPU (None = una sola
+        # ráfaga de CPU); burst_time pasa a ser el total de CPU del perfil
+        self.bursts = None
+        if bursts:
+            if len(bursts) % 2 == 0:
+                raise ValueError("El perfil de ráfagas debe empezar y terminar con CPU")
+            self.bursts = array('I', bursts)
+            burst_time = sum(self.bursts[0::2])
+        self.burst_index = 0
+        self.burst_remaining = self.bursts[0] if self.bursts else burst_time
+        self.io_time = 0
+
+        # Predicción de la siguiente ráfaga (promedio exponencial, SJF)
+        self.predicted_burst = None
+        self.burst_used = 0
+
         self.burst_time = burst_time
         self.remaining_time = burst_time
         self.priority = priority if priority else random.randint(1, 10)
+        self.base_priority = self.priority  # Prioridad sin herencia/techo
         self.memory_required = memory_required
 
         self.state = Process.READY
         self.assigned_cpu = False
+        # Trabajo paralelo: width hilos que se despachan juntos (gang scheduling)
+        self.width = max(1, width)
+        self.cores = ()
+        self.core = None  # Primer núcleo asignado (o el último usado)
         self.assigned_memory = 0
 
         self.arrival_time = 0
@@ -34,6 +63,22 @@ class Process:
 
         self.time_quantum_used = 0
 
+        # Grupo de recursos (id explícito; None = se resuelve por prefijo del nombre)
+        # y tiempo virtual de la planificación justa (CFS)
+        self.group = group
+        self.vruntime = 0.0
+        self.fair_seq = 0
+        # Orden de llegada a la cola de listos: desempata claves iguales
+        self.ready_seq = 0
+
+        # Tiempo real: plazo absoluto y periodo de la tarea (EDF / RM)
+        self.deadline = deadline
+        self.period = period
+
+        # Sincronización: mutex retenidos y mutex por el que espera
+        self.held_mutexes = set()
+        self.blocked_on = None
+
     def set_state(self, new_state):
         old_state = self.state
         self.state = new_state
@@ -52,12 +97,16 @@ class Process:
         else:
             self.set_state(Process.TERMINATED)
 
-    def execute(self, time_slice):
+    def execute(self, time_slice, speed=1.0):
         if self.state != Process.RUNNING:
             return False
 
-        execution_time = min(time_slice, self.remaining_time)
+        # speed < 1: CPU a menor frecuencia, avanza menos trabajo por rebanada
+        work = time_slice if speed == 1.0 else max(1, round(time_slice * speed))
+        execution_time = min(work, self.remaining_time, self.burst_remaining)
         self.remaining_time -= execution_time
+        self.burst_remaining -= execution_time
+        self.burst_used += execution_time
         self.time_quantum_used += execution_time
 
         if self.remaining_time <= 0:
@@ -67,6 +116,22 @@ class Process:
 
         return False
 
+    def cpu_burst_finished(self):
+        # Fin de una ráfaga de CPU que no es la última: sigue una de E/S
+        return self.bursts is not None and self.burst_remaining <= 0 < self.remaining_time
+
+    def next_io_burst(self):
+        io_burst = self.bursts[self.burst_index + 1]
+        self.burst_index += 2
+        self.burst_remaining = self.bursts[self.burst_index]
+        return io_burst
+
+    def end_cpu_burst(self, alpha):
+        # τ(n+1) = α·t(n) + (1 - α)·τ(n), con t(n) la ráfaga observada
+        if self.burst_used and self.predicted_burst is not None:
+            self.predicted_burst = alpha * self.burst_used + (1 - alpha) * self.predicted_burst
+            self.burst_used = 0
+
     def is_finished(self):
         return self.remaining_time <= 0 or self.state == Process.TERMINATED
 
@@ -80,7 +145,7 @@ class Process:
         if self.state == Process.TERMINATED and self.finish_time is None:
             self.finish_time = current_time
             self.turnaround_time = self.finish_time - self.arrival_time
-            self.waiting_time = self.turnaround_time - self.burst_time
+            self.waiting_time = self.turnaround_time - self.burst_time - self.io_time
             if self.response_time is None and self.start_time is not None:
                 self.response_time = self.start_time - self.arrival_time
 
@@ -105,165 +170,705 @@ class Process:
     def reset_counter():
         Process._id_counter = 0
 
-class Scheduler:
-    SJF = "SJF"
-    PRIORITY = "Prioridad"
+@dataclass(frozen=True)
+class SchedulerStats:
+    algorithm: str
+    current_time: int
+    total_processes: int
+    running: int
+    ready: int
+    waiting: int
+    terminated: int
+    context_switches: int
+    avg_waiting_time: float
+    avg_turnaround_time: float
+    avg_response_time: float
+    throughput: float
+    makespan: int
+    utilization: float
+    fragmentation: float
+    backfilled: int
+
+    def display(self):
+        # Formato de presentación (solo para la GUI / reportes)
+        return {
+            'Algoritmo': self.algorithm,
+            'Quantum': "N/A",
+            'Tiempo Actual': f"{self.current_time} ms",
+            'Procesos Totales': self.total_processes,
+            'En Ejecución': self.running,
+            'En Cola Listos': self.ready,
+            'Esperando': self.waiting,
+            'Terminados': self.terminated,
+            'Context Switches': self.context_switches,
+            'Tiempo Espera Promedio': f"{self.avg_waiting_time:.2f} ms",
+            'Turnaround Promedio': f"{self.avg_turnaround_time:.2f} ms",
+            'Tiempo Respuesta Promedio': f"{self.avg_response_time:.2f} ms",
+            'Throughput': f"{self.throughput:.2f} proc/s",
+            'Makespan': f"{self.makespan} ms",
+            'Utilización CPU': f"{self.utilization * 100:.1f}%",
+            'Fragmentación': f"{self.fragmentation * 100:.1f}%",
+            'Rellenos (backfill)': self.backfilled
+        }
 
-    def __init__(self, algorithm=SJF):
+class Scheduler:
+    SJF = constantes.SJF
+    PRIORITY = constantes.PRIORITY
+    FAIR = constantes.FAIR
+    EDF = constantes.EDF
+    RM = constantes.RM
+    ALGORITHMS = constantes.ALGORITHMS
+
+    # Relleno (backfilling) para trabajos paralelos
+    EASY = "EASY"
+    CONSERVATIVE = "Conservador"
+
+    def __init__(self, algorithm=SJF, burst_prediction=False, prediction_alpha=0.5,
+                 initial_prediction=100, core_speeds=None):
         self.algorithm = algorithm
         self.current_time = 0
 
+        # Un proceso en ejecución por núcleo; la velocidad relativa de cada
+        # núcleo (big.LITTLE) decide dónde se coloca cada proceso
+        self.core_speeds = list(core_speeds) if core_speeds else [1.0]
+        self.running = [None] * len(self.core_speeds)
+        self._cores_by_speed = sorted(range(len(self.core_speeds)),
+                                      key=lambda core: -self.core_speeds[core])
+
+        # Sin backfilling, un trabajo ancho que no cabe detiene a los de atrás;
+        # con EASY/Conservador los angostos llenan huecos sin retrasar reservas
+        self.backfilling = None
+        self.backfill_depth = 64  # Trabajos examinados por despacho
+        self.backfilled = 0
+
+        # Grupos de recursos (los comparte el ResourceManager: shares, cuota de
+        # CPU y límite de memoria) y cola de la planificación justa
+        self.groups = {}
+        self.fair_timeslice = 50  # CFS: rebanada antes de ceder la CPU
+        self._fair = None
+        self._ready_seq = 0
+
+        # Tiempo-núcleo ocupado, total y ocioso con trabajo en espera
+        self.busy_core_time = 0
+        self.total_core_time = 0
+        self.fragmented_core_time = 0
+
+        # SJF con predicción: ordena por τ (promedio exponencial de las ráfagas
+        # observadas) en lugar de remaining_time, que un planificador real no conoce
+        self.burst_prediction = burst_prediction
+        self.prediction_alpha = prediction_alpha
+        self.initial_prediction = initial_prediction
+
+        # Fin de ráfagas de E/S: min-heap de (tiempo, secuencia, proceso, duración)
+        self.io_wakeups = []
+        self._io_seq = 0
+
         self.ready_queue = []
-        self.running_process = None
-        self.waiting_queue = []
+        # Bloqueados por pid en orden de bloqueo (waiting_queue es su vista)
+        self.waiting = {}
         self.terminated_processes = []
+        # Procesos vivos por pid: bloquear, desbloquear y terminar no recorren las colas
+        self.live_processes = {}
+        # Límite de terminados conservados en memoria (None = todos); útil
+        # cuando los resultados se exportan en streaming
+        self.terminated_history = None
+        self.terminated_count = 0
+
+        # Makespan (primera llegada -> última terminación) y latencias para percentiles
+        self.first_arrival = None
+        self.last_finish = 0
+        self.turnaround_samples = array('d')
 
         self.total_processes = 0
         self.context_switches = 0
 
+        # Acumulados de procesos terminados (estadísticas en O(1))
+        self.total_waiting_time = 0
+        self.total_turnaround_time = 0
+        self.total_response_time = 0
+        self.response_count = 0
+
+        # Detector de interbloqueo (opcional, lo consultan Mutex y ResourceManager)
+        self.deadlock_detector = None
+
+        # Grabador de trazas (opcional)
+        self.trace_recorder = None
+
+        # Línea de tiempo de ejecución para el diagrama de Gantt (opcional)
+        self.timeline = None
+
+        # Funciones llamadas una sola vez cuando un proceso termina
+        self.termination_hooks = []
+
         self.event_log = []
 
-    def add_process(self, process):
-        process.arrival_time = self.current_time
+    def add_process(self, process, arrival_time=None):
+        # arrival_time permite conservar la llegada real (trazas/cargas importadas)
+        process.arrival_time = self.current_time if arrival_time is None else arrival_time
+        if process.width > len(self.running):
+            self._log_event(f"{process} pide {process.width} CPUs; se limita a {len(self.running)}", "WARNING")
+            process.width = len(self.running)
+        if self.first_arrival is None or process.arrival_time < self.first_arrival:
+            self.first_arrival = process.arrival_time
+        if process.predicted_burst is None:
+            process.predicted_burst = self.initial_prediction
+        if self.groups:
+            from Proyecto_Final_SO.grupos_procesos import resolve_group
+            process.group = resolve_group(self.groups, process)
+            self.groups[process.group].admitted += 1
         process.set_state(Process.READY)
-        self.ready_queue.append(process)
+        self._insert_ready(process)
+        self.live_processes[process.pid] = process
         self.total_processes += 1
 
+        if self.trace_recorder:
+            self.trace_recorder.record_arrival(process, process.arrival_time)
+
         self._log_event(f"Proceso {process} agregado a cola de listos", "INFO")
-        self._sort_ready_queue()
 
-    def _sort_ready_queue(self):
+    def _queue_key(self, process):
         if self.algorithm == Scheduler.SJF:
-            self.ready_queue.sort(key=lambda p: p.remaining_time)
+            return process.predicted_burst if self.burst_prediction else process.remaining_time
         elif self.algorithm == Scheduler.PRIORITY:
-            self.ready_queue.sort(key=lambda p: p.priority)
+            return process.priority
+        elif self.algorithm == Scheduler.FAIR:
+            # La secuencia de encolado desempata: clave única para la bisección
+            return (process.vruntime, process.fair_seq)
+        elif self.algorithm == Scheduler.EDF:
+            # Sin plazo = segundo plano, detrás de todo trabajo de tiempo real
+            return process.deadline if process.deadline is not None else math.inf
+        elif self.algorithm == Scheduler.RM:
+            return process.period if process.period is not None else math.inf
+        return 0
+
+    def _ready_key(self, process):
+        # Clave única en la cola de listos: a igual clave, orden de llegada (FIFO)
+        return (self._queue_key(process), process.ready_seq)
+
+    def _fair_queue(self):
+        if self._fair is None:
+            from Proyecto_Final_SO.grupos_procesos import FairShareQueue
+            self._fair = FairShareQueue(self.groups)
+        return self._fair
+
+    def _insert_ready(self, process):
+        if self.algorithm == Scheduler.FAIR:
+            # CFS elige con su propio heap (push ajusta el vruntime); la lista
+            # queda ordenada por vruntime, que no cambia mientras espera
+            self._fair_queue().push(process)
+
+        # Búsqueda binaria: la secuencia nueva es la mayor, así que equivale a
+        # append + sort estable por _queue_key
+        self._ready_seq += 1
+        process.ready_seq = self._ready_seq
+        key = self._ready_key(process)
+        lo, hi = 0, len(self.ready_queue)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if key < self._ready_key(self.ready_queue[mid]):
+                hi = mid
+            else:
+                lo = mid + 1
+        self.ready_queue.insert(lo, process)
+
+    def _remove_ready(self, process):
+        # La clave es única: la bisección llega directo a su posición
+        key = self._ready_key(process)
+        lo, hi = 0, len(self.ready_queue)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._ready_key(self.ready_queue[mid]) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self.ready_queue) and self.ready_queue[lo] is process:
+            self.ready_queue.pop(lo)
+            return True
+        return False
+
+    def _take_ready(self, process):
+        # Si la clave cambió mientras esperaba en la cola, búsqueda lineal
+        if self._remove_ready(process):
+            return True
+        if process in self.ready_queue:
+            self.ready_queue.remove(process)
+            return True
+        return False
+
+    @property
+    def waiting_queue(self):
+        # Lista en orden de bloqueo (FIFO), como antes; quitar un proceso del
+        # dict es O(1) y conserva el orden de los demás
+        return list(self.waiting.values())
+
+    def _add_waiting(self, process):
+        self.waiting[process.pid] = process
+
+    def _remove_waiting(self, process):
+        return self.waiting.pop(process.pid, None) is not None
+
+    def _ready_process(self, pid):
+        process = self.live_processes.get(pid)
+        return process if process is not None and process.state == Process.READY else None
+
+    def set_priority(self, process, priority):
+        if process.priority == priority:
+            return
+
+        old_priority = process.priority
+        in_ready = (self.algorithm == Scheduler.PRIORITY and
+                    process.state == Process.READY and
+                    self._remove_ready(process))
+
+        process.priority = priority
+        if in_ready:
+            self._insert_ready(process)
+
+        self._log_event(f"Prioridad de {process}: {old_priority} -> {priority}", "INFO")
+
+    @property
+    def running_process(self):
+        # Compatibilidad con el modelo de un solo CPU: el primer núcleo ocupado
+        for process in self.running:
+            if process:
+                return process
+        return None
+
+    def get_running_processes(self):
+        # Un trabajo paralelo aparece una sola vez (en su primer núcleo)
+        return [process for core, process in enumerate(self.running)
+                if process and process.core == core]
+
+    def _core_of(self, pid):
+        for core, process in enumerate(self.running):
+            if process and process.pid == pid:
+                return core
+        return None
+
+    def _release_cores(self, process):
+        for core in process.cores:
+            if self.running[core] is process:
+                self.running[core] = None
+
+    def _estimate(self, process):
+        # Duración estimada para las reservas (lo que un planificador real conoce)
+        if self.burst_prediction:
+            return max(1, process.predicted_burst)
+        return max(1, process.remaining_time)
 
     def schedule(self):
-        if self.running_process:
+        if self.algorithm in (Scheduler.EDF, Scheduler.RM):
+            self._preempt_for_urgent()
+
+        idle = [core for core in self._cores_by_speed if self.running[core] is None]
+        if not idle or not self.ready_queue:
             return self.running_process
 
-        if not self.ready_queue:
-            return None
+        if self.algorithm == Scheduler.FAIR:
+            chosen = self._select_fair(len(idle))
+        elif self.backfilling:
+            chosen = self._select_backfill(len(idle))
+        else:
+            chosen = self._select_in_order(len(idle))
+        if not chosen:
+            return self.running_process
 
-        next_process = self.ready_queue.pop(0)
-        next_process.assign_cpu()
-        next_process.reset_quantum()
+        # Colocación según velocidad: la cola está ordenada de menor a mayor clave
+        # (ráfaga más corta / prioridad más alta primero). Entre los elegidos,
+        # los trabajos anchos y los largos van a los núcleos rápidos; con
+        # Prioridad, los más importantes van a los rápidos
+        if self.algorithm == Scheduler.SJF:
+            chosen.sort(key=lambda p: (p.width, self._queue_key(p)), reverse=True)
+        else:
+            chosen.sort(key=lambda p: -p.width)
+
+        for next_process in chosen:
+            cores = idle[:next_process.width]
+            del idle[:next_process.width]
+
+            # Antes de assign_cpu, que marca start_time en 0 si aún no lo tiene
+            if next_process.start_time is None:
+                next_process.start_time = self.current_time
+                next_process.response_time = self.current_time - next_process.arrival_time
+
+            next_process.assign_cpu()
+            next_process.reset_quantum()
+            next_process.cores = tuple(sorted(cores))
+            next_process.core = next_process.cores[0]
+
+            for core in cores:
+                self.running[core] = next_process
+            self.context_switches += 1
+
+            where = f"CPU {next_process.core}" if len(cores) == 1 else f"CPUs {list(next_process.cores)}"
+            self._log_event(f"Proceso {next_process} asignado a {where} ({self.algorithm})", "INFO")
+
+        return self.running_process
+
+    def _preempt_for_urgent(self):
+        # EDF y RM son expropiativos: mientras el primero que se quedaría sin
+        # núcleo sea más urgente que el menos urgente en ejecución, este cede
+        while True:
+            free = self.running.count(None)
+            running = self.get_running_processes()
+            if not running or free >= len(self.ready_queue):
+                return
+            urgent = self.ready_queue[free]
+            victim = max(running, key=self._queue_key)
+            if not self._queue_key(urgent) < self._queue_key(victim):
+                return
+            self._preempt(victim, f"{urgent} es más urgente")
+
+    def _throttled(self, process):
+        group = self.groups.get(process.group)
+        return group is not None and group.is_throttled(self.current_time)
+
+    def _select_in_order(self, free):
+        if self.groups:
+            return self._select_unthrottled(free)
+
+        # Despacho en orden: se detiene en el primer trabajo que no cabe
+        count = 0
+        for process in self.ready_queue:
+            if process.width > free:
+                break
+            free -= process.width
+            count += 1
+            if not free:
+                break
+
+        chosen = self.ready_queue[:count]
+        del self.ready_queue[:count]
+        return chosen
+
+    def _select_unthrottled(self, free):
+        # Igual que el despacho en orden, saltando los procesos de grupos que
+        # agotaron su cuota de CPU en el periodo
+        chosen = []
+        for index, process in enumerate(self.ready_queue):
+            if self._throttled(process):
+                continue
+            if process.width > free:
+                break
+            free -= process.width
+            chosen.append(index)
+            if not free:
+                break
+
+        result = [self.ready_queue[index] for index in chosen]
+        for index in reversed(chosen):
+            self.ready_queue.pop(index)
+        return result
+
+    def _select_fair(self, free):
+        # Menor vruntime primero (grupo y luego proceso); O(log n) por elección
+        fair = self._fair_queue()
+        chosen = []
+        while free:
+            process = fair.pop(self.current_time)
+            if process is None:
+                break
+            if process.width > free:
+                # Se reencola con una nueva secuencia: sale y vuelve a la lista
+                self._remove_ready(process)
+                self._insert_ready(process)
+                break
+            free -= process.width
+            chosen.append(process)
+
+        for process in chosen:
+            self._remove_ready(process)
+        return chosen
+
+    def _select_backfill(self, free):
+        # Perfil de disponibilidad: [tiempo, núcleos libres desde ese tiempo]
+        now = self.current_time
+        profile = [[now, free]]
+        for process in self.get_running_processes():
+            self._profile_add(profile, now + self._estimate(process), process.width)
+
+        chosen = []
+        reserved = False
+        for index, process in enumerate(self.ready_queue[:self.backfill_depth]):
+            if not free:
+                break
+            if self.groups and self._throttled(process):
+                continue
+            duration = self._estimate(process)
+            start = self._earliest_start(profile, process.width, duration)
+
+            if start == now:
+                self._profile_reserve(profile, now, duration, process.width)
+                free -= process.width
+                chosen.append(index)
+                if reserved:
+                    self.backfilled += 1
+            elif self.backfilling == Scheduler.CONSERVATIVE or not reserved:
+                # EASY reserva solo al primero que no cabe; Conservador a todos
+                self._profile_reserve(profile, start, duration, process.width)
+                reserved = True
+
+        result = [self.ready_queue[index] for index in chosen]
+        for index in reversed(chosen):
+            self.ready_queue.pop(index)
+        return result
 
-        if next_process.start_time is None:
-            next_process.start_time = self.current_time
-            next_process.response_time = self.current_time - next_process.arrival_time
+    @staticmethod
+    def _profile_add(profile, time, cores):
+        # Núcleos que se liberan en `time` (fin estimado de un proceso en ejecución)
+        index = Scheduler._profile_split(profile, time)
+        for step in profile[index:]:
+            step[1] += cores
 
-        self.running_process = next_process
-        self.context_switches += 1
+    @staticmethod
+    def _profile_split(profile, time):
+        # Índice del escalón que empieza exactamente en `time` (se crea si hace falta)
+        for index, step in enumerate(profile):
+            if step[0] == time:
+                return index
+            if step[0] > time:
+                profile.insert(index, [time, profile[index - 1][1]])
+                return index
+        profile.append([time, profile[-1][1]])
+        return len(profile) - 1
 
-        self._log_event(f"Proceso {next_process} asignado a CPU ({self.algorithm})", "INFO")
-        return next_process
+    @staticmethod
+    def _earliest_start(profile, width, duration):
+        for index, (start, _) in enumerate(profile):
+            end = start + duration
+            if all(free >= width for time, free in profile[index:] if time < end):
+                return start
+        return profile[-1][0]
 
-    def execute_current_process(self, time_slice=10):
-        if not self.running_process:
-            return False
+    @staticmethod
+    def _profile_reserve(profile, start, duration, width):
+        first = Scheduler._profile_split(profile, start)
+        last = Scheduler._profile_split(profile, start + duration)
+        for step in profile[first:last]:
+            step[1] -= width
+
+    def execute_current_process(self, time_slice=10, speed=1.0):
+        # Compatibilidad: True si alguno de los procesos en ejecución terminó
+        return bool(self.execute_cores(time_slice, [speed * factor for factor in self.core_speeds]))
+
+    def execute_cores(self, time_slice=10, speeds=None):
+        # Una rebanada por proceso en ejecución; devuelve los que terminaron
+        if not any(self.running):
+            return []
+
+        speeds = speeds or self.core_speeds
+        cores = len(self.running)
+        busy = cores - self.running.count(None)
+        self.busy_core_time += busy * time_slice
+        self.total_core_time += cores * time_slice
+        if self.ready_queue:
+            self.fragmented_core_time += (cores - busy) * time_slice
+
+        finished = []
+        for process in self.get_running_processes():
+            # Los hilos de un trabajo paralelo avanzan al paso del núcleo más lento
+            speed = min(speeds[core] if core < len(speeds) else self.core_speeds[core]
+                        for core in process.cores)
+            if process.execute(time_slice, speed):
+                finished.append(process)
+            if self.groups or self._fair is not None:
+                self._charge(process, time_slice * process.width)
+            if self.timeline is not None:
+                for core in process.cores:
+                    self.timeline.record(core, process.pid, self.current_time, self.current_time + time_slice)
 
-        process = self.running_process
-        finished = process.execute(time_slice)
         self.current_time += time_slice
+        self._wake_io_bursts()
 
-        if finished:
+        for process in finished:
             process.calculate_statistics(self.current_time)
-            self.terminated_processes.append(process)
-            self.running_process = None
+            self._release_cores(process)
+            self._record_termination(process)
             self._log_event(f"Proceso {process} TERMINADO", "INFO")
-            return True
 
-        return False
+        for process in self.get_running_processes():
+            if process.cpu_burst_finished():
+                # Fin de la ráfaga de CPU: el proceso pasa a su ráfaga de E/S
+                io_burst = process.next_io_burst()
+                self.block_process(process.pid, f"Ráfaga de E/S ({io_burst} ms)")
+                self._io_seq += 1
+                heapq.heappush(self.io_wakeups, (self.current_time + io_burst, self._io_seq, process, io_burst))
+
+        if self.groups or self.algorithm == Scheduler.FAIR:
+            for process in self.get_running_processes():
+                if self._throttled(process):
+                    self._preempt(process, f"cuota de {process.group} agotada")
+                elif (self.algorithm == Scheduler.FAIR and self.ready_queue and
+                      process.time_quantum_used >= self.fair_timeslice):
+                    self._preempt(process, "rebanada CFS")
+
+        return finished
+
+    def _charge(self, process, elapsed):
+        # Tiempo-núcleo consumido: cuota del grupo y vruntime de CFS
+        group = self.groups.get(process.group)
+        if group is not None:
+            group.charge(elapsed, self.current_time)
+        if self._fair is not None:
+            self._fair.charge(process, elapsed)
+
+    def _preempt(self, process, reason):
+        self._release_cores(process)
+        process.release_cpu()
+        self._insert_ready(process)
+        self._log_event(f"Proceso {process} expropiado ({reason})", "INFO")
+
+    def next_unthrottle(self):
+        # Fin de periodo más cercano de los grupos estrangulados con procesos listos
+        if not self.ready_queue:
+            return None
+        ends = [group.period_end() for group in self.groups.values()
+                if group.is_throttled(self.current_time)]
+        return min(ends) if ends else None
+
+    def _wake_io_bursts(self):
+        while self.io_wakeups and self.io_wakeups[0][0] <= self.current_time:
+            _, _, process, io_burst = heapq.heappop(self.io_wakeups)
+            # Terminado (o despertado por otra vía) mientras hacía E/S: se ignora
+            if process.state == Process.WAITING:
+                process.io_time += io_burst
+                self.unblock_process(process.pid)
+
+    def next_io_wakeup(self):
+        return self.io_wakeups[0][0] if self.io_wakeups else None
+
+    def add_termination_hook(self, hook):
+        self.termination_hooks.append(hook)
+
+    def _record_termination(self, process):
+        self.live_processes.pop(process.pid, None)
+        self.terminated_processes.append(process)
+        self.terminated_count += 1
+        self.turnaround_samples.append(process.turnaround_time)
+        if process.finish_time is not None and process.finish_time > self.last_finish:
+            self.last_finish = process.finish_time
+        limit = self.terminated_history
+        if limit is not None and len(self.terminated_processes) > 2 * limit + 1:
+            # Recorte amortizado: solo cuando se duplica el límite
+            del self.terminated_processes[:len(self.terminated_processes) - limit]
+        self.total_waiting_time += process.waiting_time
+        self.total_turnaround_time += process.turnaround_time
+        if process.response_time is not None:
+            self.total_response_time += process.response_time
+            self.response_count += 1
+        group = self.groups.get(process.group)
+        if group is not None:
+            group.completed += 1
+            group.total_turnaround_time += process.turnaround_time
+        for hook in self.termination_hooks:
+            hook(process)
+
+    def advance_idle_time(self, elapsed):
+        # CPU ociosa: el tiempo simulado avanza sin ejecutar procesos
+        self.current_time += elapsed
+        self.total_core_time += len(self.running) * elapsed
+        self._wake_io_bursts()
 
     def block_process(self, pid, reason="Esperando recurso"):
-        if self.running_process and self.running_process.pid == pid:
-            process = self.running_process
+        core = self._core_of(pid)
+        if core is not None:
+            process = self.running[core]
+            process.end_cpu_burst(self.prediction_alpha)
             process.release_cpu()
             process.set_state(Process.WAITING)
-            self.waiting_queue.append(process)
-            self.running_process = None
+            self._add_waiting(process)
+            self._release_cores(process)
             self._log_event(f"Proceso {process} BLOQUEADO ({reason})", "WARNING")
+            if self.trace_recorder:
+                self.trace_recorder.record_block(process, self.current_time, reason)
             return
 
-        for i, process in enumerate(self.ready_queue):
-            if process.pid == pid:
-                process.set_state(Process.WAITING)
-                self.waiting_queue.append(process)
-                self.ready_queue.pop(i)
-                self._log_event(f"Proceso {process} BLOQUEADO ({reason})", "WARNING")
-                return
+        process = self._ready_process(pid)
+        if process is not None and self._take_ready(process):
+            process.set_state(Process.WAITING)
+            self._add_waiting(process)
+            self._log_event(f"Proceso {process} BLOQUEADO ({reason})", "WARNING")
+            if self.trace_recorder:
+                self.trace_recorder.record_block(process, self.current_time, reason)
 
     def unblock_process(self, pid):
-        for i, process in enumerate(self.waiting_queue):
-            if process.pid == pid:
-                process.set_state(Process.READY)
-                self.ready_queue.append(process)
-                self.waiting_queue.pop(i)
-                self._sort_ready_queue()
-                self._log_event(f"Proceso {process} DESBLOQUEADO", "INFO")
-                return
+        process = self.waiting.pop(pid, None)
+        if process is not None:
+            process.set_state(Process.READY)
+            self._insert_ready(process)
+            self._log_event(f"Proceso {process} DESBLOQUEADO", "INFO")
+            if self.trace_recorder:
+                self.trace_recorder.record_unblock(process, self.current_time)
 
     def terminate_process(self, pid):
         # running
-        if self.running_process and self.running_process.pid == pid:
-            process = self.running_process
+        core = self._core_of(pid)
+        if core is not None:
+            process = self.running[core]
             process.set_state(Process.TERMINATED)
             process.calculate_statistics(self.current_time)
-            self.terminated_processes.append(process)
-            self.running_process = None
+            self._release_cores(process)
+            self._record_termination(process)
             self._log_event(f"Proceso {process} terminado forzadamente", "FORCED")
+            if self.trace_recorder:
+                self.trace_recorder.record_terminate(process, self.current_time)
             return
 
-        # ready
-        for i, process in enumerate(self.ready_queue):
-            if process.pid == pid:
-                process.set_state(Process.TERMINATED)
-                process.calculate_statistics(self.current_time)
-                self.terminated_processes.append(process)
-                self.ready_queue.pop(i)
-                self._log_event(f"Proceso {process} terminado forzadamente", "FORCED")
+        # ready / waiting
+        process = self.live_processes.get(pid)
+        if process is None:
+            return
+        if process.state == Process.READY:
+            if not self._take_ready(process):
                 return
-
-        # waiting
-        for i, process in enumerate(self.waiting_queue):
-            if process.pid == pid:
-                process.set_state(Process.TERMINATED)
-                process.calculate_statistics(self.current_time)
-                self.terminated_processes.append(process)
-                self.waiting_queue.pop(i)
-                self._log_event(f"Proceso {process} terminado forzadamente", "FORCED")
+        elif process.state == Process.WAITING:
+            if not self._remove_waiting(process):
                 return
-
-    def get_statistics(self):
-        if not self.terminated_processes:
-            avg_waiting = 0
-            avg_turnaround = 0
-            avg_response = 0
         else:
-            avg_waiting = sum(p.waiting_time for p in self.terminated_processes) / len(self.terminated_processes)
-            avg_turnaround = sum(p.turnaround_time for p in self.terminated_processes) / len(self.terminated_processes)
-            responses = [p.response_time for p in self.terminated_processes if p.response_time is not None]
-            avg_response = sum(responses) / len(responses) if responses else 0
+            return
+        process.set_state(Process.TERMINATED)
+        process.calculate_statistics(self.current_time)
+        self._record_termination(process)
+        self._log_event(f"Proceso {process} terminado forzadamente", "FORCED")
+        if self.trace_recorder:
+            self.trace_recorder.record_terminate(process, self.current_time)
+
+    def get_stats(self):
+        finished = self.terminated_count
+        return SchedulerStats(
+            algorithm=self.algorithm,
+            current_time=self.current_time,
+            total_processes=self.total_processes,
+            running=len(self.get_running_processes()),
+            ready=len(self.ready_queue),
+            waiting=len(self.waiting),
+            terminated=finished,
+            context_switches=self.context_switches,
+            avg_waiting_time=self.total_waiting_time / finished if finished else 0.0,
+            avg_turnaround_time=self.total_turnaround_time / finished if finished else 0.0,
+            avg_response_time=self.total_response_time / self.response_count if self.response_count else 0.0,
+            throughput=finished * 1000 / self.current_time if self.current_time else 0.0,
+            makespan=self.last_finish - self.first_arrival if finished else 0,
+            utilization=self.busy_core_time / self.total_core_time if self.total_core_time else 0.0,
+            fragmentation=self.fragmented_core_time / self.total_core_time if self.total_core_time else 0.0,
+            backfilled=self.backfilled
+        )
 
-        return {
-            'Algoritmo': self.algorithm,
-            'Quantum': "N/A",
-            'Tiempo Actual': f"{self.current_time} ms",
-            'Procesos Totales': self.total_processes,
-            'En Ejecución': 1 if self.running_process else 0,
-            'En Cola Listos': len(self.ready_queue),
-            'Esperando': len(self.waiting_queue),
-            'Terminados': len(self.terminated_processes),
-            'Context Switches': self.context_switches,
-            'Tiempo Espera Promedio': f"{avg_waiting:.2f} ms",
-            'Turnaround Promedio': f"{avg_turnaround:.2f} ms",
-            'Tiempo Respuesta Promedio': f"{avg_response:.2f} ms"
-        }
+    def get_latency_percentiles(self, percentiles=(50, 95, 99)):
+        # Latencia de cola (turnaround); O(n log n), fuera de get_stats a propósito
+        samples = sorted(self.turnaround_samples)
+        if not samples:
+            return {p: 0.0 for p in percentiles}
+        return {p: samples[min(len(samples) - 1, max(0, math.ceil(p / 100 * len(samples)) - 1))]
+                for p in percentiles}
+
+    def get_statistics(self):
+        # Compatibilidad: versión formateada de get_stats()
+        return self.get_stats().display()
 
     def get_all_processes(self):
         return (
-            ([self.running_process] if self.running_process else []) +
+            self.get_running_processes() +
             self.ready_queue +
             self.waiting_queue +
             self.terminated_processes
@@ -299,6 +904,10 @@ class SimulationController:
             min_interval=1.5,
             max_interval=4.0
         )
+        self.scheduler.add_termination_hook(self._on_process_terminated)
+
+        # Planificador y administrador comparten el registro de grupos
+        self.scheduler.groups = self.resource_manager.groups
 
         self.running = False
         self.paused = False
@@ -309,6 +918,8 @@ class SimulationController:
         self.prob_create_process = 0.70
         self.prob_block_process = 0.15
         self.prob_unblock_process = 0.05
+        self.prob_io_bound = 0.0  # Fracción de procesos con perfil de ráfagas CPU/E/S
+        self.prob_parallel = 0.0  # Fracción de trabajos paralelos (más de una CPU)
 
         self.time_slice = 10
         self.update_interval = 0.1
@@ -317,8 +928,36 @@ class SimulationController:
         self.producer_consumer = None
         self.pc_enabled = False
 
+        # Llegadas futuras: min-heap de (tiempo, secuencia, proceso)
+        # proceso None = llegada del modelo, se genera al momento de llegar
+        self.pending_arrivals = []
+        self._arrival_seq = itertools.count()
+        self.arrival_model = None
+
+        # Funciones llamadas al final de cada tick (p. ej. exportador de métricas)
+        self.tick_hooks = []
+
+        # Perfilado opcional del ciclo de simulación
+        self.profiler = None
+        self._profiler_detach_requested = False
+
+        # Exportación de resultados por proceso en streaming
+        self.results_writer = None
+
+        # Puntos de control periódicos (hook de tick)
+        self.checkpointer = None
+
+        # Dispositivos de E/S (None = bloqueo/desbloqueo aleatorio)
+        self.io = None
+
+        # Tareas de tiempo real (EDF / RM)
+        self.realtime = None
+
     def start(self):
         if not self.running:
+            # threading solo hace falta con el ciclo en segundo plano (no en
+            # corridas sin interfaz que llaman a _tick directamente)
+            import threading
             self.running = True
             self.paused = False
             self.thread = threading.Thread(target=self._simulation_loop, daemon=True)
@@ -342,77 +981,263 @@ class SimulationController:
     def _simulation_loop(self):
         while self.running:
             if not self.paused:
-                self._execute_step()
-
-                if self.pc_enabled and self.producer_consumer:
-                    self.producer_consumer.step(self.scheduler)
-
-                self._execute_random_action()
-                self._cleanup_terminated_processes()
-
-                if self.callback:
-                    self.callback()
+                # Una sola comprobación por tick cuando el perfilado está apagado
+                if self.profiler:
+                    self._profiled_tick(self.profiler)
+                else:
+                    self._tick()
 
                 time.sleep(self.update_interval / self.speed)
             else:
                 time.sleep(0.1)
 
+    def _tick(self):
+        self._execute_step()
+        self._inject_arrivals()
+
+        if self.pc_enabled and self.producer_consumer:
+            self.producer_consumer.step(self.scheduler)
+
+        self._execute_random_action()
+
+        if self.callback:
+            self.callback()
+
+        for hook in self.tick_hooks:
+            hook()
+
+    def _profiled_tick(self, profiler):
+        clock = time.perf_counter_ns
+        profiler.begin_tick()
+
+        t0 = clock()
+        self._execute_step()
+        t1 = clock()
+        self._inject_arrivals()
+        t2 = clock()
+        if self.pc_enabled and self.producer_consumer:
+            self.producer_consumer.step(self.scheduler)
+        t3 = clock()
+        self._execute_random_action()
+        t4 = clock()
+        if self.callback:
+            self.callback()
+        for hook in self.tick_hooks:
+            hook()
+        t5 = clock()
+
+        profiler.record('execute_step', t1 - t0)
+        profiler.record('arrivals', t2 - t1)
+        profiler.record('producer_consumer', t3 - t2)
+        profiler.record('random_action', t4 - t3)
+        profiler.record('callback', t5 - t4)
+        profiler.end_tick()
+
+        if self._profiler_detach_requested:
+            self._detach_profiler()
+
+    def add_tick_hook(self, hook):
+        self.tick_hooks.append(hook)
+
+    def remove_tick_hook(self, hook):
+        if hook in self.tick_hooks:
+            self.tick_hooks.remove(hook)
+
+    def start_metrics_exporter(self, port=9108, textfile=None, interval=1.0):
+        from Proyecto_Final_SO.exportador_metricas import MetricsExporter
+        exporter = MetricsExporter(self, port=port, textfile=textfile, interval=interval)
+        exporter.start()
+        return exporter
+
+    def enable_profiling(self):
+        self._profiler_detach_requested = False
+        if not self.profiler:
+            from Proyecto_Final_SO.perfilado import SimulationProfiler
+            self.profiler = SimulationProfiler()
+        return self.profiler
+
+    def disable_profiling(self):
+        profiler = self.profiler
+        if not profiler:
+            return None
+
+        # Una captura de cProfile activa solo puede cerrarse desde el hilo de simulación
+        if self.thread and self.thread.is_alive():
+            self._profiler_detach_requested = True
+        else:
+            self._detach_profiler()
+        return profiler
+
+    def _detach_profiler(self):
+        profiler = self.profiler
+        self.profiler = None
+        self._profiler_detach_requested = False
+        if profiler and (profiler.profile or profiler.tracing_memory):
+            profiler.stop_capture()
+
+    def get_profiling_report(self):
+        if not self.profiler:
+            return None
+        return {
+            'Resumen': self.profiler.get_summary(),
+            'Fases': self.profiler.get_statistics(),
+            'Captura': self.profiler.capture_report
+        }
+
     def _execute_step(self):
-        process = self.scheduler.schedule()
-        if process:
-            finished = self.scheduler.execute_current_process(self.time_slice)
-            if finished:
+        if self.realtime:
+            self.realtime.advance(self.scheduler.current_time)
+
+        if self.scheduler.schedule():
+            # Velocidad por núcleo: tipo (big/LITTLE) y frecuencia del gobernador
+            busy = [core for core, process in enumerate(self.scheduler.running) if process]
+            finished = self.scheduler.execute_cores(self.time_slice, self.resource_manager.get_cpu_speeds())
+            self.resource_manager.account_cpu_time(self.time_slice, busy)
+            for process in finished:
                 self.resource_manager.release_resources(process)
+        else:
+            # Sin trabajo: avanzar el reloj hacia la próxima llegada o terminación de E/S
+            next_event = self.pending_arrivals[0][0] if self.pending_arrivals else None
+            next_wakeup = self.scheduler.next_io_wakeup()
+            if next_wakeup is not None and (next_event is None or next_wakeup < next_event):
+                next_event = next_wakeup
+            if self.io:
+                next_io = self.io.next_completion()
+                if next_io is not None and (next_event is None or next_io < next_event):
+                    next_event = next_io
+            if self.realtime:
+                next_release = self.realtime.next_release()
+                if next_release is not None and (next_event is None or next_release < next_event):
+                    next_event = next_release
+            # Listos pero estrangulados: el reloj corre hasta el siguiente periodo
+            next_period = self.scheduler.next_unthrottle()
+            if next_period is not None and (next_event is None or next_period < next_event):
+                next_event = next_period
+            if next_event is not None:
+                elapsed = math.ceil(min(self.time_slice, max(0, next_event - self.scheduler.current_time)))
+                self.scheduler.advance_idle_time(elapsed)
+                self.resource_manager.account_cpu_time(elapsed)
+
+        if self.io:
+            self.io.advance(self.scheduler.current_time)
 
     def _execute_random_action(self):
+        # Con un modelo de llegadas, la creación ya no es un volado por tick
+        prob_create = 0.0 if self.arrival_model else self.prob_create_process
+
         rand = random.random()
-        if rand < self.prob_create_process:
+        if rand < prob_create:
             self._create_random_process()
-        elif rand < self.prob_create_process + self.prob_block_process:
-            self._block_random_process()
-        elif rand < self.prob_create_process + self.prob_block_process + self.prob_unblock_process:
-            self._unblock_random_process()
+        elif rand < prob_create + self.prob_block_process:
+            if self.io:
+                self._request_random_io()
+            else:
+                self._block_random_process()
+        elif rand < prob_create + self.prob_block_process + self.prob_unblock_process:
+            # Con dispositivos, solo las terminaciones de E/S despiertan procesos
+            if not self.io:
+                self._unblock_random_process()
 
-    def _create_random_process(self):
+    def _generate_process(self):
         name = self.generator.generate_process_name()
         burst = self.generator.generate_burst_time()
         priority = self.generator.generate_priority()
         memory = self.generator.generate_memory_required()
 
+        # Procesos interactivos: la misma CPU repartida en ráfagas con E/S intermedia
+        bursts = None
+        if self.prob_io_bound and random.random() < self.prob_io_bound:
+            bursts = self.generator.generate_burst_profile(burst)
+
+        width = 1
+        cores = len(self.scheduler.running)
+        if self.prob_parallel and cores > 1 and random.random() < self.prob_parallel:
+            width = random.randint(2, cores)
+
         # Process viene de arriba en este archivo
-        process = Process(name, burst, priority, memory)
+        return Process(name, burst, priority, memory, bursts, width)
+
+    def _create_random_process(self):
+        self._admit_process(self._generate_process())
 
+    def _admit_process(self, process, arrival_time=None):
         if not self.resource_manager.has_available_resources(process):
-            self.generator.release_name(name)
-            return
+            self.generator.release_name(process.name)
+            return False
 
         success, _ = self.resource_manager.request_resources(process)
         if success:
-            self.scheduler.add_process(process)
+            self.scheduler.add_process(process, arrival_time=arrival_time)
         else:
-            self.generator.release_name(name)
+            self.generator.release_name(process.name)
+        return success
+
+    def schedule_arrival(self, process, arrival_time):
+        heapq.heappush(self.pending_arrivals, (arrival_time, next(self._arrival_seq), process))
+
+    def set_arrival_model(self, model):
+        # Descarta las llegadas pendientes del modelo anterior (las explícitas se conservan)
+        self.pending_arrivals = [entry for entry in self.pending_arrivals if entry[2] is not None]
+        heapq.heapify(self.pending_arrivals)
+
+        self.arrival_model = model
+        if model:
+            self._schedule_model_arrival(self.scheduler.current_time)
+
+    def _schedule_model_arrival(self, after):
+        # Solo hay una llegada del modelo pendiente a la vez (generación perezosa)
+        self.schedule_arrival(None, self.arrival_model.next_arrival(after))
+
+    def _inject_arrivals(self):
+        now = self.scheduler.current_time
+        while self.pending_arrivals and self.pending_arrivals[0][0] <= now:
+            arrival_time, _, process = heapq.heappop(self.pending_arrivals)
+            if process is None:
+                if not self.arrival_model:
+                    continue
+                process = self._generate_process()
+                self._schedule_model_arrival(arrival_time)
+            self._admit_process(process, arrival_time=math.ceil(arrival_time))
+
+    def get_pending_arrivals(self):
+        return len(self.pending_arrivals)
 
     def _block_random_process(self):
         if self.scheduler.ready_queue:
             process = random.choice(self.scheduler.ready_queue)
             self.scheduler.block_process(process.pid, "Esperando I/O")
 
+    def _request_random_io(self):
+        # Quien pide E/S es el proceso en ejecución (si hay); si no, uno listo
+        process = self.scheduler.running_process
+        if not process and self.scheduler.ready_queue:
+            process = random.choice(self.scheduler.ready_queue)
+        if process:
+            self.io.submit(process)
+
     def _unblock_random_process(self):
-        if self.scheduler.waiting_queue:
+        if self.scheduler.waiting:
             process = random.choice(self.scheduler.waiting_queue)
             self.scheduler.unblock_process(process.pid)
 
-    def _cleanup_terminated_processes(self):
-        for process in self.scheduler.terminated_processes[:]:
-            self.generator.release_name(process.name)
+    def _on_process_terminated(self, process):
+        # El nombre se libera una sola vez, en la transición a terminado
+        self.generator.release_name(process.name)
 
-    def start_producer_consumer(self, buffer_size=5):
+    def start_producer_consumer(self, buffer_size=5, num_producers=1, num_consumers=1,
+                                num_buffers=1, buffer_names=None):
         if self.producer_consumer and self.pc_enabled:
             return (False, "Productor-Consumidor ya está ejecutándose")
 
         # Importar aquí para evitar importación circular
         from Proyecto_Final_SO.Comunicacion_Sincronizacion.productor_consumidor import ProducerConsumer
-        self.producer_consumer = ProducerConsumer(buffer_size)
+        self.producer_consumer = ProducerConsumer(
+            buffer_size,
+            num_producers=num_producers,
+            num_consumers=num_consumers,
+            num_buffers=num_buffers,
+            buffer_names=buffer_names
+        )
         self.producer_consumer.create_processes(self.scheduler, self.resource_manager)
 
         self.pc_enabled = True
@@ -429,6 +1254,181 @@ class SimulationController:
     def get_producer_consumer(self):
         return self.producer_consumer if self.pc_enabled else None
 
+    def enable_deadlock_detection(self, recover=False):
+        from Proyecto_Final_SO.deteccion_interbloqueo import DeadlockDetector
+        self.disable_deadlock_detection()
+        mode = DeadlockDetector.RECOVER if recover else DeadlockDetector.REPORT
+        detector = DeadlockDetector(self.scheduler, self.resource_manager, mode)
+        self.scheduler.deadlock_detector = detector
+        self.resource_manager.deadlock_detector = detector
+        # Un proceso terminado desde fuera sale del grafo espera-por
+        self.scheduler.add_termination_hook(detector.forget)
+        return detector
+
+    def disable_deadlock_detection(self):
+        detector = self.scheduler.deadlock_detector
+        if detector and detector.forget in self.scheduler.termination_hooks:
+            self.scheduler.termination_hooks.remove(detector.forget)
+        self.scheduler.deadlock_detector = None
+        self.resource_manager.deadlock_detector = None
+
+    def enable_io_devices(self, devices=None):
+        if self.io:
+            return self.io
+
+        from Proyecto_Final_SO.dispositivos_es import IOSubsystem
+        self.io = IOSubsystem(self.scheduler, devices)
+        return self.io
+
+    def disable_io_devices(self):
+        io = self.io
+        if io:
+            self.io = None
+            io.drain()
+        return io
+
+    def create_process_group(self, name, shares=1024, cpu_quota=None, cpu_period=100,
+                             memory_limit=None, prefix=None):
+        return self.resource_manager.create_group(name, shares, cpu_quota, cpu_period,
+                                                  memory_limit, prefix)
+
+    def get_group_statistics(self):
+        return {
+            'Grupos': self.resource_manager.get_group_statistics(),
+            'Índice de Jain': f"{self.resource_manager.get_fairness_index():.3f}"
+        }
+
+    def enable_realtime(self):
+        if self.scheduler.algorithm not in (Scheduler.EDF, Scheduler.RM):
+            return (False, "El planificador debe usar EDF o RM para tareas de tiempo real")
+        if not self.realtime:
+            from Proyecto_Final_SO.tiempo_real import RealTimeSystem
+            self.realtime = RealTimeSystem(self)
+        return (True, f"Tiempo real activo ({self.scheduler.algorithm})")
+
+    def add_realtime_task(self, name, wcet, period, deadline=None, sporadic=False,
+                          phase=0, memory=50, force=False):
+        if not self.realtime:
+            success, msg = self.enable_realtime()
+            if not success:
+                return (False, msg)
+
+        from Proyecto_Final_SO.tiempo_real import RealTimeTask
+        try:
+            task = RealTimeTask(name, wcet, period, deadline, sporadic, phase=phase, memory=memory)
+        except ValueError as e:
+            return (False, str(e))
+        return self.realtime.add_task(task, force)
+
+    def get_realtime_statistics(self):
+        return self.realtime.get_statistics() if self.realtime else {}
+
+    def get_energy_statistics(self):
+        return self.resource_manager.get_energy_stats(self.scheduler.terminated_count).display()
+
+    def get_io_statistics(self):
+        return self.io.get_statistics() if self.io else {}
+
+    def start_trace_recording(self, path):
+        if self.scheduler.trace_recorder:
+            return (False, "Ya se está grabando una traza")
+
+        from Proyecto_Final_SO.trazas import TraceRecorder
+        self.scheduler.trace_recorder = TraceRecorder(path, self.scheduler.algorithm)
+        return (True, f"Grabando traza en {path}")
+
+    def stop_trace_recording(self):
+        recorder = self.scheduler.trace_recorder
+        if not recorder:
+            return (False, "No se está grabando ninguna traza")
+
+        self.scheduler.trace_recorder = None
+        recorder.close()
+        return (True, f"Traza guardada ({recorder.events_written} eventos)")
+
+    def start_results_export(self, path, format=None, keep_terminated=None):
+        if self.results_writer:
+            return (False, "Ya se están exportando resultados")
+
+        from Proyecto_Final_SO.exportador_resultados import ResultsWriter
+        try:
+            self.results_writer = ResultsWriter(path, format)
+        except (ValueError, ImportError) as e:
+            return (False, str(e))
+
+        self.results_writer.attach(self.scheduler)
+        # Los terminados ya van al archivo; en memoria basta con los recientes
+        self.scheduler.terminated_history = keep_terminated
+        return (True, f"Exportando resultados a {path}")
+
+    def stop_results_export(self):
+        writer = self.results_writer
+        if not writer:
+            return (False, "No se están exportando resultados")
+
+        writer.detach(self.scheduler)
+        self.results_writer = None
+        self.scheduler.terminated_history = None
+        writer.close()
+        return (True, f"Resultados guardados ({writer.rows_written} procesos)")
+
+    def enable_timeline(self):
+        if self.scheduler.timeline is None:
+            from Proyecto_Final_SO.linea_tiempo import TimelineRecorder
+            self.scheduler.timeline = TimelineRecorder()
+        return self.scheduler.timeline
+
+    def disable_timeline(self):
+        timeline = self.scheduler.timeline
+        self.scheduler.timeline = None
+        return timeline
+
+    def save_checkpoint(self, path):
+        import pickle
+        from Proyecto_Final_SO.puntos_control import write_checkpoint
+        try:
+            size = write_checkpoint(self, path)
+        except (OSError, TypeError, AttributeError, pickle.PicklingError) as e:
+            return (False, f"No se pudo guardar el punto de control: {e}")
+        return (True, f"Punto de control guardado en {path} ({size} bytes)")
+
+    def load_checkpoint(self, path):
+        if self.running:
+            return (False, "Detenga la simulación antes de restaurar")
+
+        # Los grabadores abiertos pertenecen al planificador que se reemplaza
+        if self.results_writer:
+            self.stop_results_export()
+        if self.scheduler.trace_recorder:
+            self.stop_trace_recording()
+
+        import pickle
+        from Proyecto_Final_SO.puntos_control import read_checkpoint
+        try:
+            read_checkpoint(self, path)
+        except (OSError, ValueError, pickle.UnpicklingError) as e:
+            return (False, f"No se pudo restaurar el punto de control: {e}")
+        return (True, f"Simulación restaurada desde {path} (t={self.scheduler.current_time} ms)")
+
+    def enable_periodic_checkpoints(self, path, every_ticks=1000, use_fork=True):
+        if self.checkpointer:
+            return (False, "Los puntos de control periódicos ya están activos")
+
+        from Proyecto_Final_SO.puntos_control import PeriodicCheckpointer
+        self.checkpointer = PeriodicCheckpointer(self, path, every_ticks, use_fork)
+        self.add_tick_hook(self.checkpointer)
+        return (True, f"Punto de control cada {self.checkpointer.every_ticks} ticks en {path}")
+
+    def disable_periodic_checkpoints(self):
+        checkpointer = self.checkpointer
+        if not checkpointer:
+            return (False, "No hay puntos de control periódicos activos")
+
+        self.remove_tick_hook(checkpointer)
+        self.checkpointer = None
+        checkpointer.wait()
+        return (True, f"Puntos de control desactivados ({checkpointer.checkpoints_written} guardados)")
+
 class ProcessGenerator:
     def __init__(self, min_burst_time=50, max_burst_time=500,
                  min_memory=50, max_memory=300,
@@ -484,6 +1484,18 @@ class ProcessGenerator:
             return random.randint((self.min_memory + self.max_memory)//2,
                                   self.max_memory)
 
+    def generate_burst_profile(self, cpu_time, min_io=20, max_io=200):
+        # Reparte cpu_time en 2-5 ráfagas de CPU separadas por ráfagas de E/S
+        count = min(cpu_time, random.randint(2, 5))
+        cuts = sorted(random.sample(range(1, cpu_time), count - 1)) if count > 1 else []
+        cpu_bursts = [b - a for a, b in zip([0] + cuts, cuts + [cpu_time])]
+
+        profile = [cpu_bursts[0]]
+        for cpu_burst in cpu_bursts[1:]:
+            profile.append(random.randint(min_io, max_io))
+            profile.append(cpu_burst)
+        return profile
+
     def get_next_interval(self):
         return random.uniform(self.min_interval, self.max_interval)
 
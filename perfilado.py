@@ -0,0 +1,154 @@
+import cProfile
+import io
+import pstats
+import time
+import tracemalloc
+from collections import deque
+
+
+PHASES = ('execute_step', 'arrivals', 'producer_consumer', 'random_action', 'callback')
+
+
+class PhaseTimer:
+
+    def __init__(self, name):
+        self.name = name
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        # Histograma logarítmico: cubeta b cuenta duraciones en [2^(b-1), 2^b) ns
+        self.histogram = [0] * 64
+
+    def record(self, elapsed_ns):
+        self.count += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        self.histogram[min(63, elapsed_ns.bit_length())] += 1
+
+    def percentile(self, fraction):
+        # Cota superior de la cubeta donde cae el percentil
+        if not self.count:
+            return 0
+        target = fraction * self.count
+        seen = 0
+        for bucket, count in enumerate(self.histogram):
+            seen += count
+            if seen >= target:
+                return 1 << bucket
+        return self.max_ns
+
+    def average_ns(self):
+        return self.total_ns / self.count if self.count else 0
+
+
+class SimulationProfiler:
+
+    def __init__(self, rate_window=100):
+        self.phases = {name: PhaseTimer(name) for name in PHASES}
+        self.ticks = 0
+        self.started_ns = time.perf_counter_ns()
+        self.tick_times = deque(maxlen=rate_window)  # Para la tasa reciente
+
+        # Ventana de captura con cProfile / tracemalloc
+        self.capture_request = None
+        self.capture_ticks_left = 0
+        self.profile = None
+        self.tracing_memory = False
+        self.capture_report = None
+
+    def record(self, phase, elapsed_ns):
+        self.phases[phase].record(elapsed_ns)
+
+    def begin_tick(self):
+        # cProfile solo perfila el hilo que lo activa: la captura solicitada
+        # desde la GUI arranca aquí, en el hilo de la simulación
+        if self.capture_request:
+            ticks, cpu, memory = self.capture_request
+            self.capture_request = None
+            self._start_capture(ticks, cpu, memory)
+
+    def end_tick(self):
+        self.ticks += 1
+        self.tick_times.append(time.perf_counter_ns())
+
+        if self.capture_ticks_left:
+            self.capture_ticks_left -= 1
+            if not self.capture_ticks_left:
+                self.stop_capture()
+
+    def start_capture(self, ticks=100, cpu=True, memory=False):
+        # Captura acotada: se detiene sola después de `ticks` ticks
+        if self.capture_ticks_left or self.capture_request:
+            return False
+
+        self.capture_report = None
+        self.capture_request = (max(1, ticks), cpu, memory)
+        return True
+
+    def _start_capture(self, ticks, cpu, memory):
+        self.capture_ticks_left = ticks
+        if cpu:
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.tracing_memory = True
+
+    def stop_capture(self, top=15):
+        self.capture_ticks_left = 0
+        report = {}
+
+        if self.profile:
+            self.profile.disable()
+            out = io.StringIO()
+            pstats.Stats(self.profile, stream=out).sort_stats('cumulative').print_stats(top)
+            report['cpu'] = out.getvalue()
+            self.profile = None
+
+        if self.tracing_memory:
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            self.tracing_memory = False
+            stats = snapshot.statistics('lineno')[:top]
+            report['memory'] = "\n".join(str(stat) for stat in stats)
+
+        self.capture_report = report
+        return report
+
+    def get_tick_rate(self):
+        # Ticks por segundo (real) sobre la ventana reciente
+        if len(self.tick_times) < 2:
+            return 0.0
+        span = self.tick_times[-1] - self.tick_times[0]
+        return (len(self.tick_times) - 1) * 1e9 / span if span else 0.0
+
+    def get_statistics(self):
+        total = sum(timer.total_ns for timer in self.phases.values())
+        stats = {}
+        for name, timer in self.phases.items():
+            share = timer.total_ns / total * 100 if total else 0
+            stats[name] = {
+                'Llamadas': timer.count,
+                'Promedio': f"{timer.average_ns() / 1000:.1f} us",
+                'p50': f"<{timer.percentile(0.50) / 1000:.1f} us",
+                'p99': f"<{timer.percentile(0.99) / 1000:.1f} us",
+                'Máximo': f"{timer.max_ns / 1000:.1f} us",
+                '% Tick': f"{share:.1f}%"
+            }
+        return stats
+
+    def get_summary(self):
+        elapsed = (time.perf_counter_ns() - self.started_ns) / 1e9
+        return {
+            'Ticks': self.ticks,
+            'Ticks/s (reciente)': f"{self.get_tick_rate():.1f}",
+            'Ticks/s (total)': f"{self.ticks / elapsed:.1f}" if elapsed else "0.0",
+            'Captura Activa': 'Sí' if self.capture_ticks_left or self.capture_request else 'No'
+        }
+
+    def reset(self):
+        self.phases = {name: PhaseTimer(name) for name in PHASES}
+        self.ticks = 0
+        self.started_ns = time.perf_counter_ns()
+        self.tick_times.clear()
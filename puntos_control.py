@@ -0,0 +1,219 @@
+import gzip
+import itertools
+import os
+import pickle
+import random
+
+from Proyecto_Final_SO.nucleo_procesos import Process
+
+
+# Subir con cada cambio del estado serializado (atributos nuevos del
+# controlador, planificador, recursos, procesos o Productor-Consumidor)
+CHECKPOINT_VERSION = 7
+
+# Estado del controlador que forma parte de la simulación (no hilos, GUI ni hooks)
+CONTROLLER_STATE = (
+    'scheduler', 'resource_manager', 'generator',
+    'producer_consumer', 'pc_enabled',
+    'pending_arrivals', 'arrival_model', 'io', 'realtime',
+    'prob_create_process', 'prob_block_process', 'prob_unblock_process',
+    'prob_io_bound', 'prob_parallel',
+    'time_slice'
+)
+
+# Claves propias del punto de control, además de CONTROLLER_STATE
+_EXTRA_STATE = ('arrival_seq', 'next_pid', 'random_state')
+
+_RANDOM = "random"
+_CONTROLLER = "controller"
+
+
+def _open_checkpoint(path, mode, compressed=None):
+    # .gz se comprime de forma transparente
+    if compressed is None:
+        compressed = str(path).endswith(".gz")
+    if compressed:
+        return gzip.open(path, mode + "b")
+    return open(path, mode + "b")
+
+
+class _CheckpointPickler(pickle.Pickler):
+    # Los modelos de llegada guardan el módulo random como generador por
+    # defecto y los hooks de terminación apuntan al controlador: ambos se
+    # guardan como referencias y se vuelven a enlazar al restaurar
+
+    def __init__(self, file, controller):
+        super().__init__(file, protocol=5)
+        self.controller = controller
+
+    def persistent_id(self, obj):
+        if obj is random:
+            return _RANDOM
+        if obj is self.controller:
+            return _CONTROLLER
+        return None
+
+
+class _CheckpointUnpickler(pickle.Unpickler):
+
+    def __init__(self, file, controller):
+        super().__init__(file)
+        self.controller = controller
+
+    def persistent_load(self, pid):
+        if pid == _RANDOM:
+            return random
+        if pid == _CONTROLLER:
+            return self.controller
+        raise pickle.UnpicklingError(f"Referencia desconocida en el punto de control: {pid}")
+
+
+def _capture(controller):
+    scheduler = controller.scheduler
+
+    # La secuencia de llegadas no se serializa directo: se toma su siguiente
+    # valor y se reinicia el contador en el mismo punto
+    next_seq = next(controller._arrival_seq)
+    controller._arrival_seq = itertools.count(next_seq)
+
+    state = {name: getattr(controller, name) for name in CONTROLLER_STATE}
+    state.update({
+        'version': CHECKPOINT_VERSION,
+        'arrival_seq': next_seq,
+        'next_pid': Process._id_counter,
+        'random_state': random.getstate()
+    })
+
+    # Grabadores con archivos abiertos no son restaurables
+    writer = controller.results_writer
+    transient = {
+        'trace_recorder': scheduler.trace_recorder,
+        'termination_hooks': scheduler.termination_hooks
+    }
+    scheduler.trace_recorder = None
+    scheduler.termination_hooks = [hook for hook in scheduler.termination_hooks
+                                   if not (writer and hook == writer.write)]
+    return state, transient
+
+
+def write_checkpoint(controller, path):
+    state, transient = _capture(controller)
+    scheduler = controller.scheduler
+
+    # Escritura atómica: un corte a medias nunca deja un punto de control corrupto
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with _open_checkpoint(tmp, "w", str(path).endswith(".gz")) as f:
+            _CheckpointPickler(f, controller).dump(state)
+        os.replace(tmp, path)
+    finally:
+        scheduler.trace_recorder = transient['trace_recorder']
+        scheduler.termination_hooks = transient['termination_hooks']
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+    return os.path.getsize(path)
+
+
+def _missing_attributes(state, controller):
+    # Red de seguridad si el estado cambió sin subir la versión: los objetos
+    # guardados deben tener todos los atributos de los actuales
+    pairs = [(state['scheduler'], controller.scheduler),
+             (state['resource_manager'], controller.resource_manager)]
+
+    scheduler = state['scheduler']
+    saved = next(itertools.chain(scheduler.ready_queue, getattr(scheduler, 'waiting', {}).values(),
+                                 filter(None, scheduler.running)), None)
+    if saved is not None:
+        next_pid = Process._id_counter
+        pairs.append((saved, Process("", 1, priority=1)))
+        Process._id_counter = next_pid
+
+    return sorted(f"{type(current).__name__}.{name}" for loaded, current in pairs
+                  for name in set(vars(current)) - set(vars(loaded)))
+
+
+def read_checkpoint(controller, path):
+    with _open_checkpoint(path, "r") as f:
+        state = _CheckpointUnpickler(f, controller).load()
+
+    if not isinstance(state, dict):
+        raise ValueError("El archivo no es un punto de control del simulador")
+    if state.get('version') != CHECKPOINT_VERSION:
+        raise ValueError(f"Versión de punto de control no soportada: {state.get('version')}")
+
+    # Todo se valida antes de asignar: nunca queda un controlador a medias
+    missing = [name for name in CONTROLLER_STATE + _EXTRA_STATE if name not in state]
+    if missing:
+        raise ValueError(f"Punto de control incompleto, faltan: {', '.join(missing)}")
+
+    missing = _missing_attributes(state, controller)
+    if missing:
+        raise ValueError(f"Punto de control incompatible, faltan atributos: {', '.join(missing)}")
+
+    for name in CONTROLLER_STATE:
+        setattr(controller, name, state[name])
+    controller._arrival_seq = itertools.count(state['arrival_seq'])
+
+    Process._id_counter = state['next_pid']
+    random.setstate(state['random_state'])
+    return state
+
+
+class PeriodicCheckpointer:
+    # Hook de tick: cada `every_ticks` ticks guarda un punto de control.
+    # Con fork el hijo serializa una copia (copy-on-write) y el ciclo de
+    # simulación solo paga el costo del fork
+
+    def __init__(self, controller, path, every_ticks=1000, use_fork=True):
+        self.controller = controller
+        self.path = path
+        self.every_ticks = max(1, every_ticks)
+        self.use_fork = use_fork and hasattr(os, "fork")
+
+        self.ticks = 0
+        self.checkpoints_written = 0
+        self.checkpoints_skipped = 0
+        self.child_pid = None
+
+    def __call__(self):
+        self.ticks += 1
+        if self.ticks % self.every_ticks:
+            return
+
+        if not self.use_fork:
+            write_checkpoint(self.controller, self.path)
+            self.checkpoints_written += 1
+            return
+
+        # Un solo hijo a la vez: si el anterior sigue escribiendo, se omite este
+        if self._child_running():
+            self.checkpoints_skipped += 1
+            return
+
+        pid = os.fork()
+        if pid == 0:
+            status = 0
+            try:
+                write_checkpoint(self.controller, self.path)
+            except BaseException:
+                status = 1
+            finally:
+                os._exit(status)
+
+        self.child_pid = pid
+        self.checkpoints_written += 1
+
+    def _child_running(self):
+        if self.child_pid is None:
+            return False
+        pid, _ = os.waitpid(self.child_pid, os.WNOHANG)
+        if pid == 0:
+            return True
+        self.child_pid = None
+        return False
+
+    def wait(self):
+        if self.child_pid is not None:
+            os.waitpid(self.child_pid, 0)
+            self.child_pid = None
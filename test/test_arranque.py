@@ -0,0 +1,25 @@
+import os
+import subprocess
+import sys
+
+from Proyecto_Final_SO.benchmarks.arranque import CORE_MODULES, DEFAULT_BUDGET_MS, measure_import, _package_root
+
+
+def test_core_import_within_budget():
+    result = measure_import(CORE_MODULES, runs=3)
+
+    assert result['import_ms'] <= DEFAULT_BUDGET_MS
+    assert result['lazy_loaded'] == []
+    assert result['files_created'] == []
+
+
+def test_config_does_not_import_the_core():
+    # config.py solo necesita los nombres de constantes.py
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [_package_root(), env.get('PYTHONPATH')]))
+    probe = ("import sys, Proyecto_Final_SO.config; "
+             "print(sorted(m for m in sys.modules if m.startswith('Proyecto_Final_SO.')))")
+    output = subprocess.run([sys.executable, '-c', probe], env=env, capture_output=True,
+                            text=True, check=True).stdout
+
+    assert output.strip() == "['Proyecto_Final_SO.config', 'Proyecto_Final_SO.constantes']"
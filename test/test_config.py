@@ -0,0 +1,76 @@
+import pytest
+
+from Proyecto_Final_SO.config import Config, ENV_LAYER, FILE_LAYER, OVERRIDE_LAYER, SCHEMA_LAYER
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "sim.ini"
+    path.write_text("[Resources]\nnum_cpus = 4\ncore_speeds = 1.0, 1.0, 0.5, 0.5\n"
+                    "[Scheduling]\nalgorithm = Prioridad\ntime_quantum = 50\n", encoding='utf-8')
+    return str(path)
+
+
+def test_layers_in_precedence_order(config_file):
+    config = Config(config_file, overrides={'time_quantum': 200},
+                    env={'SIMULADOR_ALGORITHM': 'CFS', 'SIMULADOR_TIME_QUANTUM': '75'})
+
+    assert config.num_cpus == 4
+    assert config.scheduling_algorithm == 'CFS'
+    assert config.time_quantum == 200
+    assert config.total_memory == 4096
+    assert config.sources['num_cpus'] == FILE_LAYER
+    assert config.sources['scheduling_algorithm'] == ENV_LAYER
+    assert config.sources['time_quantum'] == OVERRIDE_LAYER
+    assert config.sources['total_memory'] == SCHEMA_LAYER
+
+
+def test_num_cpus_override_resets_file_speeds(config_file):
+    config = Config(config_file, overrides={'num_cpus': 2}, env={})
+
+    assert config.core_speeds == [1.0, 1.0]
+
+
+def test_copy_revalidates_and_resets_speeds(config_file):
+    base = Config(config_file, env={})
+    copy = base.copy(num_cpus=2, time_quantum=10)
+
+    assert copy.core_speeds == [1.0, 1.0]
+    assert copy.time_quantum == 10
+    assert base.num_cpus == 4 and base.time_quantum == 50
+    with pytest.raises(ValueError):
+        base.copy(algorithm='FIFO')
+
+
+def test_from_dict_ignores_file_and_environment(monkeypatch):
+    monkeypatch.setenv('SIMULADOR_NUM_CPUS', '8')
+    config = Config.from_dict({'algorithm': 'EDF'})
+
+    assert config.num_cpus == 1
+    assert config.scheduling_algorithm == 'EDF'
+    assert config.config_file is None
+
+
+def test_missing_file_from_environment_is_an_error(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        Config(env={'SIMULADOR_CONFIG': str(tmp_path / "no_existe.ini")})
+
+
+@pytest.mark.parametrize('values', [
+    {'num_cpus': 0},
+    {'governor': 'turbo'},
+    {'num_cpus': 2, 'core_speeds': [1.0]},
+    {'min_burst_time': 100, 'max_burst_time': 50},
+    {'unknown_option': 1}
+])
+def test_invalid_values_are_rejected(values):
+    with pytest.raises(ValueError):
+        Config.from_dict(values)
+
+
+def test_save_round_trip(tmp_path):
+    config = Config.from_dict({'num_cpus': 2, 'core_speeds': [1.0, 0.5], 'governor': 'ondemand'})
+    path = tmp_path / "saved.ini"
+    config.save(str(path))
+
+    assert Config(str(path), env={}).to_dict() == config.to_dict()
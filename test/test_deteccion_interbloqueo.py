@@ -0,0 +1,81 @@
+from Proyecto_Final_SO.administrador_recursos import ResourceManager
+from Proyecto_Final_SO.Comunicacion_Sincronizacion.mutex import Mutex
+from Proyecto_Final_SO.config import Config
+from Proyecto_Final_SO.nucleo_procesos import Process, Scheduler, SimulationController
+
+
+def _controller(recover):
+    controller = SimulationController(Scheduler(), ResourceManager(num_cpus=1), Config.from_dict({}))
+    controller.enable_deadlock_detection(recover=recover)
+    return controller
+
+
+def _two_mutex_cycle(scheduler):
+    first, second = Process("A", 100, 1, 50), Process("B", 200, 1, 50)
+    scheduler.add_process(first)
+    scheduler.add_process(second)
+    m1, m2 = Mutex("m1"), Mutex("m2")
+    assert m1.acquire(first, scheduler) and m2.acquire(second, scheduler)
+    assert not m2.acquire(first, scheduler)
+    assert not m1.acquire(second, scheduler)
+    return first, second, m1, m2
+
+
+def test_report_mode_detects_the_cycle():
+    controller = _controller(recover=False)
+    first, second, m1, m2 = _two_mutex_cycle(controller.scheduler)
+
+    detector = controller.scheduler.deadlock_detector
+    assert len(detector.deadlocks) == 1
+    assert detector.victims == []
+    assert first.state == second.state == Process.WAITING
+
+
+def test_recovery_releases_the_victims_mutexes():
+    controller = _controller(recover=True)
+    scheduler = controller.scheduler
+    first, second, m1, m2 = _two_mutex_cycle(scheduler)
+
+    detector = scheduler.deadlock_detector
+    assert len(detector.victims) == 1
+    victim, survivor = (first, second) if detector.victims[0] == first.pid else (second, first)
+    assert victim.state == Process.TERMINATED
+
+    # El sobreviviente recibe el mutex que retenía la víctima y deja de esperar
+    assert survivor.state != Process.WAITING
+    assert m1.owner is survivor and m2.owner is survivor
+    assert victim.pid not in detector.held and victim.pid not in detector.requests
+
+
+def test_terminated_process_leaves_the_wait_for_graph():
+    controller = _controller(recover=False)
+    scheduler = controller.scheduler
+    owner, waiter = Process("A", 100, 1, 50), Process("B", 100, 1, 50)
+    scheduler.add_process(owner)
+    scheduler.add_process(waiter)
+    mutex = Mutex("m")
+    mutex.acquire(owner, scheduler)
+    mutex.acquire(waiter, scheduler)
+
+    scheduler.terminate_process(waiter.pid)
+
+    assert waiter.pid not in scheduler.deadlock_detector.requests
+    assert mutex.get_waiting_count() == 0
+
+
+def test_memory_waiter_terminated_does_not_keep_memory():
+    scheduler = Scheduler()
+    manager = ResourceManager(num_cpus=1, total_memory=1000)
+    processes = [Process(name, 100, 1, 100) for name in "ABC"]
+    for process in processes:
+        scheduler.add_process(process)
+        manager.request_memory(process)
+    first, waiter, _ = processes
+
+    assert not manager.request_additional_memory(waiter, 800, scheduler)[0]
+    scheduler.terminate_process(waiter.pid)
+    manager.release_resources(waiter)
+    manager.release_memory(first)
+
+    assert waiter.pid not in manager.memory_allocations
+    assert manager.available_memory == 900
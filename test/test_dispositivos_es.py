@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from Proyecto_Final_SO.dispositivos_es import FCFS, SCAN, SSTF, DiskDevice, IORequest
+
+
+# Ejemplo clásico: cabezal en 53 y cola 98, 183, 37, 122, 14, 124, 65, 67
+QUEUE = [98, 183, 37, 122, 14, 124, 65, 67]
+
+
+def _serve(policy):
+    disk = DiskDevice("Disco", policy=policy, rng=random.Random(0))
+    disk.head = 53
+    for cylinder in QUEUE:
+        disk.submit(IORequest(None, 0, cylinder))
+
+    order = []
+    now = 0
+    while True:
+        finish = disk.start_next(now)
+        if finish is None:
+            break
+        order.append(disk.complete(finish).cylinder)
+        now = finish
+    return order, disk.head_movement
+
+
+@pytest.mark.parametrize('policy, order, movement', [
+    (FCFS, QUEUE, 640),
+    (SSTF, [65, 67, 37, 14, 98, 122, 124, 183], 236),
+    # SCAN en variante LOOK: sube hasta la última solicitud y luego baja
+    (SCAN, [65, 67, 98, 122, 124, 183, 37, 14], 299)
+])
+def test_disk_scheduling_order(policy, order, movement):
+    assert _serve(policy) == (order, movement)
+
+
+def test_cancelled_request_is_skipped():
+    disk = DiskDevice("Disco", policy=SSTF, rng=random.Random(0))
+    near, far = IORequest(None, 0, 10), IORequest(None, 0, 150)
+    disk.submit(near)
+    disk.submit(far)
+    disk.cancel(near)
+
+    disk.start_next(0)
+    assert disk.current is far
+    assert disk.waiting == 0
+
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError):
+        DiskDevice("Disco", policy="C-LOOK")
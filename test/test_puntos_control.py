@@ -0,0 +1,55 @@
+import random
+
+from Proyecto_Final_SO.administrador_recursos import ResourceManager
+from Proyecto_Final_SO.config import Config
+from Proyecto_Final_SO.nucleo_procesos import Process, Scheduler, SimulationController
+
+
+def _controller(algorithm=Scheduler.SJF):
+    config = Config.from_dict({'num_cpus': 2, 'algorithm': algorithm})
+    scheduler = Scheduler(algorithm, core_speeds=config.core_speeds)
+    manager = ResourceManager(num_cpus=2, core_speeds=config.core_speeds)
+    return SimulationController(scheduler, manager, config)
+
+
+def _snapshot(controller):
+    scheduler = controller.scheduler
+    return (scheduler.get_stats(),
+            [(p.pid, p.name, p.finish_time) for p in scheduler.terminated_processes],
+            sorted(p.pid for p in scheduler.ready_queue),
+            controller.resource_manager.available_memory)
+
+
+def test_resume_is_identical_to_an_uninterrupted_run(tmp_path):
+    random.seed(7)
+    Process.reset_counter()
+    controller = _controller()
+    controller.start_producer_consumer()
+    for _ in range(400):
+        controller._tick()
+
+    path = str(tmp_path / "sim.ckpt.gz")
+    ok, _ = controller.save_checkpoint(path)
+    assert ok
+    for _ in range(400):
+        controller._tick()
+    expected = _snapshot(controller)
+
+    # Otro estado aleatorio y otro contador de pids: el punto de control los restaura
+    random.seed(12345)
+    Process.reset_counter()
+    restored = _controller()
+    ok, _ = restored.load_checkpoint(path)
+    assert ok
+    for _ in range(400):
+        restored._tick()
+
+    assert _snapshot(restored) == expected
+
+
+def test_rejects_a_file_that_is_not_a_checkpoint(tmp_path):
+    path = tmp_path / "basura.ckpt"
+    path.write_bytes(b"no es un punto de control")
+
+    ok, _ = _controller().load_checkpoint(str(path))
+    assert not ok
@@ -0,0 +1,86 @@
+import pytest
+
+from Proyecto_Final_SO.Comunicacion_Sincronizacion.condicion import Condition
+from Proyecto_Final_SO.Comunicacion_Sincronizacion.lectores_escritores import RWLock
+from Proyecto_Final_SO.Comunicacion_Sincronizacion.mutex import Mutex
+from Proyecto_Final_SO.Comunicacion_Sincronizacion.semaforo import Semaphore
+from Proyecto_Final_SO.nucleo_procesos import Process, Scheduler
+
+
+@pytest.fixture
+def scheduler():
+    return Scheduler()
+
+
+def _processes(scheduler, n):
+    processes = [Process(f"P{i}", 100, 1, 10) for i in range(n)]
+    for process in processes:
+        scheduler.add_process(process)
+    return processes
+
+
+def test_semaphore_skips_terminated_waiter(scheduler):
+    holder, dead, alive = _processes(scheduler, 3)
+    semaphore = Semaphore("s", 1)
+    semaphore.acquire(holder, scheduler)
+    semaphore.acquire(dead, scheduler)
+    semaphore.acquire(alive, scheduler)
+
+    scheduler.terminate_process(dead.pid)
+    assert semaphore.get_waiting_count() == 1
+
+    semaphore.release(holder, scheduler)
+    assert alive.state == Process.READY
+    assert list(semaphore.holders) == [alive.pid]
+
+
+def test_mutex_skips_terminated_waiter(scheduler):
+    owner, dead, alive = _processes(scheduler, 3)
+    mutex = Mutex("m")
+    mutex.acquire(owner, scheduler)
+    mutex.acquire(dead, scheduler)
+    mutex.acquire(alive, scheduler)
+
+    scheduler.terminate_process(dead.pid)
+    mutex.release(owner, scheduler)
+
+    assert mutex.owner is alive
+
+
+def test_condition_does_not_hand_the_mutex_to_a_terminated_waiter(scheduler):
+    dead, alive = _processes(scheduler, 2)
+    mutex = Mutex("m")
+    condition = Condition("c", mutex)
+    for process in (dead, alive):
+        mutex.acquire(process, scheduler)
+        condition.wait(process, scheduler)
+
+    scheduler.terminate_process(dead.pid)
+    woken = condition.notify(scheduler)
+
+    assert woken == [alive]
+    assert mutex.owner is alive
+    assert condition.get_waiting_count() == 0
+
+
+def test_rwlock_wakes_readers_when_the_waiting_writer_terminates(scheduler):
+    reader, writer, late_reader = _processes(scheduler, 3)
+    lock = RWLock("rw", writer_preference=True)
+    lock.acquire_read(reader, scheduler)
+    lock.acquire_write(writer, scheduler)
+    assert not lock.acquire_read(late_reader, scheduler)
+
+    scheduler.terminate_process(writer.pid)
+
+    assert late_reader.state == Process.READY
+    assert set(lock.readers) == {reader.pid, late_reader.pid}
+    assert lock.get_waiting_count() == 0
+
+
+def test_hook_is_registered_once_per_primitive(scheduler):
+    owner, *waiters = _processes(scheduler, 4)
+    semaphore = Semaphore("s", 0)
+    for process in waiters:
+        semaphore.acquire(process, scheduler)
+
+    assert scheduler.termination_hooks.count(semaphore.forget) == 1
@@ -0,0 +1,383 @@
+import heapq
+import math
+import random
+from array import array
+from dataclasses import dataclass
+from functools import reduce
+
+from Proyecto_Final_SO.nucleo_procesos import Process, Scheduler
+
+
+EDF = Scheduler.EDF
+RM = Scheduler.RM
+
+# Cota de hiperperiodo para la prueba de demanda de EDF con U = 1
+MAX_DEMAND_HORIZON = 10 ** 6
+
+
+@dataclass(frozen=True)
+class RealTimeStats:
+    policy: str
+    tasks: int
+    utilization: float
+    released: int
+    completed: int
+    missed: int
+    dropped: int
+    miss_rate: float
+    avg_lateness: float
+    lateness_p50: float
+    lateness_p95: float
+    lateness_p99: float
+    max_lateness: float
+    max_jitter: float
+
+    def display(self):
+        return {
+            'Política': self.policy,
+            'Tareas': self.tasks,
+            'Utilización': f"{self.utilization:.3f}",
+            'Trabajos Liberados': self.released,
+            'Trabajos Completados': self.completed,
+            'Plazos Incumplidos': self.missed,
+            'Trabajos Descartados': self.dropped,
+            'Tasa de Incumplimiento': f"{self.miss_rate * 100:.2f}%",
+            'Retraso Promedio': f"{self.avg_lateness:.2f} ms",
+            'Retraso p50/p95/p99': f"{self.lateness_p50:.1f} / {self.lateness_p95:.1f} / {self.lateness_p99:.1f} ms",
+            'Retraso Máximo': f"{self.max_lateness:.2f} ms",
+            'Jitter Máximo': f"{self.max_jitter:.2f} ms"
+        }
+
+
+class RealTimeTask:
+    # Tarea periódica (un trabajo cada `period` ms) o esporádica (separación
+    # mínima `period` más una demora aleatoria de hasta `slack` ms). Cada
+    # trabajo pide `wcet` ms de CPU y vence `deadline` ms después de liberarse
+
+    def __init__(self, name, wcet, period, deadline=None, sporadic=False, slack=None,
+                 phase=0, memory=50):
+        deadline = period if deadline is None else deadline
+        if wcet <= 0 or period <= 0:
+            raise ValueError("El WCET y el periodo deben ser positivos")
+        if not 0 < deadline <= period:
+            raise ValueError("El plazo debe estar entre 1 y el periodo")
+
+        self.name = name
+        self.wcet = wcet
+        self.period = period
+        self.deadline = deadline
+        self.sporadic = sporadic
+        self.slack = period // 2 if slack is None else slack
+        self.phase = phase
+        self.memory = memory
+
+        self.next_release = phase
+
+        # Estadísticas por tarea
+        self.released = 0
+        self.completed = 0
+        self.missed = 0
+        self.dropped = 0
+        self.min_response = None
+        self.max_response = 0
+        self.total_response = 0
+        self.min_start_delay = None
+        self.max_start_delay = 0
+
+    @property
+    def utilization(self):
+        return self.wcet / self.period
+
+    @property
+    def density(self):
+        return self.wcet / self.deadline
+
+    @property
+    def response_jitter(self):
+        # Variación del tiempo de respuesta entre trabajos de la tarea
+        return self.max_response - self.min_response if self.min_response is not None else 0
+
+    @property
+    def start_jitter(self):
+        return self.max_start_delay - self.min_start_delay if self.min_start_delay is not None else 0
+
+    def get_statistics(self):
+        done = self.completed
+        return {
+            'Tipo': "Esporádica" if self.sporadic else "Periódica",
+            'C/T/D': f"{self.wcet}/{self.period}/{self.deadline} ms",
+            'Utilización': f"{self.utilization:.3f}",
+            'Liberados': self.released,
+            'Completados': done,
+            'Plazos Incumplidos': self.missed,
+            'Descartados': self.dropped,
+            'Respuesta Promedio': f"{self.total_response / done:.2f} ms" if done else "0.00 ms",
+            'Respuesta Máxima': f"{self.max_response} ms",
+            'Jitter de Respuesta': f"{self.response_jitter} ms",
+            'Jitter de Inicio': f"{self.start_jitter} ms"
+        }
+
+    def __str__(self):
+        return f"T({self.name})"
+
+
+# Pruebas de planificabilidad
+
+def liu_layland_bound(n):
+    # RM con plazos = periodos: U ≤ n(2^(1/n) - 1) es suficiente
+    return n * (2 ** (1 / n) - 1) if n else 1.0
+
+
+def response_times(tasks):
+    # Análisis de tiempo de respuesta (RM, un procesador): R = C + Σ ⌈R/Tj⌉·Cj
+    # sobre las tareas de menor periodo; None si R supera el plazo
+    ordered = sorted(tasks, key=lambda task: task.period)
+    result = {}
+    for index, task in enumerate(ordered):
+        higher = ordered[:index]
+        response = task.wcet
+        while response <= task.deadline:
+            demand = task.wcet + sum(math.ceil(response / other.period) * other.wcet for other in higher)
+            if demand == response:
+                break
+            response = demand
+        result[task.name] = response if response <= task.deadline else None
+    return result
+
+
+def _demand_bound_ok(tasks, utilization):
+    # EDF con plazos restringidos: dbf(L) = Σ (⌊(L - D)/T⌋ + 1)·C ≤ L en cada
+    # plazo absoluto hasta la cota L* (o el hiperperiodo si U = 1). L* crece
+    # sin límite cuando U se acerca a 1: se revisa solo hasta
+    # MAX_DEMAND_HORIZON, recorriendo los plazos en orden sin materializarlos.
+    # Devuelve False si algún plazo se excede y None si la cota quedó
+    # recortada sin encontrar fallas (no demostrado)
+    longest = max(task.deadline for task in tasks)
+    if utilization < 1:
+        horizon = max(longest, sum((task.period - task.deadline) * task.utilization for task in tasks)
+                      / (1 - utilization))
+    else:
+        hyperperiod = reduce(lambda a, b: a * b // math.gcd(a, b), (task.period for task in tasks))
+        horizon = hyperperiod + longest
+    clipped = horizon > MAX_DEMAND_HORIZON
+    horizon = int(min(horizon, MAX_DEMAND_HORIZON))
+
+    previous = None
+    for point in heapq.merge(*(range(task.deadline, horizon + 1, task.period) for task in tasks)):
+        if point == previous:
+            continue
+        previous = point
+        demand = sum(((point - task.deadline) // task.period + 1) * task.wcet
+                     for task in tasks if point >= task.deadline)
+        if demand > point:
+            return False
+    return None if clipped else True
+
+
+def _uniform_lambda(speeds):
+    # λ = max_i Σ_{j>i} s_j / s_i con las velocidades en orden decreciente
+    return max(sum(speeds[i + 1:]) / speeds[i] for i in range(len(speeds)))
+
+
+def schedulability_test(tasks, policy, cpus=1, speeds=None):
+    # Devuelve (planificable, explicación). Con varios CPUs se usan cotas
+    # suficientes de planificación global (GFB para EDF, RM-US para RM), que
+    # suponen núcleos idénticos. `speeds` (una velocidad por núcleo) reemplaza
+    # a `cpus`: con velocidades iguales se escalan los WCET; con velocidades
+    # distintas EDF usa la cota de multiprocesadores uniformes (S ≥ Δ + λ·δmax)
+    # y RM no tiene prueba de admisión
+    tasks = list(tasks)
+    if not tasks:
+        return (True, "Sin tareas de tiempo real")
+
+    if speeds:
+        speeds = sorted(speeds, reverse=True)
+        cpus = len(speeds)
+        if speeds[0] != speeds[-1]:
+            if policy != EDF:
+                return (False, "Sin prueba de RM global para núcleos de distinta velocidad (use EDF)")
+            capacity = sum(speeds)
+            density = sum(task.density for task in tasks)
+            bound = capacity - _uniform_lambda(speeds) * max(task.density for task in tasks)
+            if density <= bound:
+                return (True, f"Densidad {density:.3f} ≤ {bound:.3f} (EDF uniforme, capacidad {capacity:g})")
+            return (False, f"Densidad {density:.3f} > {bound:.3f} (EDF uniforme, capacidad {capacity:g})")
+        if speeds[0] != 1:
+            # Núcleos idénticos a velocidad s: cada trabajo tarda ⌈WCET/s⌉ ms
+            # (el reloj avanza en ms enteros)
+            tasks = [RealTimeTask(task.name, math.ceil(task.wcet / speeds[0]), task.period,
+                                  task.deadline)
+                     for task in tasks]
+
+    utilization = sum(task.utilization for task in tasks)
+    density = sum(task.density for task in tasks)
+    implicit = all(task.deadline == task.period for task in tasks)
+
+    if cpus > 1:
+        max_density = max(task.density for task in tasks)
+        if policy == EDF:
+            bound = cpus - (cpus - 1) * max_density
+            if density <= bound:
+                return (True, f"Densidad {density:.3f} ≤ {bound:.3f} (GFB, {cpus} CPUs)")
+            return (False, f"Densidad {density:.3f} > {bound:.3f} (GFB, {cpus} CPUs)")
+
+        bound = cpus * cpus / (3 * cpus - 2)
+        if density <= bound and max_density <= cpus / (3 * cpus - 2):
+            return (True, f"Densidad {density:.3f} ≤ {bound:.3f} (RM global, {cpus} CPUs)")
+        return (False, f"No se garantiza RM global en {cpus} CPUs (densidad {density:.3f}, cota {bound:.3f})")
+
+    if policy == EDF:
+        if utilization > 1:
+            return (False, f"U = {utilization:.3f} > 1")
+        if implicit:
+            return (True, f"U = {utilization:.3f} ≤ 1 (EDF)")
+        demand_ok = _demand_bound_ok(tasks, utilization)
+        if demand_ok:
+            return (True, f"U = {utilization:.3f}, demanda acotada en cada plazo (EDF)")
+        if demand_ok is None:
+            return (False, f"U = {utilization:.3f}: la demanda no se pudo verificar más allá de "
+                           f"{MAX_DEMAND_HORIZON} ms (no demostrado)")
+        return (False, "La demanda de procesador excede el tiempo disponible antes de algún plazo")
+
+    bound = liu_layland_bound(len(tasks))
+    if implicit and utilization <= bound:
+        return (True, f"U = {utilization:.3f} ≤ {bound:.3f} (Liu & Layland)")
+
+    responses = response_times(tasks)
+    failed = [name for name, response in responses.items() if response is None]
+    if failed:
+        return (False, f"Tiempo de respuesta mayor al plazo: {', '.join(failed)}")
+    worst = max(responses.values())
+    return (True, f"U = {utilization:.3f}; tiempos de respuesta dentro del plazo (peor R = {worst} ms)")
+
+
+class RealTimeSystem:
+    # Libera los trabajos de las tareas como procesos con plazo absoluto y
+    # contabiliza plazos incumplidos, retraso (fin - plazo) y jitter
+
+    def __init__(self, controller, rng=None):
+        self.controller = controller
+        self.scheduler = controller.scheduler
+        self.rng = rng or random
+        self.tasks = {}
+        self.jobs = {}  # pid -> tarea
+
+        self.lateness = array('d')
+        self.released = 0
+        self.completed = 0
+        self.missed = 0
+        self.dropped = 0
+
+        self.scheduler.add_termination_hook(self.on_terminated)
+
+    @property
+    def policy(self):
+        return self.scheduler.algorithm
+
+    def add_task(self, task, force=False):
+        if task.name in self.tasks:
+            return (False, f"La tarea {task.name} ya existe")
+
+        # Prueba de planificabilidad antes de admitir la tarea, con la velocidad
+        # que el gobernador garantiza a cada núcleo (powersave: frecuencia mínima)
+        speeds = self.controller.resource_manager.get_guaranteed_cpu_speeds()
+        ok, reason = schedulability_test(list(self.tasks.values()) + [task], self.policy,
+                                         speeds=speeds)
+        if not ok and not force:
+            return (False, f"Tarea {task.name} rechazada: {reason}")
+
+        task.next_release = self.scheduler.current_time + task.phase
+        self.tasks[task.name] = task
+        return (True, f"Tarea {task.name} admitida: {reason}")
+
+    def remove_task(self, name):
+        task = self.tasks.pop(name, None)
+        if not task:
+            return (False, f"No existe la tarea {name}")
+        return (True, f"Tarea {name} eliminada")
+
+    def advance(self, now):
+        for task in self.tasks.values():
+            while task.next_release <= now:
+                self._release(task, task.next_release)
+                task.next_release += task.period
+                if task.sporadic and task.slack:
+                    task.next_release += self.rng.randint(0, task.slack)
+
+    def _release(self, task, release):
+        task.released += 1
+        self.released += 1
+
+        process = Process(f"{task.name}#{task.released}", task.wcet, 1, task.memory,
+                          deadline=release + task.deadline, period=task.period)
+        if self.controller._admit_process(process, arrival_time=release):
+            self.jobs[process.pid] = task
+        else:
+            # Sin memoria para el trabajo: cuenta como plazo perdido
+            task.dropped += 1
+            self.dropped += 1
+
+    def next_release(self):
+        return min((task.next_release for task in self.tasks.values()), default=None)
+
+    def on_terminated(self, process):
+        task = self.jobs.pop(process.pid, None)
+        if task is None:
+            return
+
+        if process.remaining_time > 0:
+            # Terminado a la fuerza antes de completar su trabajo
+            task.dropped += 1
+            self.dropped += 1
+            return
+
+        lateness = process.finish_time - process.deadline
+        response = process.finish_time - process.arrival_time
+        start_delay = process.start_time - process.arrival_time
+
+        self.completed += 1
+        self.lateness.append(lateness)
+        task.completed += 1
+        task.total_response += response
+        if lateness > 0:
+            self.missed += 1
+            task.missed += 1
+
+        if task.min_response is None or response < task.min_response:
+            task.min_response = response
+        task.max_response = max(task.max_response, response)
+        if task.min_start_delay is None or start_delay < task.min_start_delay:
+            task.min_start_delay = start_delay
+        task.max_start_delay = max(task.max_start_delay, start_delay)
+
+    def get_stats(self):
+        samples = sorted(self.lateness)
+
+        def percentile(p):
+            if not samples:
+                return 0.0
+            return samples[min(len(samples) - 1, max(0, math.ceil(p / 100 * len(samples)) - 1))]
+
+        finished = self.completed + self.dropped
+        return RealTimeStats(
+            policy=self.policy,
+            tasks=len(self.tasks),
+            utilization=sum(task.utilization for task in self.tasks.values()),
+            released=self.released,
+            completed=self.completed,
+            missed=self.missed,
+            dropped=self.dropped,
+            miss_rate=(self.missed + self.dropped) / finished if finished else 0.0,
+            avg_lateness=sum(samples) / len(samples) if samples else 0.0,
+            lateness_p50=percentile(50),
+            lateness_p95=percentile(95),
+            lateness_p99=percentile(99),
+            max_lateness=samples[-1] if samples else 0.0,
+            max_jitter=max((task.response_jitter for task in self.tasks.values()), default=0)
+        )
+
+    def get_statistics(self):
+        return {
+            'Resumen': self.get_stats().display(),
+            'Tareas': {name: task.get_statistics() for name, task in self.tasks.items()}
+        }
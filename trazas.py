@@ -0,0 +1,204 @@
+import gzip
+import json
+
+from Proyecto_Final_SO.nucleo_procesos import Process
+
+
+TRACE_VERSION = 1
+
+# Tipos de evento (claves cortas para que la traza sea compacta)
+ARRIVAL = "A"
+BLOCK = "B"
+UNBLOCK = "U"
+TERMINATE = "T"
+
+
+def _open_trace(path, mode):
+    # .gz se comprime de forma transparente
+    if str(path).endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class TraceRecorder:
+
+    def __init__(self, path, algorithm=None):
+        self.path = path
+        self.file = _open_trace(path, "w")
+        self.events_written = 0
+
+        self._write({'e': 'H', 'v': TRACE_VERSION, 'alg': algorithm})
+
+    def record_arrival(self, process, time):
+        event = {
+            't': time,
+            'e': ARRIVAL,
+            'pid': process.pid,
+            'n': process.name,
+            'b': process.burst_time,
+            'p': process.priority,
+            'm': process.memory_required
+        }
+        # Campos opcionales solo si difieren del valor por defecto
+        if process.bursts:
+            event['bs'] = list(process.bursts)
+        if process.width != 1:
+            event['w'] = process.width
+        if process.group is not None:
+            event['g'] = process.group
+        if process.deadline is not None:
+            event['dl'] = process.deadline
+        if process.period is not None:
+            event['pe'] = process.period
+        self._write(event)
+
+    def record_block(self, process, time, reason=None):
+        event = {'t': time, 'e': BLOCK, 'pid': process.pid}
+        if reason:
+            event['r'] = reason
+        self._write(event)
+
+    def record_unblock(self, process, time):
+        self._write({'t': time, 'e': UNBLOCK, 'pid': process.pid})
+
+    def record_terminate(self, process, time):
+        self._write({'t': time, 'e': TERMINATE, 'pid': process.pid})
+
+    def _write(self, event):
+        self.file.write(json.dumps(event, separators=(',', ':'), ensure_ascii=False))
+        self.file.write("\n")
+        self.events_written += 1
+
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+
+
+def read_trace(path):
+    # Generador: una línea a la vez, memoria constante sin importar el tamaño
+    with _open_trace(path, "r") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            event = json.loads(line)
+            if event.get('e') == 'H':
+                if event.get('v') != TRACE_VERSION:
+                    raise ValueError(f"Versión de traza no soportada: {event.get('v')}")
+                continue
+            yield event
+
+
+class TraceReplayer:
+
+    def __init__(self, scheduler, resource_manager, time_slice=10, keep_terminated=100,
+                 keep_events=100):
+        self.scheduler = scheduler
+        self.resource_manager = resource_manager
+        self.time_slice = time_slice
+
+        # Memoria constante en trazas largas: solo los últimos terminados y
+        # eventos de log quedan en memoria (None = sin límite)
+        self.keep_events = keep_events
+        if keep_terminated is not None:
+            scheduler.terminated_history = keep_terminated
+
+        # Correspondencia pid de la traza <-> proceso vivo (solo procesos activos)
+        self.live = {}
+        self.trace_pids = {}
+
+        # Estadísticas
+        self.events_replayed = 0
+        self.arrivals = 0
+        self.rejected = 0
+
+    def replay(self, path, drain=True):
+        return self.replay_events(read_trace(path), drain)
+
+    def replay_events(self, events, drain=True):
+        # events: cualquier iterable ordenado por 't' (se consume de forma perezosa)
+        for event in events:
+            self._advance_to(event['t'])
+            self._apply(event)
+            self._trim_logs()
+            self.events_replayed += 1
+
+        if drain:
+            self.run_until_idle()
+
+        return self.get_statistics()
+
+    def run_until_idle(self):
+        while self.scheduler.running_process or self.scheduler.ready_queue:
+            self._step()
+
+    def _advance_to(self, time):
+        while self.scheduler.current_time < time:
+            if not self._step():
+                # CPU ociosa: saltar directamente al siguiente evento
+                self.scheduler.advance_idle_time(time - self.scheduler.current_time)
+
+    def _step(self):
+        if not self.scheduler.schedule():
+            return False
+
+        for process in self.scheduler.execute_cores(self.time_slice):
+            self.resource_manager.release_resources(process)
+            self._forget(process)
+        self._trim_logs()
+        return True
+
+    def _trim_logs(self):
+        limit = self.keep_events
+        if limit is None:
+            return
+        for owner in (self.scheduler, self.resource_manager):
+            log = owner.event_log
+            if len(log) > 2 * limit + 1:
+                # Recorte amortizado, como el historial de terminados
+                del log[:len(log) - limit]
+
+    def _apply(self, event):
+        kind = event['e']
+
+        if kind == ARRIVAL:
+            process = Process(event['n'], event['b'], event['p'], event['m'],
+                              bursts=event.get('bs'), width=event.get('w', 1), group=event.get('g'),
+                              deadline=event.get('dl'), period=event.get('pe'))
+            success, _ = self.resource_manager.request_resources(process)
+            if not success:
+                self.rejected += 1
+                return
+            self.scheduler.add_process(process, arrival_time=event['t'])
+            self.live[event['pid']] = process
+            self.trace_pids[process.pid] = event['pid']
+            self.arrivals += 1
+            return
+
+        process = self.live.get(event['pid'])
+        if process is None or process.state == Process.TERMINATED:
+            return
+
+        if kind == BLOCK:
+            self.scheduler.block_process(process.pid, event.get('r', "Traza"))
+        elif kind == UNBLOCK:
+            self.scheduler.unblock_process(process.pid)
+        elif kind == TERMINATE:
+            self.resource_manager.release_resources(process)
+            self.scheduler.terminate_process(process.pid)
+            self._forget(process)
+
+    def _forget(self, process):
+        trace_pid = self.trace_pids.pop(process.pid, None)
+        if trace_pid is not None:
+            self.live.pop(trace_pid, None)
+
+    def get_statistics(self):
+        return {
+            'Eventos Reproducidos': self.events_replayed,
+            'Llegadas': self.arrivals,
+            'Rechazados': self.rejected,
+            'Procesos Vivos': len(self.live),
+            'Tiempo Final': f"{self.scheduler.current_time} ms"
+        }